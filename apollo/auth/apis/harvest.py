@@ -7,6 +7,7 @@ import attr
 
 #local
 from apollo.auth.base import AuthBase
+from apollo.request.paginator import PageNumber
 
 
 @attr.s
@@ -45,3 +46,11 @@ class Harvest(AuthBase):
             "Harvest-Account-Id": self.account_id,
             "User-Agent": self.user_agent,
         }
+
+    @property
+    def paginator(self):
+        """Harvest numbers its pages and returns ``total_pages``, see `pagination <https://help.getharvest.com/api-v2/introduction/overview/pagination/>`_.
+        The pages after the first are requested at once.
+
+        """
+        return PageNumber(param = "page", total_pages = "total_pages")
@@ -11,6 +11,7 @@ from attr.validators import instance_of
 
 #local
 from apollo.auth.base import AuthBase
+from apollo.request.paginator import Offset
 
 
 @attr.s
@@ -54,3 +55,14 @@ class Pipedrive(AuthBase):
         return {
             "api_token": self.api_key
         }
+
+    @property
+    def paginator(self,):
+        """Pipedrive pages by ``start`` offset and returns ``additional_data.pagination``, see `pagination <https://pipedrive.readme.io/docs/core-api-concepts-pagination>`_.
+
+        """
+        return Offset(
+            param = "start",
+            next_offset = "additional_data.pagination.next_start",
+            more = "additional_data.pagination.more_items_in_collection",
+        )
@@ -1,3 +1,10 @@
+#standard
+import hashlib
+import json
+from collections.abc import MutableMapping
+
+#local
+from apollo.builder.converters import Overlay
 from apollo.request.abstract import RequestABC
 
 
@@ -35,6 +42,12 @@ class AuthBase(RequestABC):
 
     def __rshift__(self, val):
 
+        #read-only mappings are overlaid rather than copied
+        if not isinstance(val.param, MutableMapping):
+            val.param = Overlay({}, val.param)
+        if not isinstance(val.header, MutableMapping):
+            val.header = Overlay({}, val.header)
+
         val.param.update(self.param)
         val.header.update(self.header)
         if self.auth:
@@ -67,3 +80,27 @@ class AuthBase(RequestABC):
 
         """
         return tuple()
+
+    @property
+    def paginator(self):
+        """How the API paginates, if it does. Pass it to :class:`~apollo.ApolloCB` as ``paginator`` to follow the pages.
+
+        :rtype: :class:`~apollo.request.paginator.Paginator`
+
+        """
+        return None
+
+    @property
+    def identity(self):
+        """Identifies the credentials, e.g. to charge calls to their :class:`~apollo.utils.Quota`. A hash of the class
+        and its ``header``, ``param`` and ``auth``, so the credentials themselves are not revealed.
+
+        :rtype: str
+
+        """
+        credentials = json.dumps(
+            [type(self).__name__, self.header, self.param, list(self.auth or ())],
+            sort_keys = True,
+            default = str,
+        )
+        return hashlib.sha256(credentials.encode()).hexdigest()[:16]
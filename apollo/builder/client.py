@@ -1,15 +1,14 @@
 # standard library
 import asyncio
-import itertools
 from time import sleep
 from pprint import pprint as p
-from concurrent.futures import FIRST_EXCEPTION
 import types
 import logging
+import signal
+from concurrent.futures import ProcessPoolExecutor
 
 # third party
 from aiohttp import ClientSession
-import async_timeout
 
 import attr
 from attr.validators import instance_of
@@ -18,10 +17,24 @@ from attr.validators import in_
 # local
 from apollo.utils import FilePattern
 from apollo.utils import RateLimit
+from apollo.utils import ConnectionPool
+from apollo.utils import Retry
+from apollo.utils import Stats
+from apollo.utils import PartitionedRateLimit
+from apollo.utils import ResponseCache
+from apollo.utils import Journal
+from apollo.utils import Quota
+from apollo.utils import Hedge
+from apollo.utils import Timeout
 from apollo.utils.helpers import HttpAcceptedTypes
+from apollo.utils.helpers import passthrough
+from apollo.utils.helpers import event_loop_policy
+from apollo.utils.helpers import run
 
 from apollo.request.api_request import APIRequest
+from apollo.request.api_request import CHUNK_SIZE
 from apollo.request.factory import RequestFactory
+from apollo.request.paginator import Paginator
 
 from apollo.storage.base import StorageBase
 
@@ -36,6 +49,9 @@ from apollo.auth.base import AuthBase
 from apollo.storage.base import StorageBase
 
 from apollo.builder.exceptions import WrongDataType
+from apollo.builder.exceptions import QuotaExceeded
+from apollo.builder.scheduler import WorkerPool
+from apollo.builder.scheduler import PartitionedWorkerPool
 from apollo.utils.helpers import zip_longest_ffill
 from apollo.utils.helpers import HttpAcceptedTypes
 
@@ -45,7 +61,24 @@ logging.basicConfig(format=LOGGER_FORMAT, datefmt='[%H:%M:%S]')
 log = logging.getLogger()
 log.setLevel(logging.INFO)
 
-FETCH_TIMEOUT = 10
+# the shared rate limit budgets of a sharded run, set in each worker process by _init_shard
+_SHARED_STATE = (None, None)
+
+def _init_shard(api_state, storage_state):
+    global _SHARED_STATE
+    _SHARED_STATE = (api_state, storage_state)
+
+def _run_shard(client, shard):
+    """Runs every ``client.processes``-th request, starting at ``shard``, in a worker process."""
+    processes = client.processes
+    # the parent emptied the journal if not resuming, so shards append to it
+    client = attr.evolve(client, processes = 1, resume = client.resume or client.journal is not None)
+    client._shared_state = _SHARED_STATE
+
+    requests = client._build_requests(shard = (shard, processes))
+    responses = run(client.add_requests(requests = requests), event_loop = client.event_loop)
+
+    return responses, client.stats
 
 @attr.s
 class ApolloCB:
@@ -189,7 +222,7 @@ class ApolloCB:
     :param api_auth: Class that inherits from AuthBase.
 
     :type zip_type: `zip <https://docs.python.org/3.3/library/functions.html#zip>`_-like function
-    :param zip_type: Default is :func:`~apollo.utils.helpers.zip_longest_ffill`.
+    :param zip_type: How the attributes are combined into requests. :func:`~apollo.utils.helpers.zip_product` makes a request for every combination of their elements. Default is :func:`~apollo.utils.helpers.zip_longest_ffill`.
 
     :type file_pattern: :class: `~apollo.utils.helpers.FilePattern`
     :param file_pattern: The FilePattern object that will create the file pattern, only used if storing data.
@@ -212,13 +245,58 @@ class ApolloCB:
     :type save: boolean
     :param save: Saves the :class:`~apollo.request.APIRequest` objects to memory for use after execution.
 
-    :type api_rate_limit: :class:`~apollo.utils.RateLimit`
-    :param api_rate_limit: Rate limiting for API calls.
+    :type api_rate_limit: :class:`~apollo.utils.RateLimit` or :class:`~apollo.utils.PartitionedRateLimit`
+    :param api_rate_limit: Rate limiting for API calls. A :class:`~apollo.utils.PartitionedRateLimit` limits each host, or other partition, separately.
 
     :type storage_rate_limit: :class:`~apollo.utils.RateLimit`
     :param storage_rate_limit: Rate limiting for storage.
 
+    :type connection_pool: :class:`~apollo.utils.ConnectionPool`
+    :param connection_pool: Connection limits, keep-alive and DNS caching of the session shared by every request in a run.
+
+    :type workers: int
+    :param workers: (Optional) The number of requests handled at one time, per partition when ``api_rate_limit`` is partitioned. Defaults to the ``api_rate_limit`` concurrency.
+
+    :type stream_to_storage: boolean
+    :param stream_to_storage: Set True to write response bodies to ``storage`` in chunks as they are read, instead of reading them into memory. The body is then not available on :class:`~apollo.request.Response`. See :meth:`~apollo.request.APIRequest.save_stream`.
+
+    :type chunk_size: int
+    :param chunk_size: The number of bytes read and written at a time when ``stream_to_storage`` is True.
+
+    :type retry: :class:`~apollo.utils.Retry`
+    :param retry: How failed requests are retried. Default is 3 attempts for connection errors, timeouts and 429/5xx statuses. Use ``Retry(attempts = 1)`` to disable retries.
+
+    :type cache: :class:`~apollo.utils.ResponseCache`
+    :param cache: (Optional) Stores responses with an ``ETag`` or ``Last-Modified`` header and makes the next requests for them conditional, serving ``304 Not Modified`` answers from the store.
+
+    :type dedupe: str
+    :param dedupe: (Optional) Saves calls for identical requests, by :attr:`~apollo.request.APIRequest.fingerprint`. ``'skip'`` drops requests identical to one already made. ``'coalesce'`` makes one call for identical requests in flight at the same time and shares its :class:`~apollo.request.Response`. Saved calls are counted in ``stats``.
+
+    :type journal: :class:`~apollo.utils.Journal`
+    :param journal: (Optional) Records each request once it is made and saved, with all its pages when paginated. Requests whose save failed are not recorded. On SIGTERM the run is stopped with :meth:`~apollo.ApolloCB.stop`, so the journal stays consistent.
 
+    :type resume: boolean
+    :param resume: Set True to skip the requests recorded in ``journal`` by a previous run. Otherwise the journal is emptied when the run starts.
+
+    :type processes: int
+    :param processes: (Optional) The number of processes :meth:`~apollo.ApolloCB.execute` splits the requests between, each with its own event loop, session and ``workers``. The ``api_rate_limit`` and ``storage_rate_limit`` budgets are shared by the processes; their concurrency applies to each process. Everything passed to ApolloCB must be picklable, so functions must be defined at module level rather than as lambdas. Default is 1.
+
+    :type paginator: :class:`~apollo.request.paginator.Paginator`
+    :param paginator: (Optional) Builds the requests for the next pages from each response. They are handled by the same workers and rate limits as the other requests. Presets are available on the auth classes, e.g. ``Harvest(...).paginator``.
+
+    :type quota: :class:`~apollo.utils.Quota`
+    :param quota: (Optional) Charges every call to the daily and monthly budget of the ``api_auth`` credentials. When the budget is spent the run is stopped, as with :meth:`~apollo.ApolloCB.stop`, or paused until it resets. Requests not made are counted in ``stats``. See ``remaining_quota``.
+
+    :type timeout: :class:`~apollo.utils.Timeout`
+    :param timeout: The connect, first byte and total timeouts of calls, for every host or per host, fixed or adapting to the observed latencies. Default is 10 seconds to connect, 10 seconds to the first byte and 60 seconds in total.
+
+    :type hedge: :class:`~apollo.utils.Hedge`
+    :param hedge: (Optional) Sends a duplicate of GET calls slower than the observed p95, or a set delay, keeps whichever answers first and cancels the other. At most a set fraction of the calls of a run are duplicated. Counted in ``stats``.
+
+    :type event_loop: str or `asyncio.AbstractEventLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html>`_
+    :param event_loop: (Optional) The event loop :meth:`~apollo.ApolloCB.execute` and :meth:`~apollo.ApolloCB.stream_sync` run on: ``'default'`` for the asyncio loop, ``'uvloop'`` for `uvloop <https://github.com/MagicStack/uvloop>`_, ``'auto'`` for uvloop when it is installed, or a policy whose ``new_event_loop()`` creates the loop. A policy must be picklable to be used with ``processes``. Default is ``'default'``.
+
+    ``stats`` holds the :class:`~apollo.utils.Stats` of the latest run, updated as requests complete.
 
     """
     # request builder
@@ -232,22 +310,57 @@ class ApolloCB:
     api_auth = attr.ib(default = AuthBase(), validator = instance_of(AuthBase))
     zip_type = attr.ib(default = zip_longest_ffill, validator = instance_of(types.FunctionType))
     file_pattern = attr.ib(default = FilePattern(), validator = instance_of(FilePattern))
-    mod_response = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
+    mod_response = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
     storage = attr.ib(default = None, validator = instance_of((StorageBase, type(None))))
     verbose = attr.ib(default = False, validator = instance_of(bool))
     # content_type = attr.ib(default = 'json', validator = in_(HttpAcceptedTypes.ACCEPTED_CONTENT_TYPES))
 
     # clientbuilder specific
-    stop_criteria = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
-    storage_criteria = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
+    stop_criteria = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
+    storage_criteria = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
     save = attr.ib(default = False, validator = instance_of(bool))
-    api_rate_limit = attr.ib(default = RateLimit(), validator = instance_of(RateLimit))
+    api_rate_limit = attr.ib(default = RateLimit(), validator = instance_of((RateLimit, PartitionedRateLimit)))
     storage_rate_limit = attr.ib(default = RateLimit(), validator = instance_of(RateLimit))
-
-    def _build_requests(self):
+    connection_pool = attr.ib(default = ConnectionPool(), validator = instance_of(ConnectionPool))
+    workers = attr.ib(default = None, validator = instance_of((int, type(None))))
+    stream_to_storage = attr.ib(default = False, validator = instance_of(bool))
+    chunk_size = attr.ib(default = CHUNK_SIZE, validator = instance_of(int))
+    retry = attr.ib(default = Retry(), validator = instance_of(Retry))
+    cache = attr.ib(default = None, validator = instance_of((ResponseCache, type(None))))
+    dedupe = attr.ib(default = None, validator = in_([None, 'skip', 'coalesce']))
+    journal = attr.ib(default = None, validator = instance_of((Journal, type(None))))
+    resume = attr.ib(default = False, validator = instance_of(bool))
+    paginator = attr.ib(default = None, validator = instance_of((Paginator, type(None))))
+    processes = attr.ib(default = 1, validator = instance_of(int))
+    quota = attr.ib(default = None, validator = instance_of((Quota, type(None))))
+    event_loop = attr.ib(default = 'default')
+    hedge = attr.ib(default = None, validator = instance_of((Hedge, type(None))))
+    timeout = attr.ib(default = Timeout(), validator = instance_of(Timeout))
+    _shared_state = attr.ib(init = False, default = (None, None), repr = False)
+    _stopping = attr.ib(init = False, default = None, repr = False)
+    stats = attr.ib(init = False, default = attr.Factory(Stats))
+
+    @processes.validator
+    def _(self, attribute, value):
+        if value <= 0:
+            raise ValueError(f"The processes must be over 0. You provided {value}")
+
+    @event_loop.validator
+    def _(self, attribute, value):
+        event_loop_policy(value)
+
+    @workers.validator
+    def _(self, attribute, value):
+        if value is not None and value <= 0:
+            raise ValueError(f"The workers must be over 0. You provided {value}")
+
+    def _build_requests(self, shard = None):
         """
         Implements a RequestFactory to create APIRequests.
 
+        :type shard: tuple
+        :param shard: (Optional) ``(k, n)`` to only build the requests of shard ``k`` of ``n``. See :meth:`~apollo.builder.converters.Indexed.shard`.
+
         :returns: generator
         """
 
@@ -264,54 +377,351 @@ class ApolloCB:
             mod_response = self.mod_response,
             storage = self.storage,
             verbose = self.verbose,
+            stream_to_storage = self.stream_to_storage,
+            chunk_size = self.chunk_size,
         )
 
         if self.verbose:
-            log.info(f"{len(rf)} requests built.")
+            try:
+                log.info(f"{len(rf)} requests built.")
+            except TypeError:
+                #iterator attributes are only counted as they are consumed
+                log.info("Requests are built as they are sent.")
+
+        if shard is not None:
+            rf = rf.shard(*shard)
 
         for req in rf:
             auth_req = self.api_auth >> req
             yield auth_req
 
-    async def add_requests(self, requests):
+    @property
+    def partitioned(self):
+        """True if ``api_rate_limit`` is a :class:`~apollo.utils.PartitionedRateLimit`.
+
+        :rtype: boolean
         """
-        Executes and executes :func:`~apollo.request.APIRequest.request` and :func:`~apollo.request.APIRequest.save` methods on :class:`~apollo.request.APIRequest` objects.
+        return isinstance(self.api_rate_limit, PartitionedRateLimit)
+
+    @property
+    def worker_count(self):
+        """The number of requests handled at one time: ``workers``, or the most ``api_rate_limit`` concurrency.
+        When partitioned, the number of requests of the default partition handled at one time.
+
+        :rtype: int
         """
+        if self.partitioned:
+            return self.workers or self.api_rate_limit.default.max_concurrency
+        return self.workers or self.api_rate_limit.max_concurrency
 
-        api_semaphore = asyncio.Semaphore(self.api_rate_limit.limit)
-        storage_semaphore = asyncio.Semaphore(self.storage_rate_limit.limit)
+    @property
+    def remaining_quota(self):
+        """The number of calls left in each window of ``quota`` for the ``api_auth`` credentials, e.g. ``{'daily': 9500}``.
+        None without a ``quota``.
 
-        tasks = []
+        :rtype: dict
+        """
+        if self.quota is None:
+            return None
+        return self.quota.remaining(self.api_auth.identity)
 
-        for request in requests:
-            tasks.append(
-                asyncio.ensure_future(
-                    request.request(
-                        api_rate_limit=self.api_rate_limit.limit,
-                        storage_rate_limit=self.storage_rate_limit.limit,
-                        api_semaphore=api_semaphore,
-                        storage_semaphore=storage_semaphore,
-                        stop_criteria=self.stop_criteria,
-                    )
-                )
+    def _pool(self, handler, on_result):
+        """Creates the :class:`~apollo.builder.scheduler.WorkerPool` of a run, or a
+        :class:`~apollo.builder.scheduler.PartitionedWorkerPool` with a worker per call each partition may have in flight.
+        """
+        if self.partitioned:
+            return PartitionedWorkerPool(
+                handler = handler,
+                workers = lambda partition: self.workers or self.api_rate_limit.rate_limit(partition).max_concurrency,
+                key = self.api_rate_limit.key,
+                on_result = on_result,
             )
 
-        tasks = {key: n for n, key in enumerate(tasks)}
+        return WorkerPool(
+            handler = handler,
+            workers = self.worker_count,
+            on_result = on_result,
+        )
 
-        done, pending = await asyncio.wait(tasks.keys(), return_when=FIRST_EXCEPTION)
+    def _skip_duplicates(self, requests):
+        """Yields the first of each set of identical requests, by :attr:`~apollo.request.APIRequest.fingerprint`."""
+        seen = set()
+        for request in requests:
+            fingerprint = request.fingerprint
+            if fingerprint in seen:
+                self.stats.deduplicated += 1
+                continue
+            seen.add(fingerprint)
+            yield request
+
+    def _skip_journaled(self, requests, journaled):
+        """Yields the requests not recorded in ``journal`` by a previous run."""
+        for request in requests:
+            if request.fingerprint in journaled:
+                self.stats.resumed += 1
+                continue
+            yield request
+
+    def _until_stopped(self, requests):
+        """Yields requests until :meth:`~apollo.ApolloCB.stop` is called."""
+        for request in requests:
+            if self._stopping.is_set():
+                return
+            yield request
+
+    def stop(self,):
+        """
+        Stops the run gracefully: no new requests are started, and the requests in flight complete, are saved and
+        are recorded in ``journal``. Called on SIGTERM when ``journal`` is set. Must be called from the thread running the event loop.
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def _handle_sigterm(self,):
+        """Calls :meth:`~apollo.ApolloCB.stop` on SIGTERM. Returns False if signal handlers can't be set from here."""
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self.stop)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    async def _run(self, requests, on_result):
+        """
+        Runs ``requests`` through a :class:`~apollo.builder.scheduler.WorkerPool`, sharing one session, and
+        awaits ``on_result`` with each completed :class:`~apollo.request.APIRequest`.
+        """
 
-        for pending_task in pending:
-            pending_task.cancel()
+        api_state, storage_state = self._shared_state
+        api_limiter = self.api_rate_limit.limiter() if self.partitioned else self.api_rate_limit.limiter(api_state)
+        storage_limiter = self.storage_rate_limit.limiter(storage_state)
+        self.stats = Stats(concurrency = api_limiter.limit)
+
+        self._stopping = asyncio.Event()
+
+        if self.journal:
+            journaled = self.journal.load() if self.resume else set()
+            self.journal.open(resume = self.resume)
+            requests = self._skip_journaled(requests, journaled)
+
+        if self.dedupe == 'skip':
+            requests = self._skip_duplicates(requests)
+
+        requests = self._until_stopped(requests)
+        in_flight = {}
+        #pages of each paginated request not yet done, and paginated requests with a page not saved
+        chains = {}
+        incomplete = set()
+        sigterm = self.journal is not None and self._handle_sigterm()
+        quota = self.quota.account(self.api_auth.identity) if self.quota else None
+        hedger = self.hedge.hedger() if self.hedge else None
+        timeouts = self.timeout.timeouts()
+
+        async with self.connection_pool.session() as session:
+
+            async def call(request):
+                limiter = api_limiter
+                if self.partitioned:
+                    limiter = api_limiter.get(self.api_rate_limit.key(request))
+
+                return await request.request(
+                    api_limiter=limiter,
+                    storage_limiter=storage_limiter,
+                    stop_criteria=self.stop_criteria,
+                    session=session,
+                    retry=self.retry,
+                    cache=self.cache,
+                    quota=quota,
+                    hedge=hedger,
+                    timeouts=timeouts,
+                )
 
-        completed_tasks = []
+            async def coalesce(request):
+                fingerprint = request.fingerprint
+
+                if fingerprint in in_flight:
+                    self.stats.deduplicated += 1
+                    leader = await asyncio.shield(in_flight[fingerprint])
+                    request.response = leader.response
+                    #the leader follows the pages and is journaled
+                    request.pagination = {**(request.pagination or {}), 'coalesced': True}
+                    return request
+
+                in_flight[fingerprint] = asyncio.ensure_future(call(request))
+                try:
+                    return await in_flight[fingerprint]
+                finally:
+                    del in_flight[fingerprint]
+
+            def settle(origin, pages):
+                """Records a paginated request once all its pages are done."""
+                remaining = chains.pop(origin, 1) - 1 + pages
+                if remaining > 0:
+                    chains[origin] = remaining
+                elif origin in incomplete:
+                    incomplete.discard(origin)
+                elif self.journal:
+                    self.journal.record(origin)
+
+            async def handler(request):
+                try:
+                    if self.dedupe == 'coalesce':
+                        result = await coalesce(request)
+                    else:
+                        result = await call(request)
+                except QuotaExceeded as exc:
+                    self.stats.over_quota += 1
+                    if not self._stopping.is_set() and self.verbose:
+                        log.info(f"Stopping: {exc}")
+                    self.stop()
+                    incomplete.add(request.origin)
+                    settle(request.origin, 0)
+                    return None
+
+                self.stats.completed += 1
+                self.stats.concurrency = api_limiter.limit
+                if hedger:
+                    self.stats.hedged, self.stats.hedges_won = hedger.hedged, hedger.won
+
+                if (result.pagination or {}).get('coalesced'):
+                    return result
+
+                pages = self.paginator.next_requests(result) if self.paginator else []
+
+                if result.save_error is not None or (pages and self._stopping.is_set()):
+                    incomplete.add(result.origin)
+                elif not self._stopping.is_set():
+                    for page in pages:
+                        pool.submit(page)
+
+                settle(result.origin, len(pages))
+                return result
+
+            async def deliver(result):
+                #requests not made for want of quota are not passed on
+                if result is not None:
+                    await on_result(result)
+
+            pool = self._pool(handler, deliver)
 
-        for task in done:
             try:
-                completed_tasks.append(task.result())
-            except Exception:
-                pass
+                exception = await pool.run(requests)
+            finally:
+                if sigterm:
+                    asyncio.get_running_loop().remove_signal_handler(signal.SIGTERM)
+                if self.journal:
+                    self.journal.close()
 
-        return completed_tasks
+        if self.verbose:
+            log.info(f"Requests completed: {pool.completed}, API concurrency: {self.stats.concurrency}")
+            if self.dedupe:
+                log.info(f"Requests deduplicated: {self.stats.deduplicated}")
+            if self.resume:
+                log.info(f"Requests skipped as completed by a previous run: {self.stats.resumed}")
+            if self.hedge:
+                log.info(f"Calls hedged: {self.stats.hedged}, answered first: {self.stats.hedges_won}")
+            if self.quota:
+                log.info(f"Requests not made for want of quota: {self.stats.over_quota}, remaining: {self.remaining_quota}")
+            if self._stopping.is_set():
+                log.info("Stopped before all requests were made")
+            if exception:
+                log.info(f"Stopped at: {exception!r}")
+
+    async def add_requests(self, requests):
+        """
+        Executes and executes :func:`~apollo.request.APIRequest.request` and :func:`~apollo.request.APIRequest.save` methods on :class:`~apollo.request.APIRequest` objects.
+
+        Every request shares one session (see :class:`~apollo.utils.ConnectionPool`), which is closed once the requests finish.
+        Requests are pulled from ``requests`` by a :class:`~apollo.builder.scheduler.WorkerPool` of ``workers`` workers, so
+        only the requests in flight are held in memory. Execution stops at the first exception.
+
+        :type requests: iterable
+        :param requests: :class:`~apollo.request.APIRequest` objects. Consumed lazily.
+
+        :returns: list of completed :class:`~apollo.request.APIRequest` if ``save`` is ``True``, otherwise an empty list.
+        """
+
+        completed = []
+
+        async def on_result(request):
+            if self.save:
+                completed.append(request)
+
+        await self._run(requests, on_result=on_result)
+
+        return completed
+
+    async def stream(self, maxsize=None):
+        """
+        Executes the request and yields each :class:`~apollo.request.APIRequest` as soon as it completes.
+
+        Completed requests wait in a queue of ``maxsize``. When the queue is full the workers stop fetching
+        until the consumer catches up, so fetching never runs ahead of processing by more than ``maxsize`` requests.
+        Leaving the loop early stops the run.
+
+        .. code-block:: python
+
+            async for api_request in rf.stream():
+                process(api_request.response)
+
+        :type maxsize: int
+        :param maxsize: (Optional) The number of completed requests held for the consumer. Defaults to the number of workers.
+
+        :returns: async generator of :class:`~apollo.request.APIRequest`
+        """
+
+        results = asyncio.Queue(maxsize or self.worker_count)
+        runner = asyncio.ensure_future(
+            self._run(self._build_requests(), on_result=results.put)
+        )
+
+        try:
+            while True:
+                getter = asyncio.ensure_future(results.get())
+                await asyncio.wait([getter, runner], return_when=asyncio.FIRST_COMPLETED)
+
+                if getter.done():
+                    yield getter.result()
+                    continue
+
+                getter.cancel()
+                while not results.empty():
+                    yield results.get_nowait()
+                runner.result()
+                return
+        finally:
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    def stream_sync(self, maxsize=None):
+        """
+        Synchronous version of :meth:`~apollo.ApolloCB.stream`. Runs its own event loop, which only runs while the
+        next request is being waited for, so nothing is fetched while the consumer is busy.
+
+        .. code-block:: python
+
+            for api_request in rf.stream_sync():
+                process(api_request.response)
+
+        :type maxsize: int
+        :param maxsize: (Optional) The number of completed requests held for the consumer. Defaults to the number of workers.
+
+        :returns: generator of :class:`~apollo.request.APIRequest`
+        """
+
+        loop = event_loop_policy(self.event_loop).new_event_loop()
+        requests = self.stream(maxsize=maxsize)
+
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(requests.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(requests.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
 
     def execute(self,):
         """
@@ -323,12 +733,36 @@ class ApolloCB:
         if self.verbose:
             log.info("Building requests")
 
-        requests = self._build_requests()
+        if self.processes > 1:
+            responses = self._execute_sharded()
+        else:
+            requests = self._build_requests()
+            responses = run(self.add_requests(requests=requests), event_loop=self.event_loop)
 
-        responses = asyncio.run(self.add_requests(requests=requests))
+        if self.save:
+            return responses
+
+    def _execute_sharded(self,):
+        """
+        Splits the requests between ``processes`` worker processes, each running its own event loop and session, with
+        the rate limit budgets shared between them. Merges the completed requests and ``stats`` of the processes.
+        """
+        if self.partitioned:
+            raise ValueError("processes can't be used with a PartitionedRateLimit, as its partitions are only known while running.")
+
+        if self.journal and not self.resume:
+            self.journal.open()
+            self.journal.close()
+
+        states = (self.api_rate_limit.shared_state(), self.storage_rate_limit.shared_state())
+
+        with ProcessPoolExecutor(self.processes, initializer=_init_shard, initargs=states) as executor:
+            shards = [executor.submit(_run_shard, self, shard) for shard in range(self.processes)]
+            results = [shard.result() for shard in shards]
+
+        self.stats = Stats.total([stats for _, stats in results])
 
         if self.verbose:
-            log.info(f"Responses received: {len(responses)}")
+            log.info(f"Requests completed by {self.processes} processes: {self.stats.completed}")
 
-        if self.save:
-            return responses
+        return [request for responses, _ in results for request in responses]
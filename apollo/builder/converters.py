@@ -1,11 +1,16 @@
 #standard
 from collections import UserDict
 from collections import UserList
+from collections.abc import Iterator
+from collections.abc import MutableMapping
+from collections.abc import Sized
+import math
 import typing
 
 #third party
 import attr
 from attr.validators import instance_of
+from attr.validators import in_
 
 #local
 from apollo.builder.exceptions import MethodError
@@ -15,26 +20,226 @@ from apollo.builder.exceptions import MoreThanOneKeySupplied
 from apollo.builder.exceptions import OnlyStringsOrIntsAllow
 from apollo.builder.exceptions import DelimiterMustBeString
 
+from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
+
+
+# how the dynamic values of several keys or arguments are combined, None allowing a single key
+EXPANSIONS = (None, 'zip', 'product')
+
+
+def is_dynamic(value):
+    """Whether an attribute value expands into one value per request: a list, tuple, range, or an iterator such as a generator.
+
+    :rtype: boolean
+    """
+    return isinstance(value, (list, tuple, range, Iterator))
+
+
+def expansion_len(values):
+    """The number of rows an attribute expands into, counted without iterating it.
+
+    :type values: iterable
+    :param values: The dynamic values.
+
+    :raises: TypeError if ``values`` is an iterator, whose length is unknown until consumed.
+    """
+    if not isinstance(values, Sized):
+        raise TypeError(
+            f"The number of requests is unknown while {type(values).__name__} values are used. Use a list or range to get it."
+        )
+    return len(values)
+
+
+def ffill_index(index, size):
+    """The index of the element of an attribute of ``size`` elements used in row ``index`` of a forward-filled plan.
+
+    :rtype: int or None
+    :returns: None if the attribute is empty, as it is filled with ``[]``.
+    """
+    return min(index, size - 1) if size else None
+
+
+def product_index(index, sizes):
+    """The index of the element of each iterable used in row ``index`` of their product, the last varying fastest.
+
+    :type sizes: list of int
+    :param sizes: The lengths of the iterables.
+
+    :rtype: list of int
+    """
+    indices = []
+    for size in reversed(sizes):
+        index, i = divmod(index, size)
+        indices.append(i)
+    return indices[::-1]
+
+
+def combined_len(sizes, expand):
+    """The number of rows of iterables of ``sizes`` once forward-filled, or multiplied if ``expand`` is ``'product'``.
+
+    :rtype: int
+    """
+    if expand == 'product':
+        return math.prod(sizes)
+    return max(sizes)
+
+
+class Indexed:
+    """Random access into the rows an attribute or a plan expands into, computed from its ``len()`` and ``_item``,
+    so no row before it is built.
+
+    Slices are :class:`~apollo.builder.converters.PlanSlice` views, which build their rows as they are iterated.
+    """
+
+    def _item(self, index):
+        raise NotImplementedError
+
+    def _slice(self, index):
+        return PlanSlice(self, range(len(self))[index])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(index)
+
+    def shard(self, k, n):
+        """Every ``n``-th row, starting at row ``k``. The ``n`` shards are disjoint and together hold every row.
+
+        :type k: int
+        :param k: The shard, from 0 to ``n - 1``.
+
+        :type n: int
+        :param n: The number of shards.
+
+        :rtype: :class:`~apollo.builder.converters.PlanSlice`
+        """
+        if not 0 <= k < n:
+            raise ValueError(f"The shard must be from 0 to {n - 1}. You provided {k}")
+        return self[k::n]
+
+
+class PlanSlice(Indexed):
+    """The rows of an :class:`~apollo.builder.converters.Indexed` at some indices, built as they are iterated.
+
+    :type source: :class:`~apollo.builder.converters.Indexed`
+    :param source: The attribute or plan sliced.
+
+    :type indices: range
+    :param indices: The indices of the rows in ``source``.
+
+    """
+
+    def __init__(self, source, indices):
+        self.source = source
+        self.indices = indices
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(source={self.source!r}, indices={self.indices})"
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return map(self.source._item, self.indices)
+
+    def _item(self, index):
+        return self.source._item(self.indices[index])
+
+    def _slice(self, index):
+        return PlanSlice(self.source, self.indices[index])
+
+
+class Overlay(MutableMapping):
+    """A dict made of its own keys over a ``base`` shared with other Overlays, as yielded by :class:`~apollo.builder.converters.DictConverter`.
+
+    Only the dynamic key of each element is stored in it, so the memory it takes does not grow with the static keys.
+    Writes go to its own keys, and the ``base`` is copied before a key of it is deleted, so the other Overlays are not changed.
+    It is turned into a dict by :attr:`~apollo.request.APIRequest.request_args`.
+
+    :type own: dict
+    :param own: The keys of this element.
+
+    :type base: dict
+    :param base: The keys shared by every element. Must not be changed once shared.
+
+    Example usage:
+
+    .. code-block:: python
+
+        base = {'static': 'a'}
+        Overlay({'b': 1}, base)
+        >>> {'b': 1, 'static': 'a'}
+
+    """
+
+    __slots__ = ('own', 'base')
+
+    def __init__(self, own, base):
+        self.own = own
+        self.base = base
+
+    def __getitem__(self, key):
+        if key in self.own:
+            return self.own[key]
+        return self.base[key]
+
+    def __setitem__(self, key, value):
+        self.own[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.own.pop(key, None)
+        if key in self.base:
+            self.base = {k: v for k, v in self.base.items() if k != key}
+
+    def __contains__(self, key):
+        return key in self.own or key in self.base
+
+    def __iter__(self):
+        yield from self.own
+        for key in self.base:
+            if key not in self.own:
+                yield key
+
+    def __len__(self):
+        return len(self.own) + sum(1 for key in self.base if key not in self.own)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        return Overlay(dict(self.own), self.base)
+
 
 @attr.s
-class DictConverter(UserDict):
+class DictConverter(Indexed, UserDict):
 
     
     dynamic = attr.ib(default = {}, validator = instance_of(dict))
     static = attr.ib(default = {}, validator = instance_of(dict))    
+    expand = attr.ib(default = None, validator = in_(EXPANSIONS))
+    _base = attr.ib(init = False, default = None, repr = False, eq = False)
 
     @dynamic.validator
     def dynamic_validator(self, attribute, value):
 
         for val in value.values():
-            if not isinstance(val, list):
+            if not is_dynamic(val):
                 raise ListAsValueRequired(
                     "Use a list as a value in dictionary, e.g. {'a': [1,2,3]}"
                 )
 
-        if len(value) > 1:
+        if len(value) > 1 and self.expand is None:
             raise MoreThanOneKeySupplied(
-                f"Please supply only one key. {len(value)} keys were given"
+                f"Please supply only one key, or set expand to 'zip' or 'product'. {len(value)} keys were given"
             )
 
     @static.validator
@@ -60,45 +265,70 @@ class DictConverter(UserDict):
         return combined
 
     @property
-    def data(self):
-        val = self.combined
+    def expanded(self):
+        """The dynamic keys expanded into one value per element. Keys with an empty list are kept as they are.
+
+        :rtype: list
+        """
+        return [k for k, v in self.dynamic.items() if not isinstance(v, Sized) or len(v)]
+
+    @property
+    def base(self):
+        """The keys shared by every element: the static keys, less the expanded dynamic ones. Computed once.
+
+        :rtype: dict
+        """
+        if self._base is None:
+            expanded = self.expanded
+            self._base = {k: v for k, v in self.combined.items() if k not in expanded}
+        return self._base
+
+    def __iter__(self):
+        keys = self.expanded
         cnt = 0
 
-        out = []
-
-        for k, v in val.items():
-
-            if isinstance(v, zip) and isinstance(k, tuple):
-                z = list(zip(k, v))
-
-                for m in z:
-                    w, v = m
-                    v, *_ = v
-
-                    for f in v:
-                        param = {}
-                        p = val.copy()
-                        del p[k]
-                        param.update({w: f})
-                        param.update(p)
-                        cnt += 1
-                        out.append(param)
-                        # yield param
-
-            elif isinstance(v, list):
-                for f in v:
-                    param = {}
-                    p = val.copy()
-                    del p[k]
-                    param.update({k: f})
-                    param.update(p)
-                    cnt += 1
-                    out.append(param)
-                    # yield param
+        #one base is shared by every element
+        rest = self.base
+
+        if len(keys) == 1:
+            k, = keys
+            for f in self.dynamic[k]:
+                cnt += 1
+                yield Overlay({k: f}, rest)
+
+        elif keys:
+            columns = [self.dynamic[k] for k in keys]
+            rows = zip_product(*columns) if self.expand == 'product' else zip_longest_ffill(*columns)
+            for row in rows:
+                cnt += 1
+                yield Overlay(dict(zip(keys, row)), rest)
+
         if cnt == 0:
-            out.append(val)
-            # yield val
-        return out
+            yield self.combined
+
+    def _item(self, index):
+        keys = self.expanded
+        if not keys:
+            return self.combined
+
+        columns = [self.dynamic[k] for k in keys]
+        sizes = [len(c) for c in columns]
+        if self.expand == 'product':
+            indices = product_index(index, sizes)
+        else:
+            indices = [ffill_index(index, size) for size in sizes]
+
+        return Overlay({k: c[i] for k, c, i in zip(keys, columns, indices)}, self.base)
+
+    def __len__(self):
+        keys = self.expanded
+        if not keys:
+            return 1
+        return combined_len([expansion_len(self.dynamic[k]) for k in keys], self.expand)
+
+    @property
+    def data(self):
+        return list(self)
 
 def convert_to_str(val):
     if isinstance(val, (str, int)):
@@ -112,7 +342,7 @@ def convert_to_str(val):
 class ListConverter(UserList):
 
     static = attr.ib(converter = convert_to_str)  
-    dynamic = attr.ib(default = attr.Factory(list), validator = instance_of((list)))
+    dynamic = attr.ib(default = attr.Factory(list))
     delimiter = attr.ib(default = '/', converter = attr.converters.optional(str))
     
     @delimiter.validator
@@ -131,7 +361,11 @@ class ListConverter(UserList):
 
     @dynamic.validator
     def dynamic_validator(self,  attribute, value):
-        if ListConverter.count_lists(value) > 0:
+        if not is_dynamic(value):
+            raise TypeError(f"Please use a list, range or iterator. Instead of {value}")
+
+        #iterators are not checked, as that would consume them
+        if isinstance(value, Sized) and ListConverter.count_lists(value) > 0:
             raise NestedFoldersForbidden("Please ensure you do not nest folders")
 
 
@@ -139,10 +373,9 @@ class ListConverter(UserList):
     def combined(self):
 
         static = self.static.copy()
-        dynamic = self.dynamic.copy()
         combined = static
 
-        combined.extend([dynamic])
+        combined.extend([self.dynamic])
         return combined
 
     @staticmethod
@@ -153,21 +386,20 @@ class ListConverter(UserList):
                 count += 1
         return count
 
-    @property
-    def data(self):
-        vals = self.combined
-        cnt = 0
+    def __iter__(self):
         to_str = lambda x: [str(i) for i in x if i]
-        out = []
-        for n, val in enumerate(vals):
-            if isinstance(val, (list, range)):
-                for f in val:
-                    row = []
-                    row.extend(vals[:n])
-                    row.extend([f])
-                    row.extend(vals[n + 1 :])
-                    cnt += 1
-                    out.append("/".join(to_str(row)))
+        cnt = 0
+
+        for f in self.dynamic:
+            cnt += 1
+            yield "/".join(to_str(self.static + [f]))
+
         if cnt == 0:
-            out.append(f"{self.delimiter}".join(to_str(vals)))
-        return out
\ No newline at end of file
+            yield f"{self.delimiter}".join(to_str(self.static))
+
+    def __len__(self):
+        return expansion_len(self.dynamic) or 1
+
+    @property
+    def data(self):
+        return list(self)
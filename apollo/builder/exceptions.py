@@ -18,6 +18,10 @@ class MoreThanOneKeySupplied(Exception):
     pass
 
 
+class QuotaExceeded(Exception):
+    pass
+
+
 class DelimiterMustBeString(Exception):
     pass
 
@@ -0,0 +1,219 @@
+#standard
+import asyncio
+import itertools
+from concurrent.futures import FIRST_COMPLETED
+
+#submitted items are handled before items read from the iterable
+SUBMITTED, READ = 0, 1
+
+
+class WorkerPool:
+    """Runs a coroutine function over an iterable with a fixed number of workers. Implemented by :class:`~apollo.ApolloCB`.
+
+    Items are pulled from the iterable into a bounded queue only as fast as the workers drain it, so
+    memory and scheduling overhead depend on the number of workers rather than the number of items.
+    More items, such as the next pages of a response, can be added with :meth:`~apollo.builder.scheduler.WorkerPool.submit`.
+    The pool stops at the first exception raised by ``handler``.
+
+    :type handler: coroutine function
+    :param handler: Called with each item. Its return value is passed to ``on_result``.
+
+    :type workers: int
+    :param workers: The number of items handled at one time.
+
+    :type on_result: coroutine function
+    :param on_result: (Optional) Called with each value returned by ``handler``.
+
+    :type maxsize: int
+    :param maxsize: (Optional) The number of items queued ahead of the workers. Defaults to ``workers``.
+
+    """
+
+    def __init__(self, handler, workers, on_result=None, maxsize=None):
+        if workers <= 0:
+            raise ValueError(f"The workers must be over 0. You provided {workers}")
+
+        self._handler = handler
+        self._workers = workers
+        self._on_result = on_result
+        self._maxsize = maxsize or workers
+        self._queue = None
+        self._slots = None
+        self._order = itertools.count()
+        self.completed = 0
+
+    def submit(self, item):
+        """Adds an item while the pool runs. Submitted items are handled before the items not yet read from the
+        iterable, and are not bounded by ``maxsize``. Call it from ``handler`` or ``on_result`` so the run waits for the item.
+
+        :param item: The item to handle.
+        """
+        self._queue.put_nowait((SUBMITTED, next(self._order), item))
+
+    async def _produce(self, items):
+        for item in items:
+            await self._slots.acquire()
+            self._queue.put_nowait((READ, next(self._order), item))
+        await self._queue.join()
+
+    async def _work(self):
+        while True:
+            source, _, item = await self._queue.get()
+            try:
+                result = await self._handler(item)
+                self.completed += 1
+                if self._on_result:
+                    await self._on_result(result)
+            finally:
+                self._queue.task_done()
+                if source == READ:
+                    self._slots.release()
+
+    async def run(self, items):
+        """Handles every item, or stops at the first exception.
+
+        :type items: iterable
+        :param items: The items to handle. Consumed lazily.
+
+        :returns: The first exception raised, or None.
+        """
+        self._queue = asyncio.PriorityQueue()
+        #items queued or being handled
+        self._slots = asyncio.Semaphore(self._workers + self._maxsize)
+
+        producer = asyncio.ensure_future(self._produce(items))
+        workers = [asyncio.ensure_future(self._work()) for _ in range(self._workers)]
+
+        tasks = [producer, *workers]
+
+        try:
+            # the producer finishes once every item is handled, a worker only finishes by raising
+            done, pending = await asyncio.wait(tasks, return_when=FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in done:
+            if not task.cancelled() and task.exception():
+                return task.exception()
+
+
+class PartitionedWorkerPool:
+    """Runs a coroutine function over an iterable with separate workers for each partition of the items. Implemented by
+    :class:`~apollo.ApolloCB` with :class:`~apollo.utils.PartitionedRateLimit`.
+
+    Each partition gets its own queue and workers, created when its first item is read, so items waiting on a slow
+    partition do not hold up the others. Up to ``maxsize`` items are read ahead of the workers across all partitions.
+    More items can be added with :meth:`~apollo.builder.scheduler.PartitionedWorkerPool.submit`.
+    The pool stops at the first exception raised by ``handler``.
+
+    :type handler: coroutine function
+    :param handler: Called with each item. Its return value is passed to ``on_result``.
+
+    :type workers: callable
+    :param workers: Called with a partition, returns the number of its items handled at one time.
+
+    :type key: callable
+    :param key: Called with an item, returns its partition.
+
+    :type on_result: coroutine function
+    :param on_result: (Optional) Called with each value returned by ``handler``.
+
+    :type maxsize: int
+    :param maxsize: (Optional) The number of items read ahead of the workers. Default is 1000.
+
+    """
+
+    def __init__(self, handler, workers, key, on_result=None, maxsize=None):
+        self._handler = handler
+        self._workers = workers
+        self._key = key
+        self._on_result = on_result
+        self._maxsize = maxsize or 1000
+        self._queues = {}
+        self._tasks = []
+        self._slots = None
+        self._failed = None
+        self._order = itertools.count()
+        self._unfinished = 0
+        self._idle = None
+        self.completed = 0
+
+    def _queue(self, partition):
+        if partition not in self._queues:
+            workers = self._workers(partition)
+            if workers <= 0:
+                raise ValueError(f"The workers must be over 0. You provided {workers}")
+
+            queue = self._queues[partition] = asyncio.PriorityQueue()
+            self._tasks.extend(asyncio.ensure_future(self._work(queue)) for _ in range(workers))
+        return self._queues[partition]
+
+    def submit(self, item):
+        """Adds an item while the pool runs. Submitted items are handled before the items of their partition not yet
+        read from the iterable, and are not bounded by ``maxsize``. Call it from ``handler`` or ``on_result`` so the run waits for the item.
+
+        :param item: The item to handle.
+        """
+        self._put(item, SUBMITTED)
+
+    def _put(self, item, source):
+        self._unfinished += 1
+        self._idle.clear()
+        self._queue(self._key(item)).put_nowait((source, next(self._order), item))
+
+    async def _produce(self, items):
+        for item in items:
+            await self._slots.acquire()
+            self._put(item, READ)
+        if self._unfinished:
+            await self._idle.wait()
+
+    async def _work(self, queue):
+        while True:
+            source, _, item = await queue.get()
+            try:
+                result = await self._handler(item)
+                self.completed += 1
+                if self._on_result:
+                    await self._on_result(result)
+            except BaseException as exc:
+                if not isinstance(exc, asyncio.CancelledError) and not self._failed.done():
+                    self._failed.set_result(exc)
+                raise
+            finally:
+                queue.task_done()
+                if source == READ:
+                    self._slots.release()
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._idle.set()
+
+    async def run(self, items):
+        """Handles every item, or stops at the first exception.
+
+        :type items: iterable
+        :param items: The items to handle. Consumed lazily.
+
+        :returns: The first exception raised, or None.
+        """
+        self._slots = asyncio.Semaphore(self._maxsize)
+        self._idle = asyncio.Event()
+        self._failed = asyncio.get_running_loop().create_future()
+
+        producer = asyncio.ensure_future(self._produce(items))
+
+        try:
+            await asyncio.wait([producer, self._failed], return_when=FIRST_COMPLETED)
+        finally:
+            tasks = [producer, *self._tasks]
+            for task in tasks:
+                task.cancel()
+            self._failed.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not producer.cancelled() and producer.exception():
+            return producer.exception()
+        if self._failed.done() and not self._failed.cancelled():
+            return self._failed.result()
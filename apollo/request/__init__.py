@@ -1,3 +1,8 @@
 from apollo.request.api_request import APIRequest
 from apollo.request.api_request import Response
 from apollo.request.factory import RequestFactory
+from apollo.request.paginator import Paginator
+from apollo.request.paginator import PageNumber
+from apollo.request.paginator import Offset
+from apollo.request.paginator import Cursor
+from apollo.request.paginator import Link
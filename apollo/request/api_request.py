@@ -1,6 +1,10 @@
 #standard
 import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections.abc import Mapping
 from pprint import pprint as p
 import types
 
@@ -8,6 +12,9 @@ import types
 import async_timeout
 from aiohttp import ClientSession
 from aiohttp import BasicAuth
+from aiohttp import ClientTimeout
+from multidict import CIMultiDict
+from multidict import CIMultiDictProxy
 from attr.validators import instance_of
 
 import attr
@@ -16,7 +23,11 @@ from attr.validators import in_
 #local
 from apollo.utils import FilePath
 from apollo.utils import FilePattern
+from apollo.utils import Retry
+from apollo.utils import Timeout
 from apollo.utils.helpers import HttpAcceptedTypes
+from apollo.utils.helpers import passthrough
+from apollo.utils.helpers import request_host
 
 from apollo.storage.base import StorageBase
 
@@ -29,7 +40,9 @@ logging.basicConfig(format=LOGGER_FORMAT, datefmt="[%H:%M:%S]")
 log = logging.getLogger()
 log.setLevel(logging.INFO)
 
-FETCH_TIMEOUT = 10
+CHUNK_SIZE = 2 ** 16
+
+_UNREAD = object()
 
 @attr.s
 class Response:
@@ -38,6 +51,8 @@ class Response:
 
     We need to save the data associated `aiohttp.ClientRequest <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse>`_ because aiohttp will close the connection (as it's non-blocking). Before the connection is closed, we save the data to this container.
 
+    Only the raw body (``byte_vals``) is kept. ``text`` and ``json`` are decoded from it the first time they are read, then cached.
+
     :type method: str
     :param method: See `aiohttp.ClientRequest.method <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.method>`_
 
@@ -51,25 +66,28 @@ class Response:
     :param status: See `aiohttp.ClientRequest.status <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.status>`_
 
     :type json: dict
-    :param json: Response from the coroutine here: `aiohttp.ClientRequest.json <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.json>`_
+    :param json: (Optional) The parsed body. If not given, ``byte_vals`` is parsed on first access.
 
     :type byte_vals: bytes
     :param byte_vals: Response from the coroutine here: `aiohttp.ClientRequest.read <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.read>`_
 
     :type text: str
-    :param text: Response from the coroutine here: `aiohttp.ClientRequest.text <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.text>`_
+    :param text: (Optional) The decoded body. If not given, ``byte_vals`` is decoded on first access.
 
     :type encoding: str
     :param encoding: See `aiohttp.ClientRequest.get_encoding <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.get_encoding>`_
 
     :type history: A `Sequence <https://docs.python.org/3/library/collections.abc.html#collections.abc.Sequence>`_ of `ClientResponse <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse>`_ objects
-    :param history: See `aiohttp.ClientRequest.history <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.history>`_
+    :param history: See `aiohttp.ClientRequest.history <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.history>`_. Empty once the response is pickled, e.g. when returned by another process.
 
     :type content_type: str
     :param content_type: See `aiohttp.ClientRequest.content_type <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.content_type>`_
 
     :type header: `CIMultiDictProxy <https://multidict.readthedocs.io/en/stable/multidict.html#multidict.CIMultiDictProxy>`_
     :param header: See `aiohttp.ClientRequest.header <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.header>`_
+
+    :type cached: boolean
+    :param cached: True if the server answered ``304 Not Modified`` and the response was served from a :class:`~apollo.utils.ResponseCache`.
     """
 
     
@@ -77,14 +95,62 @@ class Response:
     url = attr.ib(default = None)
     cookies = attr.ib(default = None)
     status = attr.ib(default = None)
-    json = attr.ib(default = None)
-    byte_vals = attr.ib(default = None)
-    text = attr.ib(default = None)
+    _json = attr.ib(default = _UNREAD, repr = False)
+    byte_vals = attr.ib(default = None, repr = False)
+    _text = attr.ib(default = _UNREAD, repr = False)
     encoding = attr.ib(default = None)
     history = attr.ib(default = None)
     content_type = attr.ib(default = None)
     header = attr.ib(default = None)
-   
+    cached = attr.ib(default = False)
+
+    def __getstate__(self):
+        # aiohttp's header proxy and redirect responses can't be pickled
+        state = self.__dict__.copy()
+        if self.header is not None:
+            state['header'] = CIMultiDict(self.header)
+        state['history'] = ()
+        return state
+
+    def __setstate__(self, state):
+        if state['header'] is not None:
+            state['header'] = CIMultiDictProxy(state['header'])
+        self.__dict__.update(state)
+
+    @property
+    def text(self):
+        """The body decoded with ``encoding``. Decoded on first access from ``byte_vals``, then cached.
+
+        :rtype: str
+        """
+        if self._text is _UNREAD:
+            if self.byte_vals is None:
+                return None
+            self._text = self.byte_vals.decode(self.encoding or 'utf-8')
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    @property
+    def json(self):
+        """The body parsed as JSON. Parsed on first access, then cached, so changes made to it (e.g. in ``mod_response``) are kept.
+        An empty body is ``None``. Raises ``ValueError`` if the body is not JSON.
+
+        :rtype: dict or list
+        """
+        if self._json is _UNREAD:
+            body = self.byte_vals if self._text is _UNREAD else self._text
+            if body is None:
+                return None
+            self._json = json.loads(body) if body.strip() else None
+        return self._json
+
+    @json.setter
+    def json(self, value):
+        self._json = value
+
 @attr.s
 class APIRequest:
     """
@@ -96,19 +162,19 @@ class APIRequest:
     :type url: str 
     :param url: Url being requested.
 
-    :type param: dict
+    :type param: dict or mapping, e.g. :class:`~apollo.builder.converters.Overlay`
     :param param: Parameters used in request.
 
-    :type header: dict
+    :type header: dict or mapping, e.g. :class:`~apollo.builder.converters.Overlay`
     :param header: Header used in request.
 
     :type auth: tuple
     :param auth: Authentication used in request.
 
-    :type data: dict
+    :type data: dict or mapping, e.g. :class:`~apollo.builder.converters.Overlay`
     :param data: Data used in request.
 
-    :type cookie: dict
+    :type cookie: dict or mapping, e.g. :class:`~apollo.builder.converters.Overlay`
     :param cookie: Cookie used in request.
 
     :type file_pattern: :class:`~apollo.utils.FilePattern`
@@ -122,22 +188,38 @@ class APIRequest:
 
     :type verbose: boolean
     :param verbose: Set True if you'd like logging enabled. This is useful for development.
+
+    :type stream_to_storage: boolean
+    :param stream_to_storage: Set True to write the body to ``storage`` in chunks as it is read, instead of reading it into memory. See :meth:`~apollo.request.APIRequest.save_stream`.
+
+    :type chunk_size: int
+    :param chunk_size: The number of bytes read and written at a time when ``stream_to_storage`` is True.
+
+    :type save_error: Exception
+    :param save_error: The storage error raised by :meth:`~apollo.request.APIRequest.save`, if the save failed.
+
+    :type pagination: dict
+    :param pagination: State kept by a :class:`~apollo.request.paginator.Paginator` on the requests it builds.
     """
     
     url = attr.ib(validator = instance_of(str))
     method = attr.ib(default = 'GET', validator = in_(HttpAcceptedTypes.ACCEPTED_METHODS))
-    param = attr.ib(default = dict(), validator = instance_of(dict))
-    header = attr.ib(default = dict(), validator = instance_of(dict))
+    param = attr.ib(default = dict(), validator = instance_of(Mapping))
+    header = attr.ib(default = dict(), validator = instance_of(Mapping))
     auth = attr.ib(default = None, validator = instance_of((tuple, type(None))), repr = False)
-    data = attr.ib(default = dict(), validator = instance_of(dict))
-    cookie = attr.ib(default = dict(), validator = instance_of(dict))
+    data = attr.ib(default = dict(), validator = instance_of(Mapping))
+    cookie = attr.ib(default = dict(), validator = instance_of(Mapping))
     file_pattern = attr.ib(default = None, validator = instance_of((FilePattern, type(None))))
-    mod_response = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
+    mod_response = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
     storage = attr.ib(default = None, validator = instance_of((StorageBase, type(None))))
-    storage_criteria = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
-    mod_response = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
+    storage_criteria = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
+    mod_response = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
     verbose = attr.ib(default = False, validator = instance_of(bool))
     response = attr.ib(default = Response())
+    stream_to_storage = attr.ib(default = False, validator = instance_of(bool))
+    chunk_size = attr.ib(default = CHUNK_SIZE, validator = instance_of(int))
+    save_error = attr.ib(default = None, repr = False)
+    pagination = attr.ib(default = None, repr = False)
 
     @property
     def file_path(self):
@@ -150,120 +232,341 @@ class APIRequest:
             self.file_pattern.lookup_obj = self
             return self.file_pattern.path
 
+    @property
+    def request_args(self):
+        """
+        Keyword arguments passed to `aiohttp.ClientSession.request <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession.request>`_.
+        Mappings such as :class:`~apollo.builder.converters.Overlay` are turned into dicts here, for the call only.
+
+        :rtype: dict
+        """
+        request_args = {
+            "method": self.method,
+            "url": self.url,
+            "params": dict(self.param),
+            "data": dict(self.data),
+            "cookies": dict(self.cookie),
+            "headers": dict(self.header),
+        }
+
+        if self.auth:
+            request_args.update({"auth": BasicAuth(*self.auth)})
+
+        return request_args
+
+    @property
+    def cache_key(self):
+        """
+        Identifies the request in a :class:`~apollo.utils.ResponseCache`: a hash of the method, url and sorted params.
+
+        :rtype: str
+        """
+        params = sorted((str(k), str(v)) for k, v in self.param.items())
+        return hashlib.sha256(json.dumps([self.method, self.url, params]).encode()).hexdigest()
+
+    @property
+    def fingerprint(self):
+        """
+        Identifies identical requests: a hash of the method, url, sorted params and a hash of the data. See ``dedupe`` on :class:`~apollo.ApolloCB`.
+
+        :rtype: str
+        """
+        params = sorted((str(k), str(v)) for k, v in self.param.items())
+        body = hashlib.sha256(json.dumps(dict(self.data), sort_keys=True, default=str).encode()).hexdigest()
+        return hashlib.sha256(json.dumps([self.method, self.url, params, body]).encode()).hexdigest()
+
+    @property
+    def origin(self):
+        """
+        The :attr:`~apollo.request.APIRequest.fingerprint` of the request that started the pagination of this one, or of this request.
+
+        :rtype: str
+        """
+        return (self.pagination or {}).get('origin') or self.fingerprint
+
+    async def fetch(self, session, cache=None, timeouts=None):
+        """
+        Makes the http call and reads the response into a :class:`~apollo.request.Response`.
+
+        :type session: `aiohttp.ClientSession <https://docs.aiohttp.org/en/stable/client_reference.html#client-session>`_
+        :param session: Session used to make the call.
+
+        :type cache: :class:`~apollo.utils.ResponseCache`
+        :param cache: (Optional) If a response to this request is stored, the call is made conditional and a ``304 Not Modified`` answer is served from the store. Responses with an ``ETag`` or ``Last-Modified`` header are stored.
+
+        :type timeouts: :class:`~apollo.utils.timeout.Timeouts`
+        :param timeouts: (Optional) The timeouts of the call, which observe its latencies. Defaults to :class:`~apollo.utils.Timeout`.
+
+        :rtype: :class:`~apollo.request.Response`
+        """
+
+        timeouts = timeouts or Timeout().timeouts()
+        host = request_host(self)
+        limits = timeouts.limits(host)
+        request_args = self.request_args
+        cached = None
+
+        if cache is not None:
+            cached = cache.get(self.cache_key)
+            if cached is not None:
+                request_args["headers"] = {**self.header, **cache.validators(cached)}
+
+        timeout = ClientTimeout(total=None, sock_connect=limits.connect, sock_read=limits.first_byte)
+        start = time.monotonic()
+
+        async with async_timeout.timeout(limits.total):
+
+            async with session.request(**request_args, timeout=timeout) as response:
+
+                first_byte = time.monotonic() - start
+
+                byte_vals = await response.read()
+
+                resp = self._to_response(response, byte_vals=byte_vals)
+
+        timeouts.observe(host, first_byte, time.monotonic() - start)
+
+        if cache is not None:
+            if resp.status == 304 and cached is not None:
+                resp = attr.evolve(
+                    resp,
+                    status=cached.status,
+                    byte_vals=cached.byte_vals,
+                    encoding=cached.encoding,
+                    content_type=cached.content_type,
+                    header=cached.header,
+                    cached=True,
+                )
+            elif resp.status == 200:
+                cache.put(self.cache_key, resp)
+
+        return resp
+
+    @staticmethod
+    def _to_response(response, byte_vals=None):
+        return Response(
+            method=response.method,
+            url=response.url,
+            cookies=response.cookies,
+            status=response.status,
+            byte_vals=byte_vals,
+            encoding=response.get_encoding() if byte_vals is not None else response.charset,
+            history=response.history,
+            content_type=response.content_type,
+            header=response.headers,
+        )
+
+    def _receive(self, resp, stop_criteria):
+        stop = stop_criteria(resp)
+
+        if stop == True:
+            raise Exception
+
+        self.response = self.mod_response(resp)
+
+        if self.verbose:
+            log.info(
+                f"Url {self.response.url}, Status {self.response.status}"
+            )
+
     async def request(
         self,
-        api_rate_limit,
-        storage_rate_limit,
-        api_semaphore,
-        storage_semaphore,
+        api_limiter,
+        storage_limiter,
         stop_criteria,
+        session=None,
+        retry=None,
+        cache=None,
+        quota=None,
+        hedge=None,
+        timeouts=None,
     ):
         """
         Executes `aiohttp.ClientSession.request <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession.request>`_.
+
+        The call is made while holding ``api_limiter``, which is released before the response is saved.
+        The latency and status of every attempt are recorded on ``api_limiter``.
         
-        :type api_rate_limit: int
-        :param api_rate_limit: The speed with which requests should be executed.
-        
-        :type storage_rate_limit: int
-        :param storage_rate_limit: The speed with which responses should be saved.
-        
-        :type api_semaphore: int
-        :param api_semaphore: Number of requests to be executed at "once"
+        :type api_limiter: :class:`~apollo.utils.rate_limiter.Limiter`
+        :param api_limiter: Limits the rate and concurrency of requests. See :meth:`~apollo.utils.RateLimit.limiter`.
         
-        :type storage_semaphore: int
-        :param storage_semaphore: Number of requests to be executed at "once"
+        :type storage_limiter: :class:`~apollo.utils.rate_limiter.Limiter`
+        :param storage_limiter: Limits the rate and concurrency of saves. See :meth:`~apollo.utils.RateLimit.limiter`.
         
         :type stop_criteria: lambda
         :param stop_criteria: Any function that will manipulate :class:`~apollo.request.Response` and return True or False.
 
+        :type session: `aiohttp.ClientSession <https://docs.aiohttp.org/en/stable/client_reference.html#client-session>`_
+        :param session: (Optional) Session whose pooled connections are reused. :class:`~apollo.ApolloCB` shares one session across a run. If not given, a session is opened and closed for this request only.
+
+        :type retry: :class:`~apollo.utils.Retry`
+        :param retry: (Optional) How failed calls are retried. Every attempt goes through ``api_limiter``. If not given, calls are not retried.
+
+        :type cache: :class:`~apollo.utils.ResponseCache`
+        :param cache: (Optional) Makes calls conditional on stored responses. Not used when the body is streamed to storage. See :meth:`~apollo.request.APIRequest.fetch`.
+
+        :type quota: :class:`~apollo.utils.quota.Account`
+        :param quota: (Optional) Charged for every attempt, once ``api_limiter`` is held. See :meth:`~apollo.utils.Quota.account`.
+
+        :type hedge: :class:`~apollo.utils.hedge.Hedger`
+        :param hedge: (Optional) Duplicates slow calls of the methods it hedges. The duplicate takes a token of ``api_limiter`` and is charged to ``quota``. Not used when the body is streamed to storage. See :meth:`~apollo.utils.Hedge.hedger`.
+
+        :type timeouts: :class:`~apollo.utils.timeout.Timeouts`
+        :param timeouts: (Optional) The connect, first byte and total timeouts of each attempt. Defaults to :class:`~apollo.utils.Timeout`. See :meth:`~apollo.utils.Timeout.timeouts`.
+
+        :raises: :class:`~apollo.builder.exceptions.QuotaExceeded` if ``quota`` is spent and does not pause.
+
         :rtype: :class:`~apollo.request.APIRequest`
         :returns: self 
         """
-        
-        request_args = {
-            "method": self.method,
-            "url": self.url,
-            "params": self.param,
-            "data": self.data,
-            "cookies": self.cookie,
-            "headers": self.header,
-        }
 
-        if self.auth:
-            request_args.update({"auth": BasicAuth(*self.auth)})
+        if session is None:
+            async with ClientSession() as session:
+                return await self.request(
+                    api_limiter=api_limiter,
+                    storage_limiter=storage_limiter,
+                    stop_criteria=stop_criteria,
+                    session=session,
+                    retry=retry,
+                    cache=cache,
+                    quota=quota,
+                    hedge=hedge,
+                    timeouts=timeouts,
+                )
+
+        retry = retry or Retry(attempts=1)
+        timeouts = timeouts or Timeout().timeouts()
+        streaming = self.stream_to_storage and self.storage
+        hedged = hedge is not None and not streaming and self.method in hedge.methods
+
+        async def fetch():
+            return await self.fetch(session, cache=cache, timeouts=timeouts)
+
+        async def acquire():
+            # the duplicate of a hedged call is rate limited and charged like any call
+            await api_limiter.bucket.acquire()
+            if quota is not None:
+                await quota.acquire()
+
+        for attempt in range(1, retry.attempts + 1):
+            last = attempt == retry.attempts
+
+            try:
+                async with api_limiter:
+                    if quota is not None:
+                        await quota.acquire()
+                    start = time.monotonic()
+                    try:
+                        if streaming:
+                            resp = await self._stream(
+                                session,
+                                timeouts=timeouts,
+                                storage_limiter=storage_limiter,
+                                stop_criteria=stop_criteria,
+                                retry_statuses=() if last else retry.statuses,
+                            )
+                        elif hedged:
+                            resp = await hedge.fetch(fetch, acquire=acquire)
+                        else:
+                            resp = await fetch()
+                    except retry.exceptions:
+                        api_limiter.record(time.monotonic() - start, error=True)
+                        raise
+                    api_limiter.record(time.monotonic() - start, status=resp.status)
+            except retry.exceptions as exc:
+                if last:
+                    raise
+                delay = retry.delay(attempt)
+                reason = repr(exc)
+            else:
+                if last or resp.status not in retry.statuses:
+                    break
+                delay = retry.delay(attempt, resp.header.get("Retry-After"))
+                reason = f"Status {resp.status}"
 
-        async with api_semaphore:
+            if self.verbose:
+                log.info(f"Url {self.url}, {reason}, retrying in {delay:.2f}s")
 
-            with async_timeout.timeout(FETCH_TIMEOUT):
-                async with ClientSession() as session:
+            await asyncio.sleep(delay)
 
-                    async with session.request(**request_args) as response:
+        if streaming:
+            return self
 
-                        json = await response.json()
-                        byte_vals = await response.read()
-                        text = await response.text()
+        self._receive(resp, stop_criteria)
 
-                        resp = Response(
-                            method=response.method,
-                            url=response.url,
-                            cookies=response.cookies,
-                            status=response.status,
-                            json=json,
-                            byte_vals=byte_vals,
-                            text=text,
-                            encoding=response.get_encoding(),
-                            history=response.history,
-                            content_type=response.content_type,
-                            header=response.headers,
-                        )
+        if self.storage:
+            await self.save(limiter=storage_limiter)
 
-                        stop = stop_criteria(resp)
+        return self
 
-                        if stop == True:
-                            raise Exception
+    async def _stream(self, session, timeouts, storage_limiter, stop_criteria, retry_statuses):
+        # the body is written as it is read, so the total time is not limited
+        limits = timeouts.limits(request_host(self))
+        timeout = ClientTimeout(total=None, sock_connect=limits.connect, sock_read=limits.first_byte)
 
-                        self.response = self.mod_response(resp)
+        async with session.request(**self.request_args, timeout=timeout) as response:
+            resp = self._to_response(response)
 
-                        if self.verbose:
-                            log.info(
-                                f"Url {self.response.url}, Status {self.response.status}"
-                            )
+            # the body of a response that will be retried is not written
+            if resp.status not in retry_statuses:
+                self._receive(resp, stop_criteria)
+                await self.save_stream(response.content, limiter=storage_limiter)
 
-                        if self.storage:
+            return resp
 
-                            asyncio.ensure_future(
-                                self.save(
-                                    semaphore=storage_semaphore, rate=storage_rate_limit
-                                )
-                            )
+    async def save(self, limiter):
+        """
+        Saves the response from :meth:`~apollo.request.APIRequest.request`.
 
-                        await asyncio.sleep(api_rate_limit)
+        :type limiter: :class:`~apollo.utils.rate_limiter.Limiter`
+        :param limiter: Limits the rate and concurrency of saves. See :meth:`~apollo.utils.RateLimit.limiter`.
 
-                        return self
+        Storage errors are logged and kept in ``save_error`` rather than raised, so a failed save does not stop the run.
 
-    async def save(self, semaphore, rate):
+        :rtype: :class:`~apollo.request.APIRequest`
+        :returns: self 
         """
-        Saves the response from :meth:`~apollo.request.APIRequest.request`.
+        if self.storage_criteria(self) and self.storage and self.file_path:
+            async with limiter:
+                try:
+                    self.storage.write(file_path=self.file_path, data=self.response.text)
+                except Exception as exc:
+                    self.save_error = exc
+                    log.exception(f"Filepath {self.file_path} was not saved.")
+                    return self
+                if self.verbose:
+                    log.info(f"Filepath {self.file_path} was saved.")
 
-        :type semaphore: int
-        :param semaphore: Number of requests to be executed at "once"
+        return self
 
-        :type rate: int
-        :param rate: The speed with which responses should be saved.
+    async def save_stream(self, content, limiter):
+        """
+        Writes the body to :meth:`~apollo.storage.base.StorageBase.stream_writer` in chunks of ``chunk_size`` as it is read,
+        so memory is bounded by ``chunk_size`` rather than the size of the body. Used instead of
+        :meth:`~apollo.request.APIRequest.save` when ``stream_to_storage`` is True.
+
+        The body is not kept: ``response.byte_vals``, ``text`` and ``json`` are None, so ``file_pattern``, ``mod_response``,
+        ``stop_criteria`` and ``storage_criteria`` can only use the status, url and headers. As the body cannot be read
+        twice, errors while streaming fail the request.
+
+        :type content: `aiohttp.StreamReader <https://docs.aiohttp.org/en/stable/streams.html>`_
+        :param content: The body of the response.
+
+        :type limiter: :class:`~apollo.utils.rate_limiter.Limiter`
+        :param limiter: Limits the rate and concurrency of saves. See :meth:`~apollo.utils.RateLimit.limiter`.
 
         :rtype: :class:`~apollo.request.APIRequest`
-        :returns: self 
+        :returns: self
         """
-        async with semaphore:
-            if self.storage_criteria(self) and self.storage and self.file_path:
-                self.storage.write(file_path=self.file_path, data=self.response.text)
+        if self.storage_criteria(self) and self.storage and self.file_path:
+            async with limiter:
+                with self.storage.stream_writer(self.file_path) as writer:
+                    async for chunk in content.iter_chunked(self.chunk_size):
+                        writer.write(chunk)
                 if self.verbose:
                     log.info(f"Filepath {self.file_path} was saved.")
-                await asyncio.sleep(rate)
-            else:
-                pass
 
-            return self
+        return self
 
 
 
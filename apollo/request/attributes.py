@@ -9,8 +9,17 @@ import attr
 
 from apollo.builder.converters import ListConverter
 from apollo.builder.converters import DictConverter
+from apollo.builder.converters import Indexed
+from apollo.builder.converters import ffill_index
+from apollo.builder.converters import product_index
+from apollo.builder.converters import combined_len
+from apollo.builder.converters import expansion_len
+from apollo.builder.converters import is_dynamic
+
+from apollo.request.template import UrlTemplate
 
 from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
 
 
 
@@ -24,6 +33,9 @@ class Param(DictConverter):
     :type static: {'param': list}
     :param dynamic: Dynamic parameter
 
+    :type expand: str
+    :param expand: (Optional) How several dynamic keys are combined: ``'zip'`` forward-fills them together, ``'product'`` makes every combination of their values. Default is None, which allows a single dynamic key.
+
     :returns: List of dicts
 
     Example Usage:
@@ -43,16 +55,19 @@ class Param(DictConverter):
             f"{self.__class__.__name__}(static={self.static}, dynamic={self.dynamic})"
         )
 
-class Url(UserList):
+class Url(Indexed, UserList):
     """Builds Urls
 
     :type path_format: str
     :param path_format: String with possible formatting options
 
-    :type path_args: list, str, int
-    :param path_args: Arguments that correspond with the items in the path format.
+    :type path_args: list, range, generator, str, int
+    :param path_args: Arguments that correspond with the items in the path format. Lists, tuples, ranges and iterators are expanded, one value per Url.
+
+    :type expand: str
+    :param expand: (Optional) How the expanded arguments are combined: ``'zip'`` forward-fills them together, ``'product'`` makes every combination of their values. It can't be the name of an argument. Default is ``'zip'``.
 
-    :returns: List of Urls
+    :returns: Iterable of Urls, built on demand
 
     Example Usage:
 
@@ -68,12 +83,21 @@ class Url(UserList):
     
     #attr cannot do kwargs
 
-    def __init__(self, path_format, **path_args):
+    def __init__(self, path_format, expand = 'zip', **path_args):
+        if expand not in ('zip', 'product'):
+            raise ValueError(f"expand must be 'zip' or 'product'. You provided {expand!r}")
+
         self._path_format = path_format
         self._path_args = path_args
+        self._expand = expand
+        self._template = None
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(path_format={self.path_format}, dynamic={self.path_args})"
+        return f"{self.__class__.__name__}(path_format={self.path_format}, dynamic={self.path_args}, expand={self.expand})"
+
+    @property
+    def expand(self,):
+        return self._expand
 
     @property
     def path_format(self,):
@@ -84,22 +108,59 @@ class Url(UserList):
         return self._path_args
 
     @property
-    def data(self,):
+    def template(self,):
+        """The path format, parsed when the first Url is built.
+
+        :rtype: :class:`~apollo.request.template.UrlTemplate`
+        """
+        if self._template is None:
+            self._template = UrlTemplate(self.path_format, self.path_args)
+        return self._template
+
+    @property
+    def columns(self,):
+        return [v if is_dynamic(v) else [v] for v in self.path_args.values()]
+
+    def __iter__(self):
+        product = self.expand == 'product'
 
-        conv_to_list = lambda x: [y if isinstance(y, list) else [y] for y in x]
+        if self.path_args and self.template.compiled:
+            yield from self.template.render(self.path_args, product = product)
 
+        elif self.path_args:
+            keys = list(self.path_args.keys())
+            rows = zip_product(*self.columns) if product else zip_longest_ffill(*self.columns)
+            for b in rows:
+                yield self.path_format.format(**dict(zip(keys, b)))
+
+        else:
+            yield self.path_format
+
+    def __len__(self):
         if self.path_args:
+            return combined_len([expansion_len(c) for c in self.columns], self.expand)
+        return 1
 
-            zip_list = conv_to_list(self.path_args.values())
-            a = zip_longest_ffill(*zip_list)
-            vals = []
-            for b in a:
-                c = zip(self.path_args.keys(), b)
-                vals.append(self.path_format.format(**dict(c)))
-            return vals
+    def _item(self, index):
+        if not self.path_args:
+            return self.path_format
 
+        columns = self.columns
+        sizes = [len(c) for c in columns]
+        if self.expand == 'product':
+            indices = product_index(index, sizes)
         else:
-            return [self.path_format]
+            indices = [ffill_index(index, size) for size in sizes]
+
+        row = {k: [] if i is None else c[i] for k, c, i in zip(self.path_args, columns, indices)}
+
+        if self.template.compiled:
+            return self.template.format([row[k] for k in self.template.keys])
+        return self.path_format.format(**row)
+
+    @property
+    def data(self,):
+        return list(self)
 
 
 
@@ -112,6 +173,9 @@ class Cookie(DictConverter):
     :type static: {'param': list}
     :param dynamic: Dynamic cookie
 
+    :type expand: str
+    :param expand: (Optional) How several dynamic keys are combined: ``'zip'`` forward-fills them together, ``'product'`` makes every combination of their values. Default is None, which allows a single dynamic key.
+
     :returns: List of dicts
 
     Example Usage:
@@ -141,6 +205,9 @@ class Header(DictConverter):
     :type static: {'param': list}
     :param dynamic: Dynamic header
 
+    :type expand: str
+    :param expand: (Optional) How several dynamic keys are combined: ``'zip'`` forward-fills them together, ``'product'`` makes every combination of their values. Default is None, which allows a single dynamic key.
+
     :returns: List of dicts
 
     Example Usage:
@@ -214,6 +281,9 @@ class Data(DictConverter):
     :type static: {'param': list}
     :param dynamic: Dynamic data
 
+    :type expand: str
+    :param expand: (Optional) How several dynamic keys are combined: ``'zip'`` forward-fills them together, ``'product'`` makes every combination of their values. Default is None, which allows a single dynamic key.
+
     :returns: List of dicts
 
     Example Usage:
@@ -2,6 +2,7 @@
 #standard
 from pprint import pprint as p
 from collections import UserList
+import math
 import types
 
 #third party
@@ -12,11 +13,15 @@ from attr.validators import in_
 #local
 from apollo.builder.converters import DictConverter
 from apollo.builder.converters import ListConverter
+from apollo.builder.converters import Indexed
+from apollo.builder.converters import ffill_index
+from apollo.builder.converters import product_index
 
 from apollo.builder.exceptions import MethodError
 from apollo.builder.exceptions import WrongDataType
 
 from apollo.request.api_request import APIRequest
+from apollo.request.api_request import CHUNK_SIZE
 
 from apollo.request.attributes import Param
 from apollo.request.attributes import Param
@@ -31,9 +36,11 @@ from apollo.storage.base import StorageBase
 from apollo.utils import FilePattern
 from apollo.utils.helpers import HttpAcceptedTypes
 from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
+from apollo.utils.helpers import passthrough
 
 @attr.s
-class RequestFactory(UserList):
+class RequestFactory(Indexed, UserList):
 
     url = attr.ib(validator = instance_of(Url))
     method = attr.ib(default = 'GET', validator = in_(HttpAcceptedTypes.ACCEPTED_METHODS))
@@ -44,32 +51,64 @@ class RequestFactory(UserList):
     cookie = attr.ib(default = Cookie(), validator = instance_of(Cookie))
     zip_type = attr.ib(default = zip_longest_ffill, validator = instance_of(types.FunctionType))
     file_pattern = attr.ib(default = FilePattern(), validator = instance_of(FilePattern))
-    mod_response = attr.ib(default = lambda x: x, validator = instance_of(types.FunctionType))
+    mod_response = attr.ib(default = passthrough, validator = instance_of(types.FunctionType))
     storage = attr.ib(default = None, validator = instance_of((StorageBase, type(None))))
     verbose = attr.ib(default = False, validator = instance_of(bool))
+    stream_to_storage = attr.ib(default = False, validator = instance_of(bool))
+    chunk_size = attr.ib(default = CHUNK_SIZE, validator = instance_of(int))
 
     @property
-    def data(self):
+    def attributes(self):
+        return self.url, self.param, self.header, self.auth, self.req_data, self.cookie
 
-        zipped_request = self.zip_type(
-            self.url, self.param, self.header, self.auth, self.req_data, self.cookie
+    def _request(self, url, param, header, auth, data, cookie):
+        return APIRequest(
+            method=self.method,
+            url=url,
+            param=param,
+            header=header,
+            auth=auth if any(auth) else None, #None if there isn't auth
+            data=data,
+            cookie=cookie,
+            file_pattern=self.file_pattern,
+            mod_response=self.mod_response,
+            storage=self.storage,
+            verbose=self.verbose,
+            stream_to_storage=self.stream_to_storage,
+            chunk_size=self.chunk_size,
         )
 
-        requests = []
-
-        for url, param, header, auth, data, cookie in zipped_request:
-            r = APIRequest(
-                method=self.method,
-                url=url,
-                param=param,
-                header=header,
-                auth=auth if any(auth) else None, #None if there isn't auth
-                data=data,
-                cookie=cookie,
-                file_pattern=self.file_pattern,
-                mod_response=self.mod_response,
-                storage=self.storage,
-                verbose=self.verbose,
-            )
-            requests.append(r)
-        return requests
\ No newline at end of file
+    def __iter__(self):
+
+        zipped_request = self.zip_type(*self.attributes)
+
+        for row in zipped_request:
+            yield self._request(*row)
+
+    def __getitem__(self, index):
+        #other zip types can't tell which element of each attribute a request uses
+        if self.zip_type not in (zip_longest_ffill, zip_product):
+            return self.data[index]
+        return super().__getitem__(index)
+
+    def _item(self, index):
+        attributes = self.attributes
+        sizes = [len(attribute) for attribute in attributes]
+        if self.zip_type is zip_product:
+            indices = product_index(index, sizes)
+        else:
+            indices = [ffill_index(index, size) for size in sizes]
+        return self._request(*([] if i is None else a[i] for a, i in zip(attributes, indices)))
+
+    def __len__(self):
+        if self.zip_type is zip_longest_ffill:
+            return max(len(a) for a in self.attributes)
+        if self.zip_type is zip_product:
+            return math.prod(len(a) for a in self.attributes)
+
+        #other zip types are counted without building the requests
+        return sum(1 for _ in self.zip_type(*self.attributes))
+
+    @property
+    def data(self):
+        return list(self)
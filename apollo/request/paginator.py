@@ -0,0 +1,287 @@
+"""
+Paginators build the follow-up requests of a paginated API from each response. Set on :class:`~apollo.ApolloCB` with ``paginator``.
+"""
+#standard
+import re
+
+#third party
+import attr
+from attr.validators import instance_of
+from yarl import URL
+
+#local
+from apollo.request.api_request import Response
+
+
+LINK_NEXT = re.compile(r'<([^>]*)>[^,]*;\s*rel="?next"?')
+
+
+def lookup(body, path):
+    """Looks up a dotted path, such as ``'links.next'``, in a parsed JSON body.
+
+    :type body: dict or list
+    :param body: The parsed body.
+
+    :type path: str
+    :param path: Keys, or list indexes, separated by dots.
+
+    :returns: The value, or None if the path is missing.
+    """
+    for key in path.split('.'):
+        if isinstance(body, dict):
+            body = body.get(key)
+        elif isinstance(body, list) and key.isdigit() and int(key) < len(body):
+            body = body[int(key)]
+        else:
+            return None
+    return body
+
+
+@attr.s
+class Paginator:
+    """The base class of paginators. Inherit it and implement :meth:`~apollo.request.paginator.Paginator.next_requests` to paginate other APIs.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.request.paginator import Paginator
+
+        class NextPage(Paginator):
+            \"""Follows the ``next_page`` number until it is null\"""
+
+            def next_requests(self, request):
+                page = (self.body(request) or {}).get('next_page')
+                if page is None:
+                    return []
+                return [self.follow(request, param = {'page': page})]
+
+    """
+
+    def next_requests(self, request):
+        """Builds the follow-up requests of a completed request.
+
+        :type request: :class:`~apollo.request.APIRequest`
+        :param request: The completed request.
+
+        :rtype: list of :class:`~apollo.request.APIRequest`
+        :returns: The requests for the next pages, or an empty list on the last page.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def body(request):
+        """The parsed body of a successful response, or None.
+
+        :rtype: dict or list
+        """
+        response = request.response
+        if response.status is None or not 200 <= response.status < 300:
+            return None
+        try:
+            return response.json
+        except ValueError:
+            return None
+
+    @staticmethod
+    def fanned(request):
+        """True if the request was built by fanning out, so it has no next pages of its own.
+
+        :rtype: boolean
+        """
+        return bool((request.pagination or {}).get('fanned'))
+
+    @staticmethod
+    def follow(request, url=None, param=None, **state):
+        """Copies a request for another page.
+
+        :type request: :class:`~apollo.request.APIRequest`
+        :param request: The request to copy.
+
+        :type url: str
+        :param url: (Optional) The url of the next page. Params that are in its query string are dropped from ``param``.
+
+        :type param: dict
+        :param param: (Optional) Params updated for the next page.
+
+        :param state: (Optional) Kept in the ``pagination`` of the copy, e.g. ``fanned = True``.
+
+        :rtype: :class:`~apollo.request.APIRequest`
+        """
+        params = dict(request.param)
+
+        if url is not None:
+            query = URL(url).query
+            params = {k: v for k, v in params.items() if k not in query}
+
+        params.update(param or {})
+
+        return attr.evolve(
+            request,
+            url = url or request.url,
+            param = params,
+            response = Response(),
+            save_error = None,
+            pagination = {**(request.pagination or {}), **state, 'origin': request.origin},
+        )
+
+
+@attr.s
+class PageNumber(Paginator):
+    """Requests the next page number until the last page.
+
+    The last page is the one numbered ``total_pages``, or the first one with no ``items``. Once ``total_pages`` is known,
+    all the remaining pages are requested at once, to run concurrently, unless ``fan_out`` is False.
+
+    :type param: str
+    :param param: (Optional) The page number param. Default is ``'page'``.
+
+    :type start: int
+    :param start: (Optional) The number of the first page, used when the request has no ``param``. Default is 1.
+
+    :type total_pages: str
+    :param total_pages: (Optional) Dotted path to the number of pages in the body, e.g. ``'total_pages'``.
+
+    :type items: str
+    :param items: (Optional) Dotted path to the list of items in the body. Defaults to the body itself.
+
+    :type fan_out: boolean
+    :param fan_out: (Optional) Set False to request one page at a time even when ``total_pages`` is known.
+
+    """
+    param = attr.ib(default = 'page', validator = instance_of(str))
+    start = attr.ib(default = 1, validator = instance_of(int))
+    total_pages = attr.ib(default = None, validator = instance_of((str, type(None))))
+    items = attr.ib(default = None, validator = instance_of((str, type(None))))
+    fan_out = attr.ib(default = True, validator = instance_of(bool))
+
+    def next_requests(self, request):
+        body = self.body(request)
+        if body is None or self.fanned(request):
+            return []
+
+        page = int(request.param.get(self.param, self.start))
+        total = lookup(body, self.total_pages) if self.total_pages else None
+
+        if total is not None:
+            if page >= int(total):
+                return []
+            if self.fan_out:
+                return [self.follow(request, param = {self.param: n}, fanned = True) for n in range(page + 1, int(total) + 1)]
+        elif not (lookup(body, self.items) if self.items else body):
+            return []
+
+        return [self.follow(request, param = {self.param: page + 1})]
+
+
+@attr.s
+class Offset(Paginator):
+    """Requests the next offset until there are no more items.
+
+    The next offset is read from ``next_offset``, or is the current offset plus the number of ``items``. When the body
+    has the ``total`` number of items, all the remaining offsets are requested at once, to run concurrently, unless ``fan_out`` is False.
+
+    :type param: str
+    :param param: (Optional) The offset param. Default is ``'start'``.
+
+    :type next_offset: str
+    :param next_offset: (Optional) Dotted path to the next offset in the body, e.g. ``'additional_data.pagination.next_start'``.
+
+    :type more: str
+    :param more: (Optional) Dotted path to a boolean in the body which is false on the last page, e.g. ``'additional_data.pagination.more_items_in_collection'``.
+
+    :type items: str
+    :param items: (Optional) Dotted path to the list of items in the body. Defaults to the body itself.
+
+    :type total: str
+    :param total: (Optional) Dotted path to the total number of items in the body, e.g. ``'total_entries'``.
+
+    :type fan_out: boolean
+    :param fan_out: (Optional) Set False to request one offset at a time even when ``total`` is known.
+
+    """
+    param = attr.ib(default = 'start', validator = instance_of(str))
+    next_offset = attr.ib(default = None, validator = instance_of((str, type(None))))
+    more = attr.ib(default = None, validator = instance_of((str, type(None))))
+    items = attr.ib(default = None, validator = instance_of((str, type(None))))
+    total = attr.ib(default = None, validator = instance_of((str, type(None))))
+    fan_out = attr.ib(default = True, validator = instance_of(bool))
+
+    def next_requests(self, request):
+        body = self.body(request)
+        if body is None or self.fanned(request):
+            return []
+
+        if self.more and not lookup(body, self.more):
+            return []
+
+        current = int(request.param.get(self.param, 0))
+
+        if self.next_offset:
+            offset = lookup(body, self.next_offset)
+        else:
+            items = lookup(body, self.items) if self.items else body
+            offset = current + len(items) if items else None
+
+        if offset is None:
+            return []
+
+        total = lookup(body, self.total) if self.total else None
+
+        if self.fan_out and total is not None and int(offset) > current:
+            return [
+                self.follow(request, param = {self.param: n}, fanned = True)
+                for n in range(int(offset), int(total), int(offset) - current)
+            ]
+
+        return [self.follow(request, param = {self.param: offset})]
+
+
+@attr.s
+class Cursor(Paginator):
+    """Requests the next cursor until the body has none.
+
+    :type param: str
+    :param param: (Optional) The cursor param. Default is ``'cursor'``.
+
+    :type cursor: str
+    :param cursor: (Optional) Dotted path to the next cursor in the body. Default is ``'next_cursor'``.
+
+    """
+    param = attr.ib(default = 'cursor', validator = instance_of(str))
+    cursor = attr.ib(default = 'next_cursor', validator = instance_of(str))
+
+    def next_requests(self, request):
+        body = self.body(request)
+        cursor = lookup(body, self.cursor) if body is not None else None
+
+        if not cursor:
+            return []
+
+        return [self.follow(request, param = {self.param: cursor})]
+
+
+@attr.s
+class Link(Paginator):
+    """Requests the url of the next page until there is none.
+
+    :type next: str
+    :param next: (Optional) Dotted path to the url of the next page in the body, e.g. ``'links.next'``. If not given, the ``rel="next"`` url of the ``Link`` header is used.
+
+    """
+    next = attr.ib(default = None, validator = instance_of((str, type(None))))
+
+    def next_requests(self, request):
+        if self.next:
+            body = self.body(request)
+            url = lookup(body, self.next) if body is not None else None
+        elif 200 <= (request.response.status or 0) < 300:
+            match = LINK_NEXT.search((request.response.header or {}).get('Link', ''))
+            url = match.group(1) if match else None
+        else:
+            url = None
+
+        if not url:
+            return []
+
+        return [self.follow(request, url = url)]
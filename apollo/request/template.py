@@ -0,0 +1,141 @@
+#standard
+import string
+
+#local
+from apollo.builder.converters import is_dynamic
+from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
+
+
+CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+
+def stringify(conversion, spec):
+    """The function turning a value into the text of a field, as `str.format <https://docs.python.org/3/library/stdtypes.html#str.format>`_ would.
+
+    :type conversion: str or None
+    :param conversion: ``'s'``, ``'r'``, ``'a'`` or None, as in ``{field!r}``.
+
+    :type spec: str
+    :param spec: The format spec, as in ``{field:>08}``.
+
+    :rtype: callable
+    """
+    convert = CONVERSIONS.get(conversion)
+
+    if not spec:
+        return convert or str
+    if convert is None:
+        return lambda value: format(value, spec)
+    return lambda value: format(convert(value), spec)
+
+
+class UrlTemplate:
+    """A :class:`~apollo.request.attributes.Url` path format parsed once, with its scalar arguments filled in.
+
+    Urls are rendered by joining the literal segments with the text of the dynamic arguments, rather than by
+    calling ``str.format`` with a new dict for each Url. Fields with attributes, indexes or nested specs,
+    e.g. ``{a.b}``, ``{a[0]}`` or ``{a:{b}}``, and fields of an argument that is formatted in two ways are
+    left to ``str.format``.
+
+    :type path_format: str
+    :param path_format: String with possible formatting options
+
+    :type path_args: dict
+    :param path_args: Arguments that correspond with the items in the path format.
+
+    """
+
+    def __init__(self, path_format, path_args):
+        self.path_format = path_format
+        self.keys = [k for k, v in path_args.items() if is_dynamic(v)]
+        self.static = {k: v for k, v in path_args.items() if not is_dynamic(v)}
+        self.parts, self.slots = self._compile()
+
+    @property
+    def compiled(self):
+        """False if the path format is left to ``str.format``.
+
+        :rtype: boolean
+        """
+        return self.parts is not None
+
+    def _compile(self):
+        #literal segments, with None where a dynamic argument goes
+        parts = ['']
+        #(index in parts, index in keys, stringify)
+        slots = []
+        fields = {}
+
+        for literal, field, spec, conversion in string.Formatter().parse(self.path_format):
+            parts[-1] += literal
+
+            if field is None:
+                continue
+
+            known = field in self.keys or field in self.static
+            if (
+                not (known and field.isidentifier())
+                or conversion not in (None, *CONVERSIONS)
+                or '{' in spec
+                or fields.get(field, (conversion, spec)) != (conversion, spec)
+            ):
+                return None, None
+            fields[field] = (conversion, spec)
+
+            fn = stringify(conversion, spec)
+            if field in self.static:
+                parts[-1] += fn(self.static[field])
+            else:
+                slots.append((len(parts), self.keys.index(field), fn))
+                parts.extend([None, ''])
+
+        return parts, slots
+
+    def format(self, values):
+        """Renders one Url.
+
+        :type values: sequence
+        :param values: The values of the dynamic arguments, in the order of ``keys``.
+
+        :rtype: str
+        """
+        buf = list(self.parts)
+        for pos, i, fn in self.slots:
+            buf[pos] = fn(values[i])
+        return ''.join(buf)
+
+    def render(self, path_args, product = False):
+        """Renders the Urls of the arguments, forward-filling the shorter ones.
+
+        :type path_args: dict
+        :param path_args: The arguments the template was compiled with. Iterators are consumed.
+
+        :type product: boolean
+        :param product: (Optional) Set True to render every combination of the arguments instead.
+
+        :returns: generator of str
+        """
+        columns = [path_args[k] for k in self.keys]
+        buf = list(self.parts)
+        cnt = 0
+
+        if len(columns) == 1 and len(self.slots) == 1:
+            (pos, _, fn), = self.slots
+            for text in map(fn, columns[0]):
+                buf[pos] = text
+                cnt += 1
+                yield ''.join(buf)
+        else:
+            rows = zip_product(*columns) if product else zip_longest_ffill(*columns)
+            for row in rows:
+                for pos, i, fn in self.slots:
+                    buf[pos] = fn(row[i])
+                cnt += 1
+                yield ''.join(buf)
+
+        #scalar arguments give one forward-filled Url even when the dynamic ones are empty
+        if cnt == 0 and self.static and not product:
+            for pos, _, fn in self.slots:
+                buf[pos] = fn([])
+            yield ''.join(buf)
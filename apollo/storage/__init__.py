@@ -1 +1,2 @@
 from apollo.storage.google_cloud import CloudStorageClient
+from apollo.storage.local import LocalStorage
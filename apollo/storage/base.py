@@ -1,3 +1,8 @@
+#standard
+from contextlib import contextmanager
+from io import BytesIO
+
+#local
 from apollo.storage.abstract import FileStorageABC
 
 
@@ -15,3 +20,25 @@ class StorageBase(FileStorageABC):
     def read(self, *args, **kwargs):
         # TODO
         pass
+
+    @contextmanager
+    def stream_writer(self, file_path):
+        """Opens ``file_path`` for writing in chunks. Used by :class:`~apollo.ApolloCB` when ``stream_to_storage`` is ``True``.
+
+        The default buffers every chunk and calls :meth:`~apollo.storage.base.StorageBase.write` once with the
+        whole body as bytes. Override it to write chunks as they arrive, so memory is bounded by the chunk size.
+
+        .. code-block:: python
+
+            with storage.stream_writer('path/file.json') as writer:
+                writer.write(b'{"a": ')
+                writer.write(b'1}')
+
+        :type file_path: str
+        :param file_path: The path to the file where the data will be written.
+
+        :returns: A file-like object with a ``write(bytes)`` method.
+        """
+        buffer = BytesIO()
+        yield buffer
+        self.write(file_path=file_path, data=buffer.getvalue())
@@ -166,3 +166,30 @@ class CloudStorageClient(StorageBase):
             content_type=_MEME_TYPES[self.content_type or content_type],
         )
         return
+
+    def stream_writer(self, file_path, chunk_size=None, content_type=None, bucket=None):
+        """Opens a Google Cloud Storage blob for writing in chunks. Data is sent as a resumable upload as it is written.
+
+        :type file_path: str
+        :param file_path: The path to the file where the data will be written
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) Bytes sent per upload request. Must be a multiple of 256 KB. Default is 40 MB.
+
+        :type content_type: str
+        :param content_type: The type of content being uploaded. Default is 'json'. Options are txt, csv, json, png, jpg
+
+        :type bucket: str
+        :param bucket: The name of the bucket. (Optional) if given in class instantiation.
+
+        :returns: `google.cloud.storage.fileio.BlobWriter <https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.fileio.BlobWriter>`_
+        """
+
+        bucket = self.client.get_bucket(self.bucket or bucket)
+        blob = Blob(file_path, bucket)
+
+        return blob.open(
+            "wb",
+            chunk_size=chunk_size,
+            content_type=_MEME_TYPES[self.content_type or content_type],
+        )
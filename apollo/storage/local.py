@@ -0,0 +1,79 @@
+#standard
+import os
+
+#third party
+import attr
+from attr.validators import instance_of
+
+#local
+from apollo.storage.base import StorageBase
+
+
+@attr.s
+class LocalStorage(StorageBase):
+    """Stores data on the local file system.
+
+    :type root: str
+    :param root: (Optional) Directory file paths are relative to. Default is the working directory.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.storage import LocalStorage
+
+        storage = LocalStorage(root = '/data/exports')
+
+    """
+
+    root = attr.ib(default = '.', converter = str)
+
+    def path(self, file_path):
+        """The full path of ``file_path``. Missing folders are created.
+
+        :type file_path: str
+        :param file_path: The path to the file, relative to ``root``. A leading ``/`` is ignored.
+
+        :rtype: str
+        """
+        path = os.path.join(self.root, str(file_path).lstrip('/'))
+        os.makedirs(os.path.dirname(path) or '.', exist_ok = True)
+        return path
+
+    def write(self, file_path, data):
+        """Writes data to a file.
+
+        :type file_path: str
+        :param file_path: The path to the file where the data will be written.
+
+        :type data: str or bytes
+        :param data: The data that will be written.
+
+        :returns: None
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        with open(self.path(file_path), 'wb') as f:
+            f.write(data)
+
+    def read(self, file_path):
+        """Reads a file.
+
+        :type file_path: str
+        :param file_path: The path to the file.
+
+        :returns: bytes
+        """
+        with open(os.path.join(self.root, str(file_path).lstrip('/')), 'rb') as f:
+            return f.read()
+
+    def stream_writer(self, file_path):
+        """Opens a file to write chunks to as they arrive.
+
+        :type file_path: str
+        :param file_path: The path to the file where the data will be written.
+
+        :returns: A file opened in ``wb`` mode.
+        """
+        return open(self.path(file_path), 'wb')
@@ -1,3 +1,14 @@
 from apollo.utils.helpers import FilePattern
 from apollo.utils.helpers import RateLimit
 from apollo.utils.helpers import FilePath
+from apollo.utils.helpers import ConnectionPool
+from apollo.utils.rate_limiter import TokenBucket
+from apollo.utils.helpers import Retry
+from apollo.utils.helpers import AdaptiveConcurrency
+from apollo.utils.helpers import Stats
+from apollo.utils.helpers import PartitionedRateLimit
+from apollo.utils.cache import ResponseCache
+from apollo.utils.journal import Journal
+from apollo.utils.quota import Quota
+from apollo.utils.helpers import Hedge
+from apollo.utils.helpers import Timeout
@@ -0,0 +1,183 @@
+#standard
+import json
+import sqlite3
+import time
+from collections import namedtuple
+
+#third party
+from multidict import CIMultiDict
+from multidict import CIMultiDictProxy
+
+
+CachedResponse = namedtuple('CachedResponse', ['status', 'header', 'byte_vals', 'encoding', 'content_type'])
+
+
+class ResponseCache:
+    """An on-disk cache of responses for conditional requests, kept in a `sqlite3 <https://docs.python.org/3/library/sqlite3.html>`_ file.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are stored with their body. The next request for the same
+    method, url and params sends ``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified`` answer is served
+    from the store. Once the stored bodies take more than ``max_size`` bytes, the least recently used are evicted.
+
+    :type path: str
+    :param path: The sqlite file. Created if it does not exist.
+
+    :type max_size: int
+    :param max_size: (Optional) The most bytes of bodies stored. Default is 100 MB.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import ResponseCache
+
+        cache = ResponseCache('responses.sqlite', max_size = 2 ** 30)
+
+    """
+
+    def __init__(self, path, max_size=100 * 2 ** 20):
+        if max_size <= 0:
+            raise ValueError(f"The max_size must be over 0. You provided {max_size}")
+
+        self.path = path
+        self.max_size = max_size
+        self._connection = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
+
+    @property
+    def connection(self):
+        """The sqlite connection, opened on first use.
+
+        :rtype: `sqlite3.Connection <https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection>`_
+        """
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    status INTEGER,
+                    header TEXT,
+                    byte_vals BLOB,
+                    encoding TEXT,
+                    content_type TEXT,
+                    size INTEGER,
+                    accessed INTEGER
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS accessed ON responses (accessed)")
+        return self._connection
+
+    def close(self):
+        """Closes the sqlite connection. It is opened again when next used."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @property
+    def size(self):
+        """The bytes of bodies stored.
+
+        :rtype: int
+        """
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key):
+        """The stored response of a key, marked as recently used.
+
+        :type key: str
+        :param key: See :attr:`~apollo.request.APIRequest.cache_key`.
+
+        :rtype: :class:`~apollo.utils.cache.CachedResponse` or None
+        """
+        row = self.connection.execute(
+            "SELECT status, header, byte_vals, encoding, content_type FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        with self.connection:
+            self.connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time_ns(), key))
+
+        status, header, byte_vals, encoding, content_type = row
+        return CachedResponse(
+            status=status,
+            header=CIMultiDictProxy(CIMultiDict(json.loads(header))),
+            byte_vals=byte_vals,
+            encoding=encoding,
+            content_type=content_type,
+        )
+
+    @staticmethod
+    def validators(cached):
+        """The conditional headers to send for a stored response.
+
+        :type cached: :class:`~apollo.utils.cache.CachedResponse`
+        :param cached: The stored response.
+
+        :rtype: dict
+        """
+        headers = {}
+        if 'ETag' in cached.header:
+            headers['If-None-Match'] = cached.header['ETag']
+        if 'Last-Modified' in cached.header:
+            headers['If-Modified-Since'] = cached.header['Last-Modified']
+        return headers
+
+    def put(self, key, response):
+        """Stores a response if it has an ``ETag`` or ``Last-Modified`` header and fits, then evicts the least recently used beyond ``max_size``.
+
+        :type key: str
+        :param key: See :attr:`~apollo.request.APIRequest.cache_key`.
+
+        :type response: :class:`~apollo.request.Response`
+        :param response: The response to store.
+
+        :rtype: boolean
+        :returns: True if the response was stored.
+        """
+        header = response.header or {}
+        size = len(response.byte_vals or b'')
+
+        if not ('ETag' in header or 'Last-Modified' in header) or size > self.max_size:
+            return False
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status,
+                    json.dumps(list(header.items())),
+                    response.byte_vals,
+                    response.encoding,
+                    response.content_type,
+                    size,
+                    time.time_ns(),
+                ),
+            )
+            self._evict()
+        return True
+
+    def _evict(self):
+        excess = self.size - self.max_size
+        if excess <= 0:
+            return
+
+        rows = self.connection.execute("SELECT key, size FROM responses ORDER BY accessed")
+        evicted = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        self.connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
@@ -0,0 +1,116 @@
+#standard
+import asyncio
+import time
+
+#local
+from apollo.utils.latency import LatencyWindow
+
+
+class Hedger:
+    """Sends a duplicate of a call that is slower than usual and keeps whichever answers first. Created by :meth:`~apollo.utils.Hedge.hedger` for one run.
+
+    The duplicate is sent once the call has taken ``delay`` seconds, or the ``percentile`` of the latencies
+    observed so far once there are ``min_samples`` of them. At most ``budget`` of the calls are duplicated.
+    The call that answers last is cancelled, which closes its connection.
+
+    :type delay: float or None
+    :param delay: Seconds after which a duplicate is sent. If None, the observed ``percentile`` is used.
+
+    :type percentile: float
+    :param percentile: The percentile of the observed latencies after which a duplicate is sent.
+
+    :type budget: float
+    :param budget: The fraction of calls that may be duplicated.
+
+    :type min_samples: int
+    :param min_samples: The latencies observed before ``percentile`` is used. No duplicates are sent before then.
+
+    :type methods: tuple of str
+    :param methods: The methods hedged.
+
+    :type window: int
+    :param window: The number of latest latencies ``percentile`` is taken from.
+
+    """
+
+    def __init__(self, delay=None, percentile=95, budget=0.05, min_samples=20, methods=('GET', 'HEAD'), window=1000):
+        self._delay = delay
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.methods = methods
+        self.latencies = LatencyWindow(window)
+        self.calls = 0
+        self.hedged = 0
+        self.won = 0
+
+    @property
+    def delay(self):
+        """Seconds after which a duplicate is sent, or None while too few latencies were observed.
+
+        :rtype: float or None
+        """
+        if self._delay is not None:
+            return self._delay
+
+        if len(self.latencies) < self.min_samples:
+            return None
+
+        return self.latencies.percentile(self.percentile)
+
+    async def _timed(self, call, acquire=None):
+        if acquire is not None:
+            await acquire()
+        start = time.monotonic()
+        result = await call()
+        self.latencies.observe(time.monotonic() - start)
+        return result
+
+    async def fetch(self, call, acquire=None):
+        """Makes a call, and a duplicate of it if it is slow and the budget allows.
+
+        :type call: coroutine function
+        :param call: Makes the call. Called again for the duplicate.
+
+        :type acquire: coroutine function
+        :param acquire: (Optional) Awaited before the duplicate is sent, e.g. to take a rate limit token.
+
+        :returns: The result of the call that answered first. If both fail, the exception of the first is raised.
+        """
+        self.calls += 1
+        delay = self.delay
+        first = asyncio.ensure_future(self._timed(call))
+
+        if delay is None:
+            return await first
+
+        try:
+            done, _ = await asyncio.wait([first], timeout=delay)
+        except asyncio.CancelledError:
+            first.cancel()
+            raise
+
+        if done or self.hedged >= self.budget * self.calls:
+            return await first
+
+        self.hedged += 1
+        second = asyncio.ensure_future(self._timed(call, acquire))
+        pending = {first, second}
+        error = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (first, second):
+                    if task not in done:
+                        continue
+                    if task.exception() is None:
+                        self.won += task is second
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
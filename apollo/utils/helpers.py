@@ -1,29 +1,169 @@
 #standard
+import asyncio
+import multiprocessing
+import os
+import random
+import re
+import tempfile
+import time
+import types
 from collections import namedtuple
+from collections.abc import Iterator
+from itertools import chain
+from itertools import repeat
 from collections import UserString
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 
 #third party
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from aiohttp import TCPConnector
+from yarl import URL
+
 import attr
 from attr.validators import instance_of
 from attr.validators import in_
 
 #local
 from apollo.builder.exceptions import WrongDataType
+from apollo.utils.rate_limiter import TokenBucket
+from apollo.utils.rate_limiter import SharedTokenBucket
+from apollo.utils.rate_limiter import FileState
+from apollo.utils.rate_limiter import Limiter
+from apollo.utils.rate_limiter import AdaptiveLimiter
+from apollo.utils.rate_limiter import PartitionedLimiter
+from apollo.utils.hedge import Hedger
+from apollo.utils.timeout import Timeouts
+from apollo.utils.timeout import AdaptiveTimeouts
+
+
+@attr.s
+class AdaptiveConcurrency:
+    """Lets the concurrency of a :class:`~apollo.utils.RateLimit` adapt to the API: additive increase while calls are
+    healthy, multiplicative decrease on errors, throttling statuses or latency spikes. See :class:`~apollo.utils.rate_limiter.AdaptiveLimiter`.
+
+    :type minimum: int
+    :param minimum: The lowest concurrency.
+
+    :type maximum: int
+    :param maximum: The highest concurrency.
+
+    :type increase: int
+    :param increase: Added to the concurrency every time that many healthy calls complete.
+
+    :type decrease: float
+    :param decrease: The concurrency is multiplied by it when calls are unhealthy. Between 0 and 1.
+
+    :type latency_tolerance: float
+    :param latency_tolerance: Calls slower than the average latency times this are unhealthy.
+
+    :type statuses: tuple of int
+    :param statuses: Response statuses that are unhealthy.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import RateLimit
+        from apollo.utils import AdaptiveConcurrency
 
+        api_rate_limit = RateLimit(
+            rate = 1,
+            limit = 50,
+            concurrency = 5,
+            adaptive = AdaptiveConcurrency(minimum = 1, maximum = 50),
+        )
+
+    """
+    minimum = attr.ib(default = 1, converter = int)
+    maximum = attr.ib(default = 100, converter = int)
+    increase = attr.ib(default = 1, converter = int)
+    decrease = attr.ib(default = 0.5, converter = float)
+    latency_tolerance = attr.ib(default = 2.0, converter = float)
+    statuses = attr.ib(default = (429, 500, 502, 503, 504), converter = tuple)
+
+    @minimum.validator
+    def _(self, attribute, value):
+        if value <= 0:
+            raise ValueError(f"The minimum must be over 0. You provided {value}")
+
+    @maximum.validator
+    def _(self, attribute, value):
+        if value < self.minimum:
+            raise ValueError(f"The maximum must be at least the minimum. You provided {value}")
+
+    @decrease.validator
+    def _(self, attribute, value):
+        if not 0 < value < 1:
+            raise ValueError(f"The decrease must be between 0 and 1. You provided {value}")
 
 @attr.s
 class RateLimit:
     """Sets the storage and API rate limits for :class:`~apollo.ApolloCB`.
 
-    :type rate: int
-    :param rate: The speed with which :class:`~apollo.ApolloCB` executes requests (in seconds).
+    ``limit`` calls are allowed every ``rate`` seconds, enforced by a :class:`~apollo.utils.rate_limiter.TokenBucket`.
+    The sustained rate does not depend on how long the calls take. The number of calls in flight is limited
+    separately by ``concurrency``.
+
+    :type rate: int or float
+    :param rate: The period, in seconds, in which ``limit`` calls are allowed.
 
     :type limit: int
-    :param limit: The number of requests to be executed at one time.
+    :param limit: The number of calls allowed every ``rate`` seconds.
+
+    :type burst: int
+    :param burst: (Optional) The number of calls that may start at once before the sustained rate applies. Defaults to ``limit``.
+
+    :type concurrency: int
+    :param concurrency: (Optional) The number of calls in flight at one time. Defaults to ``limit``.
+
+    :type adaptive: :class:`~apollo.utils.AdaptiveConcurrency`
+    :param adaptive: (Optional) Adapts the concurrency to the API, starting from ``concurrency``.
+
+    :type key: str
+    :param key: (Optional) Shares the budget with every process on the host using the same ``key``, through a file in ``directory``. Use the same ``rate``, ``limit`` and ``burst`` with the same key. The concurrency is not shared.
+
+    :type directory: str
+    :param directory: (Optional) Where the files of shared budgets are kept. Default is the temporary directory.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import RateLimit
+
+        #100 requests a minute, at most 10 in flight
+        api_rate_limit = RateLimit(
+            rate = 60,
+            limit = 100,
+            concurrency = 10,
+        )
+
+        #shared by every ApolloCB on the host calling the same Pipedrive account
+        api_rate_limit = RateLimit(
+            rate = 2,
+            limit = 80,
+            key = 'pipedrive',
+        )
 
     """
-    rate = attr.ib(default = 5, converter = int)
+    rate = attr.ib(default = 5, converter = float)
     limit = attr.ib(default = 5, converter = int)
+    burst = attr.ib(converter = int)
+    concurrency = attr.ib(converter = int)
+    adaptive = attr.ib(default = None, validator = instance_of((AdaptiveConcurrency, type(None))))
+    key = attr.ib(default = None, validator = instance_of((str, type(None))))
+    directory = attr.ib(default = attr.Factory(tempfile.gettempdir), validator = instance_of(str))
+
+    @burst.default
+    def _(self,):
+        return self.limit
+
+    @concurrency.default
+    def _(self,):
+        return self.limit
 
     @rate.validator
     def _(self, attribute, value):
@@ -35,6 +175,511 @@ class RateLimit:
         if value <= 0:
             raise ValueError(f"The limit must be over 0. You provided {self.limit}")
 
+    @burst.validator
+    def _(self, attribute, value):
+        if value <= 0:
+            raise ValueError(f"The burst must be over 0. You provided {self.burst}")
+
+    @concurrency.validator
+    def _(self, attribute, value):
+        if value <= 0:
+            raise ValueError(f"The concurrency must be over 0. You provided {self.concurrency}")
+
+    @key.validator
+    def _(self, attribute, value):
+        if value is not None and not re.fullmatch(r'[\w.-]+', value):
+            raise ValueError(f"The key may only have letters, digits, '_', '.' and '-'. You provided {value}")
+
+    @property
+    def path(self):
+        """The file of the budget shared on the host, if ``key`` is given.
+
+        :rtype: str
+        """
+        if self.key:
+            return os.path.join(self.directory, f"apollo-rate-limit-{self.key}")
+
+    def shared_state(self,):
+        """Creates the state of a budget shared by processes: a file shared by the host if ``key`` is given, otherwise
+        shared memory for the processes started by this one. See :class:`~apollo.utils.rate_limiter.SharedTokenBucket`.
+
+        :rtype: `multiprocessing.Value <https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Value>`_ or :class:`~apollo.utils.rate_limiter.FileState`
+        """
+        if self.key:
+            return FileState(self.path)
+        return multiprocessing.Value('d', SharedTokenBucket.UNSET)
+
+    def bucket(self, state=None):
+        """Creates a new token bucket enforcing ``limit`` calls every ``rate`` seconds.
+
+        :type state: `multiprocessing.Value <https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Value>`_
+        :param state: (Optional) From :meth:`~apollo.utils.RateLimit.shared_state`, to share the budget with other processes.
+
+        :rtype: :class:`~apollo.utils.rate_limiter.TokenBucket` or :class:`~apollo.utils.rate_limiter.SharedTokenBucket`
+        """
+        if state is None and self.key:
+            state = self.shared_state()
+
+        if isinstance(state, FileState):
+            # the file outlives the monotonic clock, which restarts with the host
+            return SharedTokenBucket(rate = self.limit, state = state, per = self.rate, burst = self.burst, clock = time.time)
+        if state is not None:
+            return SharedTokenBucket(rate = self.limit, state = state, per = self.rate, burst = self.burst)
+        return TokenBucket(rate = self.limit, per = self.rate, burst = self.burst)
+
+    @property
+    def max_concurrency(self):
+        """The most calls that can be in flight at one time.
+
+        :rtype: int
+        """
+        if self.adaptive:
+            return self.adaptive.maximum
+        return self.concurrency
+
+    def limiter(self, state=None):
+        """Creates a new limiter for one run. Must be called from within a running event loop.
+
+        :type state: `multiprocessing.Value <https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Value>`_
+        :param state: (Optional) From :meth:`~apollo.utils.RateLimit.shared_state`, to share the budget with other processes. The concurrency is not shared.
+
+        :rtype: :class:`~apollo.utils.rate_limiter.Limiter` or :class:`~apollo.utils.rate_limiter.AdaptiveLimiter`
+        """
+        if self.adaptive:
+            return AdaptiveLimiter(
+                bucket = self.bucket(state),
+                concurrency = self.concurrency,
+                minimum = self.adaptive.minimum,
+                maximum = self.adaptive.maximum,
+                increase = self.adaptive.increase,
+                decrease = self.adaptive.decrease,
+                latency_tolerance = self.adaptive.latency_tolerance,
+                statuses = self.adaptive.statuses,
+            )
+        return Limiter(bucket = self.bucket(state), concurrency = self.concurrency)
+
+def request_host(request):
+    """Partitions requests by the host of their url. The default key of :class:`~apollo.utils.PartitionedRateLimit`.
+
+    :type request: :class:`~apollo.request.APIRequest`
+    :param request: The request to partition.
+
+    :rtype: str
+    """
+    return URL(request.url).host
+
+@attr.s
+class PartitionedRateLimit:
+    """Gives each partition of the API calls of :class:`~apollo.ApolloCB` its own :class:`~apollo.utils.RateLimit`, so a
+    slow or strictly limited partition does not starve the others. Calls are partitioned by host unless ``key`` is given.
+
+    :type default: :class:`~apollo.utils.RateLimit`
+    :param default: (Optional) The rate limit of partitions not in ``partitions``. Each partition gets its own budget.
+
+    :type partitions: dict
+    :param partitions: (Optional) Rate limits of specific partitions, by partition.
+
+    :type key: callable
+    :param key: (Optional) Any function that accepts :class:`~apollo.request.APIRequest` and returns its partition. Default is :func:`~apollo.utils.helpers.request_host`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import RateLimit
+        from apollo.utils import PartitionedRateLimit
+
+        api_rate_limit = PartitionedRateLimit(
+            default = RateLimit(rate = 1, limit = 10),
+            partitions = {
+                'slow.example.com': RateLimit(rate = 1, limit = 1),
+            },
+        )
+
+    """
+    default = attr.ib(default = attr.Factory(RateLimit), validator = instance_of(RateLimit))
+    partitions = attr.ib(default = attr.Factory(dict), validator = instance_of(dict))
+    key = attr.ib(default = request_host)
+
+    @key.validator
+    def _(self, attribute, value):
+        if not callable(value):
+            raise WrongDataType(value, types.FunctionType)
+
+    def rate_limit(self, partition):
+        """The rate limit of a partition.
+
+        :rtype: :class:`~apollo.utils.RateLimit`
+        """
+        return self.partitions.get(partition, self.default)
+
+    def limiter(self,):
+        """Creates a new limiter for one run, which creates the limiter of each partition when first used. Must be called from within a running event loop.
+
+        :rtype: :class:`~apollo.utils.rate_limiter.PartitionedLimiter`
+        """
+        return PartitionedLimiter(factory = lambda partition: self.rate_limit(partition).limiter())
+
+@attr.s
+class ConnectionPool:
+    """Configures the connection pool shared by every request of an :class:`~apollo.ApolloCB` run.
+
+    One `aiohttp.ClientSession <https://docs.aiohttp.org/en/stable/client_reference.html#client-session>`_ is opened per run,
+    so connections, TLS sessions and DNS lookups are reused across requests instead of being paid for on every call.
+
+    :type limit: int
+    :param limit: The total number of simultaneous connections. ``0`` means no limit.
+
+    :type limit_per_host: int
+    :param limit_per_host: The number of simultaneous connections to the same host. ``0`` means no limit.
+
+    :type keepalive_timeout: int or float
+    :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+
+    :type ttl_dns_cache: int or None
+    :param ttl_dns_cache: Seconds a resolved host is cached. ``None`` caches for the whole run.
+
+    """
+    limit = attr.ib(default = 100, converter = int)
+    limit_per_host = attr.ib(default = 0, converter = int)
+    keepalive_timeout = attr.ib(default = 15, converter = float)
+    ttl_dns_cache = attr.ib(default = 10, converter = attr.converters.optional(int))
+
+    @limit.validator
+    def _(self, attribute, value):
+        if value < 0:
+            raise ValueError(f"The limit must be 0 or over. You provided {value}")
+
+    @limit_per_host.validator
+    def _(self, attribute, value):
+        if value < 0:
+            raise ValueError(f"The limit_per_host must be 0 or over. You provided {value}")
+
+    def connector(self):
+        """Creates the pooled connector. Must be called from within a running event loop.
+
+        :rtype: `aiohttp.TCPConnector <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.TCPConnector>`_
+        """
+        return TCPConnector(
+            limit = self.limit,
+            limit_per_host = self.limit_per_host,
+            keepalive_timeout = self.keepalive_timeout,
+            ttl_dns_cache = self.ttl_dns_cache,
+            use_dns_cache = True,
+        )
+
+    def session(self):
+        """Creates a session that owns a pooled connector. Must be called from within a running event loop.
+
+        :rtype: `aiohttp.ClientSession <https://docs.aiohttp.org/en/stable/client_reference.html#client-session>`_
+        """
+        return ClientSession(connector = self.connector())
+
+@attr.s
+class Timeout:
+    """Sets how long the calls of an :class:`~apollo.ApolloCB` may take, per phase, for every host or for some hosts.
+
+    A call that takes too long raises ``asyncio.TimeoutError``, which :class:`~apollo.utils.Retry` retries by default,
+    and releases its concurrency slot. With ``adaptive``, the ``first_byte`` and ``total`` timeouts of each host are
+    derived from the latencies observed in the run: once ``min_samples`` calls to the host completed, they are the
+    ``percentile`` of its latencies times ``multiplier``, no lower than ``minimum``. The configured timeouts remain the highest.
+
+    :type connect: int or float or None
+    :param connect: Seconds to establish a connection. ``None`` means no limit. Default is 10.
+
+    :type first_byte: int or float or None
+    :param first_byte: Seconds from sending the request to its response headers, and between two reads of the body. ``None`` means no limit. Default is 10.
+
+    :type total: int or float or None
+    :param total: Seconds for the whole call, including reading the body. Not applied when the body is streamed to storage. ``None`` means no limit. Default is 60.
+
+    :type hosts: dict
+    :param hosts: (Optional) :class:`~apollo.utils.Timeout` of some hosts, by host. Their ``connect``, ``first_byte`` and ``total`` are used for those hosts.
+
+    :type adaptive: boolean
+    :param adaptive: Set True to derive the timeouts of each host from its observed latencies.
+
+    :type percentile: int or float
+    :param percentile: The percentile of the observed latencies the adaptive timeouts are derived from. Default is 99.
+
+    :type multiplier: int or float
+    :param multiplier: The adaptive timeouts are the ``percentile`` times this. Default is 3.
+
+    :type minimum: int or float
+    :param minimum: The lowest adaptive timeout, in seconds. Default is 1.
+
+    :type min_samples: int
+    :param min_samples: The calls to a host that complete before its timeouts adapt. Default is 20.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import Timeout
+
+        timeout = Timeout(
+            connect = 5,
+            first_byte = 10,
+            adaptive = True,
+            hosts = {
+                'export.example.com': Timeout(first_byte = 300, total = None),
+            },
+        )
+
+    """
+    connect = attr.ib(default = 10, converter = attr.converters.optional(float))
+    first_byte = attr.ib(default = 10, converter = attr.converters.optional(float))
+    total = attr.ib(default = 60, converter = attr.converters.optional(float))
+    hosts = attr.ib(default = attr.Factory(dict), validator = instance_of(dict))
+    adaptive = attr.ib(default = False, validator = instance_of(bool))
+    percentile = attr.ib(default = 99, converter = float)
+    multiplier = attr.ib(default = 3, converter = float)
+    minimum = attr.ib(default = 1, converter = float)
+    min_samples = attr.ib(default = 20, converter = int)
+
+    @connect.validator
+    @first_byte.validator
+    @total.validator
+    def _(self, attribute, value):
+        if value is not None and value <= 0:
+            raise ValueError(f"The {attribute.name} timeout must be over 0 or None. You provided {value}")
+
+    @hosts.validator
+    def _(self, attribute, value):
+        for timeout in value.values():
+            if not isinstance(timeout, Timeout):
+                raise WrongDataType(timeout, Timeout)
+
+    @percentile.validator
+    def _(self, attribute, value):
+        if not 0 < value <= 100:
+            raise ValueError(f"The percentile must be over 0 and up to 100. You provided {value}")
+
+    def timeouts(self,):
+        """Creates the timeouts of one run, which adapt to the latencies of its calls when ``adaptive`` is True.
+
+        :rtype: :class:`~apollo.utils.timeout.Timeouts`
+        """
+        return AdaptiveTimeouts(self) if self.adaptive else Timeouts(self)
+
+@attr.s
+class Retry:
+    """Sets how :class:`~apollo.ApolloCB` retries failed requests.
+
+    A request is retried when the call raises one of ``exceptions`` or the response status is one of ``statuses``.
+    Retries wait for an exponential backoff with full jitter, or for the ``Retry-After`` header when the server sends one,
+    and then go back through the API :class:`~apollo.utils.RateLimit`. Once ``attempts`` are used up, the last
+    response is kept, or the last exception is raised.
+
+    :type attempts: int
+    :param attempts: The number of times a request is tried, including the first. ``1`` disables retries.
+
+    :type statuses: tuple of int
+    :param statuses: Response statuses that are retried.
+
+    :type exceptions: tuple of Exception
+    :param exceptions: Exceptions that are retried.
+
+    :type backoff: int or float
+    :param backoff: Seconds the backoff starts from. The n-th retry waits a random time up to ``backoff * 2 ** (n - 1)``.
+
+    :type max_backoff: int or float
+    :param max_backoff: The most seconds a backoff can wait. Does not limit ``Retry-After``.
+
+    :type retry_after: boolean
+    :param retry_after: Set False to ignore the ``Retry-After`` header.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import Retry
+
+        retry = Retry(
+            attempts = 5,
+            statuses = (429, 503),
+        )
+
+    """
+    attempts = attr.ib(default = 3, converter = int)
+    statuses = attr.ib(default = (429, 500, 502, 503, 504), converter = tuple)
+    exceptions = attr.ib(default = (ClientError, asyncio.TimeoutError), converter = tuple)
+    backoff = attr.ib(default = 0.5, converter = float)
+    max_backoff = attr.ib(default = 60, converter = float)
+    retry_after = attr.ib(default = True, validator = instance_of(bool))
+
+    @attempts.validator
+    def _(self, attribute, value):
+        if value <= 0:
+            raise ValueError(f"The attempts must be over 0. You provided {value}")
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Parses a ``Retry-After`` header, given in seconds or as an http date.
+
+        :type value: str or None
+        :param value: The header value.
+
+        :rtype: float or None
+        :returns: Seconds to wait, or None if the header is missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo = timezone.utc)
+        return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before the next attempt.
+
+        :type attempt: int
+        :param attempt: The attempt that failed, starting at 1.
+
+        :type retry_after: str or None
+        :param retry_after: (Optional) The ``Retry-After`` header of the failed response.
+
+        :rtype: float
+        """
+        if self.retry_after:
+            seconds = self.parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+@attr.s
+class Hedge:
+    """Sets how :class:`~apollo.ApolloCB` hedges slow calls to cut the tail latency of a run.
+
+    When a call of one of ``methods`` has not answered after ``delay`` seconds, or by default the ``percentile`` of the
+    latencies observed in the run, a duplicate is sent. Whichever answers first is kept and the other is cancelled.
+    The duplicate takes a token of the API :class:`~apollo.utils.RateLimit` and is charged to the ``quota``, and at
+    most ``budget`` of the calls of a run are duplicated, so the extra load is bounded.
+
+    :type delay: int or float
+    :param delay: (Optional) Seconds after which a duplicate is sent. Defaults to the observed ``percentile``.
+
+    :type percentile: int or float
+    :param percentile: The percentile of observed latencies after which a duplicate is sent. Default is 95.
+
+    :type budget: float
+    :param budget: The fraction of the calls of a run that may be duplicated. Default is 0.05.
+
+    :type min_samples: int
+    :param min_samples: The latencies observed before ``percentile`` is used. Calls are not hedged before then. Default is 20.
+
+    :type methods: tuple of str
+    :param methods: The methods hedged. Only idempotent methods should be. Default is GET and HEAD.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import Hedge
+
+        hedge = Hedge(percentile = 90, budget = 0.02)
+
+    """
+    delay = attr.ib(default = None, converter = attr.converters.optional(float))
+    percentile = attr.ib(default = 95, converter = float)
+    budget = attr.ib(default = 0.05, converter = float)
+    min_samples = attr.ib(default = 20, converter = int)
+    methods = attr.ib(default = ('GET', 'HEAD'), converter = tuple)
+
+    @delay.validator
+    def _(self, attribute, value):
+        if value is not None and value < 0:
+            raise ValueError(f"The delay must be 0 or over. You provided {value}")
+
+    @percentile.validator
+    def _(self, attribute, value):
+        if not 0 < value < 100:
+            raise ValueError(f"The percentile must be between 0 and 100. You provided {value}")
+
+    @budget.validator
+    def _(self, attribute, value):
+        if not 0 <= value <= 1:
+            raise ValueError(f"The budget must be between 0 and 1. You provided {value}")
+
+    @methods.validator
+    def _(self, attribute, value):
+        unsafe = set(value) - {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+        if unsafe:
+            raise ValueError(f"Only idempotent methods can be hedged. You provided {sorted(unsafe)}")
+
+    def hedger(self,):
+        """Creates a new hedger for one run, which observes the latencies of its calls.
+
+        :rtype: :class:`~apollo.utils.hedge.Hedger`
+        """
+        return Hedger(
+            delay = self.delay,
+            percentile = self.percentile,
+            budget = self.budget,
+            min_samples = self.min_samples,
+            methods = self.methods,
+        )
+
+@attr.s
+class Stats:
+    """Metrics of an :class:`~apollo.ApolloCB` run, available as ``ApolloCB.stats`` while and after it runs.
+
+    :type completed: int
+    :param completed: The number of requests completed.
+
+    :type concurrency: int
+    :param concurrency: The current API concurrency limit. Changes during the run with :class:`~apollo.utils.AdaptiveConcurrency`.
+
+    :type deduplicated: int
+    :param deduplicated: The number of calls saved by ``dedupe``: duplicate requests skipped, or coalesced into a call in flight.
+
+    :type resumed: int
+    :param resumed: The number of requests skipped because a previous run recorded them in the journal.
+
+    :type over_quota: int
+    :param over_quota: The number of requests not made because the :class:`~apollo.utils.Quota` was spent.
+
+    :type hedged: int
+    :param hedged: The number of duplicate calls sent by :class:`~apollo.utils.Hedge`.
+
+    :type hedges_won: int
+    :param hedges_won: The number of duplicate calls that answered first.
+
+    """
+    completed = attr.ib(default = 0)
+    concurrency = attr.ib(default = None)
+    deduplicated = attr.ib(default = 0)
+    resumed = attr.ib(default = 0)
+    over_quota = attr.ib(default = 0)
+    hedged = attr.ib(default = 0)
+    hedges_won = attr.ib(default = 0)
+
+    @classmethod
+    def total(cls, stats):
+        """Adds up the stats of the processes of a run.
+
+        :type stats: list of :class:`~apollo.utils.Stats`
+        :param stats: The stats of each process.
+
+        :rtype: :class:`~apollo.utils.Stats`
+        """
+        return cls(
+            completed = sum(s.completed for s in stats),
+            concurrency = sum(s.concurrency or 0 for s in stats),
+            deduplicated = sum(s.deduplicated for s in stats),
+            resumed = sum(s.resumed for s in stats),
+            over_quota = sum(s.over_quota for s in stats),
+            hedged = sum(s.hedged for s in stats),
+            hedges_won = sum(s.hedges_won for s in stats),
+        )
+
 @attr.s
 class FilePath(UserString):
     """FilePath is the str of the file path
@@ -130,38 +775,141 @@ class FilePattern:
         return FilePath(path="")
 
 
+def passthrough(x):
+    """Returns ``x``. The default ``mod_response``, ``stop_criteria`` and ``storage_criteria``: a module level function
+    rather than a lambda, so requests can be pickled and sent to other processes.
+    """
+    return x
+
+EVENT_LOOPS = ('default', 'auto', 'uvloop')
+
+def event_loop_policy(event_loop='default'):
+    """The event loop policy of an :class:`~apollo.ApolloCB` ``event_loop`` option.
+
+    :type event_loop: str or `asyncio.AbstractEventLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html>`_
+    :param event_loop: ``'default'`` for the asyncio loop, ``'uvloop'`` for `uvloop <https://github.com/MagicStack/uvloop>`_,
+        ``'auto'`` for uvloop when it is installed and the asyncio loop otherwise, or a policy, which is returned as is.
+
+    :rtype: `asyncio.AbstractEventLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html>`_
+    """
+    if isinstance(event_loop, asyncio.AbstractEventLoopPolicy):
+        return event_loop
+
+    if event_loop not in EVENT_LOOPS:
+        raise ValueError(f"The event_loop must be one of {EVENT_LOOPS} or an event loop policy. You provided {event_loop!r}")
+
+    if event_loop != 'default':
+        try:
+            import uvloop
+        except ImportError:
+            if event_loop == 'uvloop':
+                raise ImportError("event_loop = 'uvloop' needs uvloop, install it with: pip install uvloop")
+        else:
+            return uvloop.EventLoopPolicy()
+
+    return asyncio.DefaultEventLoopPolicy()
+
+def run(coroutine, event_loop='default'):
+    """Like `asyncio.run <https://docs.python.org/3/library/asyncio-runner.html#asyncio.run>`_, on a new loop of :func:`~apollo.utils.helpers.event_loop_policy`.
+    The global policy is left as it is.
+
+    :type coroutine: coroutine
+    :param coroutine: Run until complete.
+
+    :type event_loop: str or `asyncio.AbstractEventLoopPolicy <https://docs.python.org/3/library/asyncio-policy.html>`_
+    :param event_loop: See :func:`~apollo.utils.helpers.event_loop_policy`.
+
+    :returns: The result of ``coroutine``.
+    """
+    loop = event_loop_policy(event_loop).new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coroutine)
+    finally:
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
 def zip_longest_ffill(*args):
-    """Zip-like functionality, except it repeats the last value of the shorter list to the length of the longest list
+    """Zip-like functionality, except it repeats the last value of the shorter iterables to the length of the longest one
+
+    Rows are yielded one at a time, so the iterables are neither copied nor padded. An empty iterable is filled with ``[]``.
 
-    :type args: list of lists
-    :param args: list(list, list, list)
+    :type args: iterables, e.g. lists, ranges or generators
+    :param args: list(list, range, generator)
 
     Example usage:
 
     .. code-block:: python
 
-        zip_longest_ffill(*[[1,2],[1,2,3]])
+        list(zip_longest_ffill(*[[1,2],[1,2,3]]))
         >>>[(1, 1), (2, 2), (2, 3)]
 
     """
-    lists = [x if isinstance(x, list) else list(x) for x in args]
-    max_total_len = max([len(l) for l in lists])
+    if all(isinstance(x, (list, tuple, range)) for x in args):
+        #lengths are known, so the shorter ones are padded lazily and zipped in C
+        longest = max(map(len, args), default = 0)
+        return zip(*(chain(x, repeat(x[-1] if x else [], longest - len(x))) for x in args))
 
-    ffill_lists = []
+    return _ffill(args)
 
-    for sub_list in lists:
-        max_list_len = len(sub_list)
-        max_diff = max_total_len - max_list_len
+def _ffill(args):
+    iterators = [iter(x) for x in args]
+    last = [[] for _ in iterators]
+    active = len(iterators)
 
-        # empty lists with no -1 index
-        try:
-            last_val = sub_list[-1]
-            complete_list = sub_list + [last_val] * max_diff
-        except:
-            complete_list = [[] for _ in range(max_diff)]
-        ffill_lists.append(complete_list)
+    while active:
+        for n, iterator in enumerate(iterators):
+            if iterator is None:
+                continue
+            try:
+                last[n] = next(iterator)
+            except StopIteration:
+                iterators[n] = None
+                active -= 1
+
+        if active:
+            yield tuple(last)
+
+def zip_product(*args):
+    """Every combination of the elements of the iterables, like `itertools.product <https://docs.python.org/3/library/itertools.html#itertools.product>`_,
+    except the iterables are not copied: rows are yielded one at a time and the last iterable varies fastest.
+
+    The iterables after the first are iterated once per element of the ones before them. Iterators, such as generators,
+    can only be iterated once, so those after the first are read into a list.
+
+    :type args: iterables, e.g. lists, ranges or :class:`~apollo.request.attributes.Url`
+    :param args: list(list, range, generator)
+
+    Example usage:
+
+    .. code-block:: python
+
+        list(zip_product(*[[1,2],['a','b']]))
+        >>>[(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+
+    """
+    if not args:
+        yield ()
+        return
+
+    first, *rest = args
+    rest = [list(x) if isinstance(x, Iterator) else x for x in rest]
+
+    if not rest:
+        for head in first:
+            yield (head,)
+        return
 
-    return zip(*ffill_lists)
+    for head in first:
+        for tail in zip_product(*rest):
+            yield (head, *tail)
 
 class HttpAcceptedTypes:
 
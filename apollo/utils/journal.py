@@ -0,0 +1,80 @@
+#standard
+import os
+
+
+class Journal:
+    """An append-only log of the requests completed by :class:`~apollo.ApolloCB`, so an interrupted run can resume without refetching.
+
+    Each completed request is written as a line holding its :attr:`~apollo.request.APIRequest.fingerprint`, once
+    both its call and its save are done. Lines are flushed as they are written and synced to disk when the run ends.
+    A line cut short by a crash is ignored when the journal is loaded.
+
+    :type path: str
+    :param path: The journal file. Created if it does not exist.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import Journal
+
+        rf = ApolloCB(url = url, journal = Journal('crawl.journal'), resume = True)
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_file'] = None
+        return state
+
+    def load(self):
+        """The fingerprints of the requests recorded so far.
+
+        :rtype: set
+        """
+        if not os.path.exists(self.path):
+            return set()
+
+        with open(self.path) as f:
+            lines = f.read().split('\n')
+
+        #the last element is empty, or a line cut short
+        return set(lines[:-1])
+
+    def open(self, resume=False):
+        """Opens the journal for writing.
+
+        :type resume: boolean
+        :param resume: Set True to append to the journal, after dropping a line cut short. Otherwise it is emptied.
+        """
+        self.close()
+
+        if resume and os.path.exists(self.path):
+            with open(self.path, 'rb+') as f:
+                data = f.read()
+                f.truncate(data.rfind(b'\n') + 1)
+
+        self._file = open(self.path, 'a' if resume else 'w')
+
+    def record(self, fingerprint):
+        """Records a completed request.
+
+        :type fingerprint: str
+        :param fingerprint: See :attr:`~apollo.request.APIRequest.fingerprint`.
+        """
+        if self._file is None:
+            self.open(resume=True)
+        self._file.write(fingerprint + '\n')
+        self._file.flush()
+
+    def close(self):
+        """Syncs the journal to disk and closes it."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
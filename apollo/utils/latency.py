@@ -0,0 +1,50 @@
+#standard
+from collections import deque
+
+
+class LatencyWindow:
+    """The latest latencies of a run, and their percentiles. Used by :class:`~apollo.utils.hedge.Hedger` and :class:`~apollo.utils.timeout.AdaptiveTimeouts`.
+
+    :type size: int
+    :param size: The number of latest latencies kept.
+
+    """
+
+    #percentiles are taken again once this many latencies were observed
+    REFRESH = 50
+
+    def __init__(self, size=1000):
+        self.latencies = deque(maxlen=size)
+        self._percentiles = {}
+        self._fresh = 0
+
+    def __len__(self):
+        return len(self.latencies)
+
+    def observe(self, latency):
+        """Adds a latency.
+
+        :type latency: float
+        :param latency: Seconds.
+        """
+        self.latencies.append(latency)
+        self._fresh += 1
+        if self._fresh >= self.REFRESH:
+            self._percentiles = {}
+            self._fresh = 0
+
+    def percentile(self, percentile):
+        """The percentile of the latencies, taken again every ``REFRESH`` latencies.
+
+        :type percentile: float
+        :param percentile: Between 0 and 100.
+
+        :rtype: float or None
+        :returns: None if no latency was observed.
+        """
+        if not self.latencies:
+            return None
+        if percentile not in self._percentiles:
+            ordered = sorted(self.latencies)
+            self._percentiles[percentile] = ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+        return self._percentiles[percentile]
@@ -0,0 +1,232 @@
+#standard
+import asyncio
+import sqlite3
+import time
+from datetime import datetime
+from datetime import timezone
+
+#local
+from apollo.builder.exceptions import QuotaExceeded
+
+
+class Quota:
+    """A ledger of the requests made with each API credential per day and month, kept in a `sqlite3 <https://docs.python.org/3/library/sqlite3.html>`_ file
+    so the budget is shared by runs, processes and jobs on the host.
+
+    Every call, retries included, is charged to the :attr:`~apollo.auth.base.AuthBase.identity` of the ``api_auth``
+    before it is made. A call that would leave less than ``reserve`` of a window unused is not made: the run is paused
+    until the window resets if ``pause`` is True, otherwise it is stopped as with :meth:`~apollo.ApolloCB.stop`.
+    Windows reset at midnight and on the first of the month in ``tz``.
+
+    :type path: str
+    :param path: The sqlite file. Created if it does not exist.
+
+    :type daily: int
+    :param daily: (Optional) The number of calls allowed per day.
+
+    :type monthly: int
+    :param monthly: (Optional) The number of calls allowed per month.
+
+    :type reserve: int
+    :param reserve: (Optional) The number of calls of each window left unused, e.g. for other jobs. Default is 0.
+
+    :type pause: boolean
+    :param pause: (Optional) Set True to wait for the window to reset instead of stopping the run.
+
+    :type tz: `datetime.tzinfo <https://docs.python.org/3/library/datetime.html#datetime.tzinfo>`_
+    :param tz: (Optional) The timezone the vendor resets its windows in. Default is UTC.
+
+    :type clock: callable
+    :param clock: (Optional) Clock returning seconds since the epoch. Default is `time.time <https://docs.python.org/3/library/time.html#time.time>`_.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from apollo.utils import Quota
+
+        quota = Quota('quota.sqlite', daily = 10000, reserve = 500)
+
+        rf = ApolloCB(url = url, api_auth = api_auth, quota = quota)
+
+        rf.remaining_quota
+        # {'daily': 9500}
+
+    """
+
+    def __init__(self, path, daily=None, monthly=None, reserve=0, pause=False, tz=timezone.utc, clock=time.time):
+        self.limits = {window: limit for window, limit in (('daily', daily), ('monthly', monthly)) if limit is not None}
+
+        if not self.limits:
+            raise ValueError("A daily or monthly limit is required.")
+
+        for window, limit in self.limits.items():
+            if limit <= reserve:
+                raise ValueError(f"The {window} limit must be over the reserve. You provided {limit} and {reserve}")
+
+        self.path = path
+        self.reserve = reserve
+        self.pause = pause
+        self.tz = tz
+        self.clock = clock
+        self._connection = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
+
+    @property
+    def connection(self):
+        """The sqlite connection, opened on first use.
+
+        :rtype: `sqlite3.Connection <https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection>`_
+        """
+        if self._connection is None:
+            #transactions are begun explicitly, so charges from other processes are serialized
+            self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS usage (
+                    identity TEXT,
+                    span TEXT,
+                    period TEXT,
+                    used INTEGER,
+                    PRIMARY KEY (identity, span, period)
+                )
+                """
+            )
+        return self._connection
+
+    def close(self):
+        """Closes the sqlite connection. It is opened again when next used."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _now(self):
+        return datetime.fromtimestamp(self.clock(), self.tz)
+
+    @staticmethod
+    def _period(window, now):
+        return now.strftime('%Y-%m-%d' if window == 'daily' else '%Y-%m')
+
+    @staticmethod
+    def _reset(window, now):
+        """Seconds until the window of ``now`` resets."""
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if window == 'daily':
+            #a timedelta would be off on the days daylight saving time changes
+            end = datetime.fromordinal(start.toordinal() + 1).replace(tzinfo=now.tzinfo)
+        elif start.month == 12:
+            end = start.replace(year=start.year + 1, month=1, day=1)
+        else:
+            end = start.replace(month=start.month + 1, day=1)
+        return max((end - now).total_seconds(), 0)
+
+    def _used(self, identity, window, now):
+        row = self.connection.execute(
+            "SELECT used FROM usage WHERE identity = ? AND span = ? AND period = ?",
+            (identity, window, self._period(window, now)),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self, identity):
+        """The number of calls left in each window, less ``reserve``.
+
+        :type identity: str
+        :param identity: See :attr:`~apollo.auth.base.AuthBase.identity`.
+
+        :rtype: dict
+        :returns: e.g. ``{'daily': 9500, 'monthly': 190000}``
+        """
+        now = self._now()
+        return {
+            window: max(limit - self.reserve - self._used(identity, window, now), 0)
+            for window, limit in self.limits.items()
+        }
+
+    def charge(self, identity):
+        """Charges a call to every window, unless one of them has no calls left.
+
+        :type identity: str
+        :param identity: See :attr:`~apollo.auth.base.AuthBase.identity`.
+
+        :rtype: float
+        :returns: 0 if the call was charged, otherwise the number of seconds until every spent window has reset.
+        """
+        now = self._now()
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            spent = [
+                window for window, limit in self.limits.items()
+                if self._used(identity, window, now) >= limit - self.reserve
+            ]
+            if spent:
+                connection.execute("ROLLBACK")
+                #calls resume once every spent window has reset
+                return max(self._reset(window, now) for window in spent) or 1e-3
+
+            connection.executemany(
+                """
+                INSERT INTO usage VALUES (?, ?, ?, 1)
+                ON CONFLICT (identity, span, period) DO UPDATE SET used = used + 1
+                """,
+                [(identity, window, self._period(window, now)) for window in self.limits],
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return 0
+
+    async def acquire(self, identity):
+        """Charges a call, waiting for the window to reset if ``pause`` is True.
+
+        :type identity: str
+        :param identity: See :attr:`~apollo.auth.base.AuthBase.identity`.
+
+        :raises: :class:`~apollo.builder.exceptions.QuotaExceeded` if a window has no calls left and ``pause`` is False.
+        """
+        while True:
+            wait = self.charge(identity)
+            if not wait:
+                return
+            if not self.pause:
+                raise QuotaExceeded(f"The quota of {identity} is spent for {wait:.0f}s: {self.remaining(identity)}")
+            await asyncio.sleep(wait)
+
+    def account(self, identity):
+        """The quota of one credential, passed to :meth:`~apollo.request.APIRequest.request`.
+
+        :rtype: :class:`~apollo.utils.quota.Account`
+        """
+        return Account(self, identity)
+
+
+class Account:
+    """A :class:`~apollo.utils.Quota` bound to the :attr:`~apollo.auth.base.AuthBase.identity` charged for calls.
+
+    :type quota: :class:`~apollo.utils.Quota`
+    :param quota: The ledger.
+
+    :type identity: str
+    :param identity: The credential.
+
+    """
+
+    def __init__(self, quota, identity):
+        self.quota = quota
+        self.identity = identity
+
+    async def acquire(self):
+        """See :meth:`~apollo.utils.Quota.acquire`."""
+        await self.quota.acquire(self.identity)
+
+    def remaining(self):
+        """See :meth:`~apollo.utils.Quota.remaining`.
+
+        :rtype: dict
+        """
+        return self.quota.remaining(self.identity)
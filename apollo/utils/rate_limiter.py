@@ -0,0 +1,428 @@
+#standard
+import asyncio
+import mmap
+import os
+import struct
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class TokenBucket:
+    """An asynchronous token bucket, implemented as a `generic cell rate algorithm <https://en.wikipedia.org/wiki/Generic_cell_rate_algorithm>`_.
+
+    Up to ``burst`` tokens are handed out at once, after which tokens are handed out every ``per / rate`` seconds.
+    The sustained rate does not depend on how long the work done with a token takes.
+
+    :type rate: int or float
+    :param rate: The number of tokens handed out every ``per`` seconds.
+
+    :type per: int or float
+    :param per: The period, in seconds, in which ``rate`` tokens are handed out.
+
+    :type burst: int or None
+    :param burst: The number of tokens that can be handed out at once. Defaults to ``rate``.
+
+    :type clock: callable
+    :param clock: Monotonic clock returning seconds. Default is `time.monotonic <https://docs.python.org/3/library/time.html#time.monotonic>`_.
+
+    Example usage:
+
+    .. code-block:: python
+
+        bucket = TokenBucket(rate = 10, per = 1)
+
+        async def call():
+            await bucket.acquire()
+            ...
+
+    """
+
+    def __init__(self, rate, per=1, burst=None, clock=time.monotonic):
+        if rate <= 0 or per <= 0:
+            raise ValueError(f"The rate and per must be over 0. You provided {rate} and {per}")
+
+        self._interval = per / rate
+        self._burst = rate if burst is None else burst
+        self._clock = clock
+        self._tat = None
+
+        if self._burst < 1:
+            raise ValueError(f"The burst must be 1 or over. You provided {burst}")
+
+    @property
+    def interval(self):
+        """Seconds between tokens once the burst is spent.
+
+        :rtype: float
+        """
+        return self._interval
+
+    @property
+    def burst(self):
+        """The number of tokens that can be handed out at once.
+
+        :rtype: int
+        """
+        return self._burst
+
+    def reserve(self, tokens=1):
+        """Reserves tokens without waiting for them.
+
+        :type tokens: int
+        :param tokens: The number of tokens to reserve.
+
+        :rtype: float
+        :returns: The number of seconds to wait before the reserved tokens may be used.
+        """
+        now = self._clock()
+        tat = now if self._tat is None else max(self._tat, now)
+        tolerance = (self._burst - 1) * self._interval
+        start = max(now, tat + (tokens - 1) * self._interval - tolerance)
+        self._tat = tat + tokens * self._interval
+        return start - now
+
+    def refund(self, tokens=1):
+        """Gives back reserved tokens that were not used.
+
+        :type tokens: int
+        :param tokens: The number of tokens to give back.
+        """
+        if self._tat is not None:
+            self._tat -= tokens * self._interval
+
+    async def acquire(self, tokens=1):
+        """Waits until tokens are available. If cancelled while waiting, the tokens are given back.
+
+        :type tokens: int
+        :param tokens: The number of tokens to take.
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund(tokens)
+                raise
+
+
+class FileState:
+    """A double kept in a memory-mapped file and locked with ``flock``, so any process on the host can share it.
+    Used like `multiprocessing.Value <https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Value>`_
+    as the state of a :class:`~apollo.utils.rate_limiter.SharedTokenBucket`. Created by :meth:`~apollo.utils.RateLimit.shared_state` when ``key`` is given.
+
+    :type path: str
+    :param path: The file. Created, holding 0, if it does not exist.
+
+    """
+
+    SIZE = struct.calcsize('d')
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise NotImplementedError("Sharing a rate limit across the host needs fcntl, which is not available on this platform.")
+
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        if os.fstat(self._fd).st_size < self.SIZE:
+            os.ftruncate(self._fd, self.SIZE)
+        self._mmap = mmap.mmap(self._fd, self.SIZE)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    @contextmanager
+    def get_lock(self):
+        """Locks the file for this process until the block exits."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @property
+    def value(self):
+        return struct.unpack('d', self._mmap[:self.SIZE])[0]
+
+    @value.setter
+    def value(self, value):
+        self._mmap[:self.SIZE] = struct.pack('d', value)
+
+
+class SharedTokenBucket(TokenBucket):
+    """A :class:`~apollo.utils.rate_limiter.TokenBucket` whose state is kept outside the process, so processes with the
+    same ``state`` share one budget. Created by :meth:`~apollo.utils.RateLimit.bucket` for ``ApolloCB(processes = N)``,
+    or when ``RateLimit(key = ...)`` shares the budget with every process on the host.
+
+    :type state: `multiprocessing.Value <https://docs.python.org/3/library/multiprocessing.html#multiprocessing.Value>`_ or :class:`~apollo.utils.rate_limiter.FileState`
+    :param state: A double with a lock, created by :meth:`~apollo.utils.RateLimit.shared_state`. A ``multiprocessing.Value`` must be passed to other processes when they are started.
+
+    See :class:`~apollo.utils.rate_limiter.TokenBucket` for the other parameters. ``clock`` must be the same in every process.
+
+    """
+
+    #the state before the first token is handed out
+    UNSET = -1.0
+
+    def __init__(self, rate, state, per=1, burst=None, clock=time.monotonic):
+        super().__init__(rate, per=per, burst=burst, clock=clock)
+        self._state = state
+
+    def _load(self):
+        # a new FileState holds 0, which is in the past like any expired state
+        self._tat = None if self._state.value == self.UNSET else self._state.value
+
+    def _store(self):
+        self._state.value = self.UNSET if self._tat is None else self._tat
+
+    def reserve(self, tokens=1):
+        with self._state.get_lock():
+            self._load()
+            delay = super().reserve(tokens)
+            self._store()
+        return delay
+
+    def refund(self, tokens=1):
+        with self._state.get_lock():
+            self._load()
+            super().refund(tokens)
+            self._store()
+
+
+class Limiter:
+    """Pairs a concurrency limit with a :class:`~apollo.utils.rate_limiter.TokenBucket`. Created by :meth:`~apollo.utils.RateLimit.limiter`.
+
+    Used as an asynchronous context manager: a concurrency slot is taken first, then a token. The slot is
+    released on exit, so the number of calls in flight and the rate at which they start are limited independently.
+
+    :type bucket: :class:`~apollo.utils.rate_limiter.TokenBucket`
+    :param bucket: Limits the rate at which calls start.
+
+    :type concurrency: int
+    :param concurrency: The number of calls in flight at one time.
+
+    """
+
+    def __init__(self, bucket, concurrency):
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+    @property
+    def limit(self):
+        """The number of calls allowed in flight.
+
+        :rtype: int
+        """
+        return self.concurrency
+
+    def record(self, latency, status=None, error=False):
+        """Records the outcome of a call. A fixed limiter ignores it.
+
+        :type latency: float
+        :param latency: Seconds the call took.
+
+        :type status: int or None
+        :param status: The response status, if there was a response.
+
+        :type error: boolean
+        :param error: True if the call failed without a response.
+        """
+        pass
+
+
+class AdaptiveLimiter(Limiter):
+    """A :class:`~apollo.utils.rate_limiter.Limiter` whose concurrency limit adapts to the outcome of calls (additive increase, multiplicative decrease).
+    Created by :meth:`~apollo.utils.RateLimit.limiter` when :class:`~apollo.utils.AdaptiveConcurrency` is given.
+
+    The limit grows by ``increase`` every time ``limit`` healthy calls complete. It is multiplied by ``decrease``
+    when a call fails, answers with one of ``statuses``, or takes longer than ``latency_tolerance`` times the
+    average latency. After a decrease, further decreases wait until the calls that were in flight have completed.
+
+    :type bucket: :class:`~apollo.utils.rate_limiter.TokenBucket`
+    :param bucket: Limits the rate at which calls start.
+
+    :type concurrency: int
+    :param concurrency: The starting limit.
+
+    :type minimum: int
+    :param minimum: The lowest limit.
+
+    :type maximum: int
+    :param maximum: The highest limit.
+
+    :type increase: int
+    :param increase: Added to the limit after ``limit`` healthy calls.
+
+    :type decrease: float
+    :param decrease: The limit is multiplied by it when calls are unhealthy.
+
+    :type latency_tolerance: float
+    :param latency_tolerance: Calls slower than the average latency times this are unhealthy.
+
+    :type statuses: tuple of int
+    :param statuses: Response statuses that are unhealthy.
+
+    """
+
+    def __init__(
+        self,
+        bucket,
+        concurrency,
+        minimum=1,
+        maximum=100,
+        increase=1,
+        decrease=0.5,
+        latency_tolerance=2.0,
+        statuses=(429, 500, 502, 503, 504),
+    ):
+        self.bucket = bucket
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.statuses = statuses
+        self.latency = None
+
+        self._limit = min(max(concurrency, minimum), maximum)
+        self._in_flight = 0
+        self._waiters = deque()
+        self._healthy = 0
+        self._cooldown = 0
+
+    @property
+    def limit(self):
+        """The current number of calls allowed in flight.
+
+        :rtype: int
+        """
+        return self._limit
+
+    @property
+    def concurrency(self):
+        return self._limit
+
+    def _wake(self):
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    async def _acquire(self):
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self):
+        self._in_flight -= 1
+        self._wake()
+
+    async def __aenter__(self):
+        await self._acquire()
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release()
+
+    def record(self, latency, status=None, error=False):
+        """Records the outcome of a call and adapts the limit.
+
+        :type latency: float
+        :param latency: Seconds the call took.
+
+        :type status: int or None
+        :param status: The response status, if there was a response.
+
+        :type error: boolean
+        :param error: True if the call failed without a response.
+        """
+        slow = self.latency is not None and latency > self.latency * self.latency_tolerance
+
+        if not error:
+            self.latency = latency if self.latency is None else 0.9 * self.latency + 0.1 * latency
+
+        if self._cooldown:
+            self._cooldown -= 1
+
+        if error or slow or status in self.statuses:
+            self._healthy = 0
+            if not self._cooldown:
+                self._limit = max(self.minimum, int(self._limit * self.decrease))
+                self._cooldown = self._in_flight
+            return
+
+        self._healthy += 1
+        if self._healthy >= self._limit:
+            self._healthy = 0
+            self._limit = min(self.maximum, self._limit + self.increase)
+            self._wake()
+
+
+
+class PartitionedLimiter:
+    """A :class:`~apollo.utils.rate_limiter.Limiter` for each partition of the calls, created when the partition is first used.
+    Created by :meth:`~apollo.utils.PartitionedRateLimit.limiter`.
+
+    :type factory: callable
+    :param factory: Called with a partition, returns its limiter.
+
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self.limiters = {}
+
+    def get(self, partition):
+        """The limiter of a partition.
+
+        :rtype: :class:`~apollo.utils.rate_limiter.Limiter`
+        """
+        if partition not in self.limiters:
+            self.limiters[partition] = self._factory(partition)
+        return self.limiters[partition]
+
+    @property
+    def limit(self):
+        """The number of calls allowed in flight across the partitions used so far.
+
+        :rtype: int
+        """
+        return sum(limiter.limit for limiter in self.limiters.values())
@@ -0,0 +1,82 @@
+#standard
+from collections import namedtuple
+
+#local
+from apollo.utils.latency import LatencyWindow
+
+
+Limits = namedtuple('Limits', ['connect', 'first_byte', 'total'])
+
+
+class Timeouts:
+    """The timeouts of the calls of one run, by host. Created by :meth:`~apollo.utils.Timeout.timeouts`.
+
+    :type timeout: :class:`~apollo.utils.Timeout`
+    :param timeout: The configured timeouts.
+
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    def limits(self, host):
+        """The timeouts of a call to a host.
+
+        :type host: str
+        :param host: The host called.
+
+        :rtype: :class:`~apollo.utils.timeout.Limits`
+        :returns: Seconds, or None for no limit: ``connect`` to establish a connection, ``first_byte`` until the response headers, and between reads of the body, and ``total`` for the whole call.
+        """
+        timeout = self.timeout.hosts.get(host, self.timeout)
+        return Limits(timeout.connect, timeout.first_byte, timeout.total)
+
+    def observe(self, host, first_byte, total):
+        """Records the latencies of a call. Fixed timeouts ignore them.
+
+        :type host: str
+        :param host: The host called.
+
+        :type first_byte: float
+        :param first_byte: Seconds until the response headers.
+
+        :type total: float
+        :param total: Seconds the whole call took.
+        """
+        pass
+
+
+class AdaptiveTimeouts(Timeouts):
+    """:class:`~apollo.utils.timeout.Timeouts` derived from the latencies observed for each host. Created by :meth:`~apollo.utils.Timeout.timeouts` when ``adaptive`` is True.
+
+    Once ``min_samples`` calls to a host completed, its ``first_byte`` and ``total`` timeouts are the ``percentile``
+    of their latencies times ``multiplier``, no lower than ``minimum`` and no higher than the configured timeouts.
+
+    :type timeout: :class:`~apollo.utils.Timeout`
+    :param timeout: The configured timeouts.
+
+    """
+
+    def __init__(self, timeout):
+        super().__init__(timeout)
+        self.latencies = {}
+
+    def limits(self, host):
+        limits = super().limits(host)
+        latencies = self.latencies.get(host)
+
+        if latencies is None or len(latencies[0]) < self.timeout.min_samples:
+            return limits
+
+        first_byte, total = (self._derive(window, limit) for window, limit in zip(latencies, limits[1:]))
+        return Limits(limits.connect, first_byte, total)
+
+    def _derive(self, window, limit):
+        derived = max(window.percentile(self.timeout.percentile) * self.timeout.multiplier, self.timeout.minimum)
+        return derived if limit is None else min(derived, limit)
+
+    def observe(self, host, first_byte, total):
+        if host not in self.latencies:
+            self.latencies[host] = (LatencyWindow(), LatencyWindow())
+        self.latencies[host][0].observe(first_byte)
+        self.latencies[host][1].observe(total)
@@ -0,0 +1,77 @@
+"""
+Compares the event loops of ``ApolloCB(event_loop = ...)`` on the local test server: requests per second and
+client CPU per request. Each loop runs in its own process, so the CPU of the server, which runs in this one, is not counted.
+
+    python -m benchmarks.event_loop --requests 5000 --concurrency 100
+
+uvloop is skipped if it is not installed.
+"""
+#standard
+import argparse
+import logging
+import multiprocessing
+import time
+
+#local
+from apollo.builder.client import ApolloCB
+from apollo.request import APIRequest
+from apollo.request.attributes import Url
+from apollo.utils import RateLimit
+from apollo.utils.helpers import event_loop_policy
+from apollo.utils.helpers import run
+from tests.server import LocalServer
+
+
+def measure(url, requests, concurrency, event_loop):
+    """Runs ``requests`` small requests on ``event_loop``. Returns the wall and CPU seconds they took.
+
+    The requests are built beforehand, so only the calls are measured.
+    """
+    rf = ApolloCB(
+        url = Url(path_format = url),
+        event_loop = event_loop,
+        api_rate_limit = RateLimit(rate = 1, limit = requests, concurrency = concurrency),
+    )
+    plan = [APIRequest(url = f"{url}/{n}", param = {}, header = {}) for n in range(requests)]
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    run(rf.add_requests(plan), event_loop = event_loop)
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0].strip())
+    parser.add_argument('--requests', type = int, default = 2000)
+    parser.add_argument('--concurrency', type = int, default = 100)
+    parser.add_argument('--repeat', type = int, default = 3, help = 'The best of the runs is reported.')
+    args = parser.parse_args()
+
+    #the access log of the server would slow it down
+    logging.getLogger('aiohttp.access').setLevel(logging.WARNING)
+
+    server = LocalServer()
+    server.start()
+
+    print(f"{'event_loop':<10} {'requests/s':>12} {'CPU ms/request':>16}")
+    try:
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            for event_loop in ('default', 'uvloop'):
+                try:
+                    event_loop_policy(event_loop)
+                except ImportError:
+                    print(f"{event_loop:<10} {'not installed':>12}")
+                    continue
+
+                runs = [
+                    pool.apply(measure, (server.url('/anything'), args.requests, args.concurrency, event_loop))
+                    for _ in range(args.repeat)
+                ]
+                wall = min(w for w, _ in runs)
+                cpu = min(c for _, c in runs)
+                print(f"{event_loop:<10} {args.requests / wall:>12.0f} {1000 * cpu / args.requests:>16.3f}")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
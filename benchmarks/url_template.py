@@ -0,0 +1,66 @@
+"""
+Compares building Urls from a :class:`~apollo.request.template.UrlTemplate` with calling ``str.format`` for each Url,
+as :class:`~apollo.request.attributes.Url` did before.
+
+    python -m benchmarks.url_template --urls 5000000
+"""
+#standard
+import argparse
+import time
+
+#local
+from apollo.builder.converters import is_dynamic
+from apollo.request.attributes import Url
+from apollo.utils.helpers import zip_longest_ffill
+
+
+SCENARIOS = {
+    'one range': lambda n: dict(
+        path_format = "https://api.example.com/v1/orders/{order_id}",
+        order_id = range(n),
+    ),
+    'scalars and a range': lambda n: dict(
+        path_format = "https://api.example.com/{version}/accounts/{account}/orders/{order_id:>08}?expand={expand}",
+        version = 'v1', account = 'acme', expand = 'lines', order_id = range(n),
+    ),
+    'two lists': lambda n: dict(
+        path_format = "https://api.example.com/v1/{region}/orders/{order_id}",
+        region = ['eu', 'us'] * (n // 2), order_id = list(range(n)),
+    ),
+}
+
+
+def format_urls(path_format, **path_args):
+    """Builds the Urls with ``str.format``."""
+    keys = list(path_args.keys())
+    columns = [v if is_dynamic(v) else [v] for v in path_args.values()]
+    for b in zip_longest_ffill(*columns):
+        yield path_format.format(**dict(zip(keys, b)))
+
+
+def measure(build, kwargs):
+    """Seconds taken to build, and drop, every Url."""
+    start = time.perf_counter()
+    for _ in build(**kwargs):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[0].strip())
+    parser.add_argument('--urls', type = int, default = 1000000)
+    parser.add_argument('--repeat', type = int, default = 3, help = 'The best of the runs is reported.')
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'str.format/s':>14} {'template/s':>14} {'speedup':>8}")
+    for name, scenario in SCENARIOS.items():
+        kwargs = scenario(args.urls)
+        assert list(format_urls(**scenario(10))) == list(Url(**scenario(10)))
+
+        before = min(measure(format_urls, kwargs) for _ in range(args.repeat))
+        after = min(measure(Url, kwargs) for _ in range(args.repeat))
+        print(f"{name:<20} {args.urls / before:>14.0f} {args.urls / after:>14.0f} {before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,13 @@
 
+#standard
+from types import MappingProxyType
+
 #third party
 import pytest
 
 #local
 from apollo.auth.base import AuthBase
+from apollo.request.api_request import APIRequest
 
 
 
@@ -32,4 +36,15 @@ def test_auth():
     assert api_auth.param ==  {'my_api_key': '123'}
     assert isinstance(api_auth.auth, tuple)
     assert isinstance(api_auth.header, dict)
-    assert isinstance(api_auth, AuthBase)
\ No newline at end of file
+    assert isinstance(api_auth, AuthBase)
+
+@pytest.mark.auth
+def test_auth_read_only_mapping():
+
+    static = MappingProxyType({'a': 1})
+    req = MockAPIAuth(api_key = '123') >> APIRequest(url = 'http://localhost', param = static, header = {})
+
+    assert req.param == {'a': 1, 'my_api_key': '123'}
+    assert static == {'a': 1}
+    assert req.request_args['params'] == {'a': 1, 'my_api_key': '123'}
+    assert type(req.request_args['params']) is dict
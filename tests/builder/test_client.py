@@ -1,16 +1,31 @@
 #standard
 from pprint import pprint as p
+import asyncio
+import os
+import pickle
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 #third party
 import pytest
 
 #local
 from apollo.auth import Pipedrive
+from apollo.auth import Harvest
 from apollo.builder.client import ApolloCB
 
 from apollo.utils import RateLimit
+from apollo.utils import Retry
+from apollo.utils import AdaptiveConcurrency
+from apollo.utils import PartitionedRateLimit
+from apollo.utils import ResponseCache
+from apollo.utils import Journal
+from apollo.utils import Quota
+from apollo.utils import Hedge
 
 from apollo.storage.base import StorageBase
+from apollo.storage import LocalStorage
 from apollo.utils import FilePattern
 
 from apollo.request.attributes import Url
@@ -19,6 +34,9 @@ from apollo.request.attributes import Header
 from apollo.request.attributes import Auth
 from apollo.request.attributes import Data
 from apollo.request.attributes import Cookie
+from apollo.request import Cursor
+from apollo.request import Link
+from apollo.request import Offset
 
 from apollo.auth.base import AuthBase
 
@@ -140,4 +158,574 @@ def test_client_builder():
 # [08:23:16] Filepath GET/5/there was saved
 # [08:23:17] Filepath GET/6/there was saved
 # [08:23:18] Filepath GET/8/there was saved
-# [08:23:19] Filepath GET/7/there was saved
\ No newline at end of file
+# [08:23:19] Filepath GET/7/there was saved
+
+@pytest.mark.client_builder
+@pytest.mark.connection_pool
+def test_client_reuses_connections(local_server):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = [1, 2, 3],
+    )
+
+    rf = ApolloCB(
+        url = url,
+        save = True,
+        api_rate_limit = RateLimit(rate = 1, limit = 10, concurrency = 1),
+    )
+
+    a = rf.execute()
+
+    assert len(a) == 3
+    assert local_server.hits == 3
+    assert len(local_server.peers) == 1
+
+
+@pytest.mark.client_builder
+def test_client_bounds_in_flight_requests(local_server):
+
+    WORKERS = 2
+    consumed = []
+    completed = []
+    held = []
+
+    def requests():
+        for n in range(20):
+            #requests pulled from the plan but not yet completed
+            held.append(len(consumed) - len(completed))
+            consumed.append(n)
+            yield APIRequest(url = local_server.url(f"/anything/{n}"))
+
+    def stop_criteria(response):
+        completed.append(response)
+
+    rf = ApolloCB(
+        url = Url(path_format = local_server.url("/anything")),
+        save = True,
+        workers = WORKERS,
+        stop_criteria = stop_criteria,
+        api_rate_limit = RateLimit(rate = 1, limit = 100, concurrency = WORKERS),
+    )
+
+    async def run():
+        return await asyncio.wait_for(rf.add_requests(requests()), timeout = 10)
+
+    a = asyncio.run(run())
+
+    assert len(a) == 20
+    assert local_server.hits == 20
+    #the workers plus the queue, whose size defaults to the number of workers
+    assert max(held) <= WORKERS * 2
+
+    with pytest.raises(ValueError):
+        ApolloCB(url = Url(path_format = local_server.url("/anything")), workers = 0)
+
+
+@pytest.mark.client_builder
+@pytest.mark.stream
+def test_client_stream(local_server):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = list(range(10)),
+    )
+
+    rf = ApolloCB(
+        url = url,
+        workers = 1,
+        api_rate_limit = RateLimit(rate = 1, limit = 100, concurrency = 1),
+    )
+
+    async def run():
+        ahead = []
+        received = []
+        async for req in rf.stream(maxsize = 1):
+            received.append(req)
+            #give the workers a chance to run ahead of the consumer
+            await asyncio.sleep(0.02)
+            ahead.append(local_server.hits - len(received))
+        return received, ahead
+
+    received, ahead = asyncio.run(asyncio.wait_for(run(), timeout = 10))
+
+    assert len(received) == 10
+    assert all(isinstance(r, APIRequest) for r in received)
+    #one request waiting for the consumer, one being handed over and one in flight
+    assert max(ahead) <= 3
+
+
+@pytest.mark.client_builder
+@pytest.mark.stream
+def test_client_stream_sync(local_server):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = list(range(10)),
+    )
+
+    rf = ApolloCB(
+        url = url,
+        workers = 1,
+        api_rate_limit = RateLimit(rate = 1, limit = 100, concurrency = 1),
+    )
+
+    received = []
+    for req in rf.stream_sync(maxsize = 1):
+        received.append(req.response.status)
+        if len(received) == 3:
+            break
+
+    assert received == [200, 200, 200]
+    assert local_server.hits < 10
+
+
+@pytest.mark.client_builder
+@pytest.mark.storage
+def test_client_stream_to_storage(local_server, tmp_path):
+
+    SIZE = 100000
+
+    def file_func(self):
+        return self.response.url.path
+
+    rf = ApolloCB(
+        url = Url(path_format = local_server.url(f"/bytes/{SIZE}")),
+        save = True,
+        storage = LocalStorage(root = tmp_path),
+        file_pattern = FilePattern(file_func = file_func),
+        stream_to_storage = True,
+        chunk_size = 4096,
+    )
+
+    a, = rf.execute()
+
+    assert a.response.status == 200
+    assert a.response.byte_vals is None
+    assert (tmp_path / 'bytes' / str(SIZE)).read_bytes() == bytes(n % 256 for n in range(SIZE))
+
+
+@pytest.mark.client_builder
+@pytest.mark.retry
+def test_client_retries(local_server):
+
+    url = Url(
+        path_format = local_server.url("/flaky/{failures}/503/{a}"),
+        failures = [2, 5],
+        a = [1, 2],
+    )
+
+    rf = ApolloCB(
+        url = url,
+        save = True,
+        retry = Retry(attempts = 3, backoff = 0.01),
+        api_rate_limit = RateLimit(rate = 1, limit = 100),
+    )
+
+    a = sorted(rf.execute(), key = lambda r: r.url)
+
+    #retried until it succeeded, then given up on after 3 attempts
+    assert [r.response.status for r in a] == [200, 503]
+    assert local_server.hits == 6
+
+@pytest.mark.adaptive
+def test_client_adaptive_concurrency(local_server):
+
+    url = Url(
+        path_format = local_server.url("/flaky/1/429/{a}"),
+        a = list(range(8)),
+    )
+
+    rf = ApolloCB(
+        url = url,
+        retry = Retry(attempts = 2, backoff = 0.01),
+        api_rate_limit = RateLimit(rate = 1, limit = 100, concurrency = 8, adaptive = AdaptiveConcurrency(maximum = 8)),
+    )
+
+    assert rf.worker_count == 8
+
+    rf.execute()
+
+    #throttled calls cut the limit, reported in the run stats
+    assert rf.stats.completed == 8
+    assert rf.stats.concurrency < 8
+
+
+@pytest.mark.client_builder
+@pytest.mark.partition
+def test_client_partitions_by_host(local_server):
+
+    url = Url(
+        path_format = f"http://{{host}}:{local_server.port}/anything/{{a}}",
+        host = ['localhost', '127.0.0.1'] * 10,
+        a = list(range(20)),
+    )
+
+    rf = ApolloCB(
+        url = url,
+        api_rate_limit = PartitionedRateLimit(
+            default = RateLimit(rate = 1, limit = 100, concurrency = 2),
+            #one call a minute
+            partitions = {'localhost': RateLimit(rate = 60, limit = 1)},
+        ),
+    )
+
+    async def run():
+        received = []
+        async for req in rf.stream():
+            received.append(req)
+            if len(received) == 11:
+                break
+        return received
+
+    received = asyncio.run(asyncio.wait_for(run(), timeout = 10))
+
+    #the strictly limited host did not hold up the other one
+    hosts = [r.url.split('/')[2].split(':')[0] for r in received]
+    assert hosts.count('127.0.0.1') == 10
+    assert hosts.count('localhost') == 1
+
+
+@pytest.mark.client_builder
+@pytest.mark.cache
+def test_client_cache(local_server, tmp_path):
+
+    url = Url(
+        path_format = local_server.url("/etag/v1/{a}"),
+        a = [1, 2],
+    )
+
+    def run():
+        rf = ApolloCB(
+            url = url,
+            save = True,
+            cache = ResponseCache(str(tmp_path / 'cache.sqlite')),
+        )
+        return sorted(rf.execute(), key = lambda r: r.url)
+
+    first = run()
+    second = run()
+
+    assert [r.response.cached for r in first] == [False, False]
+    #the server answered 304 and the body came from the store
+    assert [r.response.cached for r in second] == [True, True]
+    assert [r.response.status for r in second] == [200, 200]
+    assert [r.response.json['url'] for r in second] == [r.response.json['url'] for r in first]
+    assert local_server.hits == 4
+
+
+@pytest.mark.client_builder
+@pytest.mark.dedupe
+def test_client_dedupe_skip(local_server):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = [1, 1, 2, 2, 1],
+    )
+
+    rf = ApolloCB(url = url, save = True, dedupe = 'skip')
+
+    a = rf.execute()
+
+    assert sorted(r.url for r in a) == [local_server.url("/anything/1"), local_server.url("/anything/2")]
+    assert local_server.hits == 2
+    assert rf.stats.deduplicated == 3
+
+
+@pytest.mark.client_builder
+@pytest.mark.dedupe
+def test_client_dedupe_coalesce(local_server):
+
+    url = Url(
+        path_format = local_server.url("/delay/0.2/{a}"),
+        a = [1, 2] * 4,
+    )
+    param = Param(dynamic = {'b': [1] * 7 + [2]})
+
+    rf = ApolloCB(url = url, param = param, save = True, dedupe = 'coalesce', workers = 8)
+
+    a = rf.execute()
+
+    #one call for each of /1?b=1, /2?b=1 and /2?b=2, shared by the identical requests in flight
+    assert len(a) == 8
+    assert local_server.hits == 3
+    assert rf.stats.deduplicated == 5
+    assert len({id(r.response) for r in a}) == 3
+
+
+@pytest.mark.client_builder
+@pytest.mark.journal
+def test_client_resume(local_server, tmp_path):
+
+    url = Url(
+        path_format = local_server.url("/delay/0.05/{a}"),
+        a = list(range(20)),
+    )
+    journal = Journal(str(tmp_path / 'run.journal'))
+    received = []
+
+    def interrupt(response):
+        received.append(response)
+        if len(received) == 5:
+            os.kill(os.getpid(), signal.SIGTERM)
+        return response
+
+    rate_limit = RateLimit(rate = 1, limit = 100)
+
+    rf = ApolloCB(url = url, workers = 2, api_rate_limit = rate_limit, journal = journal, mod_response = interrupt)
+    rf.execute()
+
+    #stopped gracefully: the requests in flight completed and were journaled
+    completed = rf.stats.completed
+    assert 5 <= completed < 20
+    assert len(journal.load()) == completed
+
+    local_server.reset()
+    rf = ApolloCB(url = url, workers = 2, api_rate_limit = rate_limit, journal = journal, resume = True)
+    rf.execute()
+
+    assert rf.stats.resumed == completed
+    assert local_server.hits == 20 - completed
+    assert len(journal.load()) == 20
+
+
+@pytest.mark.client_builder
+@pytest.mark.paginator
+@pytest.mark.parametrize('paginator', [
+    Harvest(access_token = '123', account_id = '123').paginator,
+    Pipedrive(api_key = '123').paginator,
+    Cursor(),
+    Link(next = 'links.next'),
+    Link(),
+])
+def test_client_paginates(local_server, paginator):
+
+    url = Url(path_format = local_server.url("/pages/{total}"), total = [7, 4])
+
+    rf = ApolloCB(
+        url = url,
+        save = True,
+        paginator = paginator,
+        api_rate_limit = RateLimit(rate = 1, limit = 100),
+    )
+
+    a = rf.execute()
+
+    items = sorted(item for r in a for item in r.response.json['items'])
+
+    #every page of both urls, and no request past the last page
+    assert items == sorted(list(range(7)) + list(range(4)))
+    assert local_server.hits == len(a) == 4 + 2
+
+
+@pytest.mark.client_builder
+@pytest.mark.paginator
+@pytest.mark.journal
+@pytest.mark.parametrize('paginator', [Cursor(), Harvest(access_token = '123', account_id = '123').paginator])
+def test_client_journals_paginated_requests(local_server, tmp_path, paginator):
+
+    url = Url(path_format = local_server.url("/pages/{total}"), total = [7, 4])
+    journal = Journal(str(tmp_path / 'run.journal'))
+
+    def run():
+        rf = ApolloCB(url = url, paginator = paginator, journal = journal, resume = True, api_rate_limit = RateLimit(rate = 1, limit = 100))
+        rf.execute()
+        return rf
+
+    run()
+
+    #one record per url, once all its pages are done
+    assert len(journal.load()) == 2
+
+    local_server.reset()
+    assert run().stats.resumed == 2
+    assert local_server.hits == 0
+
+
+@pytest.mark.client_builder
+@pytest.mark.paginator
+@pytest.mark.parametrize('paginator, concurrent', [
+    (Harvest(access_token = '123', account_id = '123').paginator, True),
+    (Offset(next_offset = 'additional_data.pagination.next_start', total = 'total_entries'), True),
+    (Cursor(), False),
+])
+def test_client_fans_out_pages(local_server, paginator, concurrent):
+
+    url = Url(path_format = local_server.url("/pages/{total}"), total = [20])
+    param = Param(static = {'delay': '0.05'})
+
+    rf = ApolloCB(
+        url = url,
+        param = param,
+        save = True,
+        paginator = paginator,
+        workers = 10,
+        api_rate_limit = RateLimit(rate = 1, limit = 100),
+    )
+
+    a = rf.execute()
+
+    assert sorted(item for r in a for item in r.response.json['items']) == list(range(20))
+    assert local_server.hits == 10
+    #with a total the remaining pages run at once, otherwise they are followed one at a time
+    assert (local_server.peak > 1) == concurrent
+
+
+def add_process_id(response):
+    response.json['pid'] = os.getpid()
+    return response
+
+
+@pytest.mark.client_builder
+@pytest.mark.processes
+def test_client_processes(local_server):
+
+    url = Url(path_format = local_server.url("/anything/{a}"), a = list(range(10)))
+
+    rf = ApolloCB(
+        url = url,
+        save = True,
+        processes = 2,
+        mod_response = add_process_id,
+        #one call every 0.05s across both processes
+        api_rate_limit = RateLimit(rate = 1, limit = 20, burst = 1),
+    )
+
+    #the client and its requests can be sent to other processes
+    pickle.loads(pickle.dumps(rf))
+
+    start = time.monotonic()
+    a = rf.execute()
+    elapsed = time.monotonic() - start
+
+    assert sorted(r.response.json['url'] for r in a) == sorted(local_server.url(f"/anything/{n}") for n in range(10))
+    assert len({r.response.json['pid'] for r in a}) == 2
+    assert rf.stats.completed == 10
+    assert local_server.hits == 10
+    assert elapsed >= 0.45
+
+    with pytest.raises(ValueError):
+        ApolloCB(url = url, processes = 0)
+
+
+def run_client(url, directory):
+    rf = ApolloCB(url = url, save = True, api_rate_limit = RateLimit(rate = 1, limit = 20, burst = 1, key = 'test', directory = directory))
+    return len(rf.execute())
+
+
+@pytest.mark.client_builder
+@pytest.mark.processes
+def test_client_rate_limit_shared_by_key(local_server, tmp_path):
+
+    url = Url(path_format = local_server.url("/anything/{a}"), a = list(range(5)))
+
+    #independent clients in separate processes
+    with ProcessPoolExecutor(2) as executor:
+        start = time.monotonic()
+        assert list(executor.map(run_client, [url, url], [str(tmp_path)] * 2)) == [5, 5]
+        elapsed = time.monotonic() - start
+
+    #10 calls at one every 0.05s across both
+    assert elapsed >= 0.45
+    assert local_server.hits == 10
+
+
+@pytest.mark.client_builder
+@pytest.mark.quota
+def test_client_stops_at_quota(local_server, tmp_path):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = list(range(10)),
+    )
+    quota = Quota(str(tmp_path / 'quota.sqlite'), daily = 6, reserve = 2)
+    api_auth = Harvest(access_token = 'secret', account_id = '1')
+
+    rf = ApolloCB(url = url, api_auth = api_auth, save = True, quota = quota, journal = Journal(str(tmp_path / 'journal')), workers = 1)
+
+    assert rf.remaining_quota == {'daily': 4}
+
+    a = rf.execute()
+
+    assert len(a) == local_server.hits == 4
+    #the requests already read when the quota ran out are not made
+    assert rf.stats.over_quota >= 1
+    assert rf.remaining_quota == {'daily': 0}
+    #the request refused is not journaled, so a run resumed once the quota resets makes it
+    assert len(rf.journal.load()) == 4
+
+    #other credentials have their own budget
+    other = ApolloCB(url = url, api_auth = Harvest(access_token = 'other', account_id = '1'), quota = quota)
+    assert other.remaining_quota == {'daily': 4}
+
+
+class CountingPolicy(asyncio.DefaultEventLoopPolicy):
+    """Counts the loops it creates."""
+
+    loops = 0
+
+    def new_event_loop(self):
+        CountingPolicy.loops += 1
+        return super().new_event_loop()
+
+
+@pytest.mark.client_builder
+@pytest.mark.event_loop
+@pytest.mark.parametrize('event_loop', ['default', 'auto', CountingPolicy()])
+def test_client_event_loop(local_server, event_loop):
+
+    url = Url(
+        path_format = local_server.url("/anything/{a}"),
+        a = list(range(5)),
+    )
+
+    loops = CountingPolicy.loops
+    rf = ApolloCB(url = url, save = True, event_loop = event_loop, api_rate_limit = RateLimit(rate = 1, limit = 100))
+
+    assert len(rf.execute()) == 5
+    assert len(list(rf.stream_sync())) == 5
+    if isinstance(event_loop, CountingPolicy):
+        assert CountingPolicy.loops == loops + 2
+
+
+@pytest.mark.client_builder
+@pytest.mark.event_loop
+def test_client_event_loop_validation():
+
+    with pytest.raises(ValueError):
+        ApolloCB(url = Url(path_format = "http://localhost/"), event_loop = 'trio')
+
+    try:
+        import uvloop
+    except ImportError:
+        with pytest.raises(ImportError):
+            ApolloCB(url = Url(path_format = "http://localhost/"), event_loop = 'uvloop')
+
+
+@pytest.mark.client_builder
+@pytest.mark.hedge
+def test_client_hedges_slow_calls(local_server):
+
+    url = Url(
+        path_format = local_server.url("/slow/1/{a}"),
+        a = list(range(4)),
+    )
+
+    rf = ApolloCB(url = url, save = True, hedge = Hedge(delay = 0.2, budget = 1), api_rate_limit = RateLimit(rate = 1, limit = 100))
+
+    start = time.monotonic()
+    a = rf.execute()
+
+    #every first call stalls, and its duplicate answers instead
+    assert time.monotonic() - start < 0.9
+    assert sorted(r.response.json['url'] for r in a) == [local_server.url(f"/slow/1/{n}") for n in range(4)]
+    assert rf.stats.hedged == rf.stats.hedges_won == 4
+
+    #POST is not hedged
+    local_server.reset()
+    rf = ApolloCB(url = url, method = 'POST', hedge = Hedge(delay = 0.2, budget = 1), api_rate_limit = RateLimit(rate = 1, limit = 100))
+
+    start = time.monotonic()
+    rf.execute()
+    assert time.monotonic() - start > 1
+    assert rf.stats.hedged == 0
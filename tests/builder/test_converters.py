@@ -86,4 +86,60 @@ def test_error_list_converter(case):
         )
         conv.static
         conv.dynamic
-        conv.delimiter
\ No newline at end of file
+        conv.delimiter
+
+@pytest.mark.lazy
+@pytest.mark.converters
+def test_lazy_converters():
+
+    conv = DictConverter(static = {'a': 1}, dynamic = {'b': range(3)})
+
+    assert len(conv) == 3
+    assert list(conv) == [{'b': 0, 'a': 1}, {'b': 1, 'a': 1}, {'b': 2, 'a': 1}]
+
+    conv = DictConverter(static = {'a': 1}, dynamic = {'b': (i for i in range(2))})
+
+    with pytest.raises(TypeError):
+        len(conv)
+    assert list(conv) == [{'b': 0, 'a': 1}, {'b': 1, 'a': 1}]
+
+    conv = ListConverter(static = 'a', dynamic = range(1, 3))
+
+    assert len(conv) == 2
+    assert list(conv) == ['a/1', 'a/2']
+    assert len(ListConverter(static = 'a')) == 1
+
+
+@pytest.mark.converters
+def test_dict_converter_shares_static():
+
+    static = {f'header_{n}': 'x' * 100 for n in range(100)}
+    rows = list(DictConverter(static = static, dynamic = {'id': range(3)}))
+
+    assert rows[0] == {'id': 0, **static}
+    assert rows[0].base is rows[2].base
+
+    rows[0]['id'] = 'a'
+    rows[0].update({'token': 't'})
+    del rows[0]['header_0']
+
+    assert rows[0] == {'id': 'a', 'token': 't', **{k: v for k, v in static.items() if k != 'header_0'}}
+    assert rows[1] == {'id': 1, **static}
+
+
+@pytest.mark.parametrize('expand,expected', [
+    ('zip', [{'a': 1, 'b': 'x', 's': 0}, {'a': 2, 'b': 'y', 's': 0}, {'a': 2, 'b': 'z', 's': 0}]),
+    ('product', [{'a': a, 'b': b, 's': 0} for a in (1, 2) for b in 'xyz']),
+])
+@pytest.mark.lazy
+@pytest.mark.converters
+def test_dict_converter_expand(expand, expected):
+
+    conv = DictConverter(static = {'s': 0}, dynamic = {'a': [1, 2], 'b': ('x', 'y', 'z')}, expand = expand)
+
+    assert len(conv) == len(expected)
+    assert list(conv) == expected
+    assert [conv[i] for i in range(len(conv))] == expected
+
+    with pytest.raises(ValueError):
+        DictConverter(dynamic = {'a': [1]}, expand = 'cross')
@@ -6,8 +6,11 @@ import pytest
 
 #local
 from apollo.request.attributes import Url
+from apollo.request.attributes import Param
 from apollo.request.factory import RequestFactory
 from apollo.request.api_request import APIRequest
+from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
 
 from tests.data.request_builder_data import REQUEST_BUILDER_SAFE_SCENARIOS
 from tests.data.request_builder_data import REQUEST_BUILDER_ERROR_SCENARIOS
@@ -74,3 +77,97 @@ def test_request_builder_error(case):
 
 
 
+
+@pytest.mark.lazy
+@pytest.mark.request_builder
+def test_request_builder_lazy():
+
+    built = []
+
+    def ids():
+        for i in range(3):
+            built.append(i)
+            yield i
+
+    url = Url(path_format = "http://localhost/{a}/{b}", a = range(10 ** 9), b = 'c')
+
+    assert len(url) == 10 ** 9
+    assert len(RequestFactory(url = url)) == 10 ** 9
+
+    rb = RequestFactory(url = Url(path_format = "http://localhost/{a}", a = ids()))
+    requests = iter(rb)
+
+    assert next(requests).url == "http://localhost/0"
+    assert built == [0]
+    assert [r.url for r in requests] == ["http://localhost/1", "http://localhost/2"]
+
+    with pytest.raises(TypeError):
+        len(RequestFactory(url = Url(path_format = "http://localhost/{a}", a = ids())))
+
+@pytest.mark.parametrize('path_format,path_args,compiled', [
+    ("http://localhost/{a}/{b}/{c}", dict(a = 'a', b = ['last', 'path'], c = ['it', 'is', 'x']), True),
+    ("http://localhost/{a:>05}/{b!r}/{{a}}/{a:>05}", dict(a = range(3), b = 'q'), True),
+    ("http://localhost/{a}", dict(a = [], b = 's'), True),
+    ("http://localhost/{b}", dict(a = range(3), b = 'z'), True),
+    ("http://localhost/{a}/{a!r}", dict(a = ['x', 'y']), False),
+    ("http://localhost/{a.real}", dict(a = [1, 2]), False),
+])
+@pytest.mark.request_builder
+def test_url_template(path_format, path_args, compiled):
+
+    keys = list(path_args)
+    columns = [v if isinstance(v, (list, range)) else [v] for v in path_args.values()]
+    expected = [path_format.format(**dict(zip(keys, b))) for b in zip_longest_ffill(*columns)]
+
+    url = Url(path_format = path_format, **path_args)
+
+    assert url.template.compiled == compiled
+    assert list(url) == expected
+    assert [url[i] for i in range(len(url))] == expected
+
+@pytest.mark.request_builder
+def test_request_builder_index():
+
+    url = Url(path_format = "http://localhost/{a}/{b}", a = range(10 ** 9), b = ['x', 'y'])
+    rb = RequestFactory(url = url, param = Param(static = {'s': 1}, dynamic = {'p': [1, 2, 3]}))
+    plan = list(RequestFactory(url = Url(path_format = "http://localhost/{a}/{b}", a = range(10), b = ['x', 'y']), param = rb.param))
+
+    assert rb[5].url == "http://localhost/5/y"
+    assert rb[5].param == {'p': 3, 's': 1}
+    assert rb[-1].url == f"http://localhost/{10 ** 9 - 1}/y"
+
+    with pytest.raises(IndexError):
+        rb[10 ** 9]
+
+    assert len(rb[10:20:3]) == 4
+    assert [r.url for r in rb[:10][1::4]] == [r.url for r in plan[1::4]]
+
+    shards = [rb[:10].shard(k, 3) for k in range(3)]
+    assert sorted(r.url for shard in shards for r in shard) == sorted(r.url for r in plan)
+    assert [r.param for r in shards[1]] == [r.param for r in plan[1::3]]
+
+    with pytest.raises(ValueError):
+        rb.shard(3, 3)
+
+@pytest.mark.lazy
+@pytest.mark.request_builder
+def test_request_builder_product():
+
+    url = Url(path_format = "http://localhost/{account}/{day}", expand = 'product', account = range(10 ** 4), day = range(10 ** 3))
+    param = Param(dynamic = {'page': range(1, 101)})
+    rb = RequestFactory(url = url, param = param, zip_type = zip_product)
+
+    assert len(url) == 10 ** 7
+    assert len(rb) == 10 ** 9
+    assert rb[123456789].url == "http://localhost/1234/567"
+    assert rb[123456789].param == {'page': 90}
+
+    small = RequestFactory(
+        url = Url(path_format = "http://localhost/{account}/{day}", expand = 'product', account = ['a', 'b'], day = (d for d in [1, 2])),
+        param = Param(dynamic = {'page': [1, 2]}),
+        zip_type = zip_product,
+    )
+    requests = [(r.url, r.param['page']) for r in small]
+
+    assert requests == [(f"http://localhost/{a}/{d}", p) for a in 'ab' for d in (1, 2) for p in (1, 2)]
+    assert [(r.url, r.param['page']) for r in rb[:3]] == [("http://localhost/0/0", p) for p in (1, 2, 3)]
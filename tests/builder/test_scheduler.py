@@ -0,0 +1,122 @@
+#standard
+import asyncio
+
+#third party
+import pytest
+
+#local
+from apollo.builder.scheduler import WorkerPool
+from apollo.builder.scheduler import PartitionedWorkerPool
+
+
+@pytest.mark.scheduler
+def test_worker_pool():
+
+    results = []
+    held = []
+    state = {'consumed': 0, 'completed': 0}
+
+    def items():
+        for n in range(50):
+            held.append(state['consumed'] - state['completed'])
+            state['consumed'] += 1
+            yield n
+
+    async def handler(item):
+        await asyncio.sleep(0.001)
+        state['completed'] += 1
+        return item * 2
+
+    async def on_result(result):
+        results.append(result)
+
+    pool = WorkerPool(handler = handler, workers = 3, on_result = on_result, maxsize = 2)
+
+    exception = asyncio.run(asyncio.wait_for(pool.run(items()), timeout = 5))
+
+    assert exception is None
+    assert pool.completed == 50
+    assert sorted(results) == [n * 2 for n in range(50)]
+    assert max(held) <= 3 + 2
+
+
+@pytest.mark.scheduler
+def test_worker_pool_stops_at_first_exception():
+
+    async def handler(item):
+        if item == 3:
+            raise KeyError(item)
+        await asyncio.sleep(0.001)
+        return item
+
+    pool = WorkerPool(handler = handler, workers = 2)
+
+    exception = asyncio.run(asyncio.wait_for(pool.run(range(1000)), timeout = 5))
+
+    assert isinstance(exception, KeyError)
+    assert pool.completed < 1000
+
+    with pytest.raises(ValueError):
+        WorkerPool(handler = handler, workers = 0)
+
+
+@pytest.mark.scheduler
+@pytest.mark.partition
+def test_partitioned_worker_pool():
+
+    slow = asyncio.Event()
+    in_flight = {'slow': 0, 'fast': 0}
+    most = {'slow': 0, 'fast': 0}
+
+    async def handler(item):
+        in_flight[item] += 1
+        most[item] = max(most[item], in_flight[item])
+        if item == 'slow':
+            await slow.wait()
+        else:
+            await asyncio.sleep(0.001)
+        in_flight[item] -= 1
+        return item
+
+    async def run():
+        completed = []
+
+        async def on_result(result):
+            completed.append(result)
+            if completed.count('fast') == 20:
+                slow.set()
+
+        pool = PartitionedWorkerPool(
+            handler = handler,
+            workers = lambda partition: 1 if partition == 'slow' else 3,
+            key = lambda item: item,
+            on_result = on_result,
+        )
+        exception = await pool.run(['slow', 'fast'] * 20)
+        return pool, exception, completed
+
+    pool, exception, completed = asyncio.run(asyncio.wait_for(run(), timeout = 5))
+
+    assert exception is None
+    assert pool.completed == 40
+    #the fast partition finished while the slow one was blocked
+    assert completed[:20] == ['fast'] * 20
+    assert most == {'slow': 1, 'fast': 3}
+
+
+@pytest.mark.scheduler
+@pytest.mark.partition
+def test_partitioned_worker_pool_stops_at_first_exception():
+
+    async def handler(item):
+        if item == 3:
+            raise KeyError(item)
+        await asyncio.sleep(0.001)
+        return item
+
+    pool = PartitionedWorkerPool(handler = handler, workers = lambda partition: 2, key = lambda item: item % 2)
+
+    exception = asyncio.run(asyncio.wait_for(pool.run(range(1000)), timeout = 5))
+
+    assert isinstance(exception, KeyError)
+    assert pool.completed < 1000
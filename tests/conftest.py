@@ -1,3 +1,9 @@
+#third party
+import pytest
+
+#local
+from tests.server import LocalServer
+
 groups = [
     'equest_builder_error',
     'auth',
@@ -19,10 +25,39 @@ groups = [
     'harvest,'
     'api',
     'rate_limit',
+    'connection_pool',
+    'scheduler',
+    'stream',
+    'storage',
+    'retry',
+    'adaptive',
+    'partition',
+    'cache',
+    'dedupe',
+    'journal',
+    'paginator',
+    'processes',
+    'quota',
+    'event_loop',
+    'hedge',
+    'timeout',
+    'lazy',
 ]
 
 def pytest_configure(config):
     for mark in groups:
         config.addinivalue_line(
             "markers", mark,
-        )
\ No newline at end of file
+        )
+
+@pytest.fixture(scope = 'session')
+def _local_server():
+    server = LocalServer()
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def local_server(_local_server):
+    _local_server.reset()
+    return _local_server
@@ -1,15 +1,20 @@
 #standard
 from pprint import pprint as p
+import asyncio
+import time
 import types
 
 #third party
 import pytest
+from aiohttp import ClientSession
 
 #local
 from apollo.request import Response
 from apollo.request import APIRequest
+from apollo.request.api_request import _UNREAD
 
 from apollo.utils.helpers import FilePattern
+from apollo.utils import Timeout
 
 from apollo.storage.base import StorageBase
 
@@ -41,3 +46,88 @@ def test_api_request():
     
     
 
+
+@pytest.mark.api_request
+def test_response_lazy_body():
+
+    resp = Response(byte_vals = b'{"a": [1, 2]}', encoding = 'utf-8')
+
+    #nothing is decoded until it is read
+    assert resp._text is _UNREAD and resp._json is _UNREAD
+    assert resp.json == {'a': [1, 2]}
+    assert resp.json is resp.json
+
+    resp.json['b'] = 3
+    assert resp.json == {'a': [1, 2], 'b': 3}
+    assert resp.text == '{"a": [1, 2]}'
+
+    html = Response(byte_vals = b'<html></html>', content_type = 'text/html')
+    assert html.text == '<html></html>'
+    with pytest.raises(ValueError):
+        html.json
+
+    assert Response(byte_vals = b'').json is None
+    assert Response().text is None
+    assert Response(json = {'a': 1}, text = 'a').json == {'a': 1}
+
+
+def test_api_request_fingerprint():
+
+    a = APIRequest(url = 'https://a.com', param = {'x': 1, 'y': 2}, data = {'d': [1, 2]})
+    b = APIRequest(url = 'https://a.com', param = {'y': 2, 'x': 1}, data = {'d': [1, 2]})
+
+    assert a.fingerprint == b.fingerprint
+    assert a.fingerprint != APIRequest(url = 'https://a.com', param = {'x': 1, 'y': 2}).fingerprint
+    assert a.fingerprint != APIRequest(url = 'https://a.com', method = 'POST', param = {'x': 1, 'y': 2}, data = {'d': [1, 2]}).fingerprint
+    assert a.cache_key == APIRequest(url = 'https://a.com', param = {'x': 1, 'y': 2}).cache_key
+
+
+def fetch(url, timeouts):
+    async def run():
+        async with ClientSession() as session:
+            for path in url if isinstance(url, list) else [url]:
+                await APIRequest(url = path, param = {}, header = {}).fetch(session, timeouts = timeouts)
+    return asyncio.run(run())
+
+
+@pytest.mark.api_request
+@pytest.mark.timeout
+def test_api_request_timeouts(local_server):
+
+    #the response headers take longer than first_byte
+    with pytest.raises(asyncio.TimeoutError):
+        fetch(local_server.url("/delay/1/a"), Timeout(first_byte = 0.2).timeouts())
+
+    #the whole call takes longer than total
+    with pytest.raises(asyncio.TimeoutError):
+        fetch(local_server.url("/delay/1/a"), Timeout(first_byte = None, total = 0.2).timeouts())
+
+    #a slow host has its own timeouts
+    fetch(local_server.url("/delay/0.5/a"), Timeout(first_byte = 0.2, hosts = {'127.0.0.1': Timeout(first_byte = 5)}).timeouts())
+
+    with pytest.raises(ValueError):
+        Timeout(connect = 0)
+
+
+@pytest.mark.api_request
+@pytest.mark.timeout
+def test_api_request_adaptive_timeouts(local_server):
+
+    timeouts = Timeout(adaptive = True, min_samples = 5, minimum = 0.1).timeouts()
+
+    assert timeouts.limits('127.0.0.1') == (10, 10, 60)
+
+    fetch([local_server.url(f"/anything/{n}") for n in range(5)], timeouts)
+
+    #a call far slower than the ones observed is cut short
+    limits = timeouts.limits('127.0.0.1')
+    assert limits.connect == 10
+    assert limits.first_byte == limits.total == 0.1
+
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        fetch(local_server.url("/delay/2/a"), timeouts)
+    assert time.monotonic() - start < 1
+
+    #other hosts keep the configured timeouts
+    assert timeouts.limits('localhost') == (10, 10, 60)
@@ -0,0 +1,84 @@
+#third party
+import pytest
+
+#local
+from apollo.request import APIRequest
+from apollo.request import Response
+from apollo.request import PageNumber
+from apollo.request import Offset
+from apollo.request import Cursor
+from apollo.request import Link
+from apollo.request.paginator import lookup
+
+
+def completed(body, status = 200, header = None, **kwargs):
+    request = APIRequest(url = 'https://a.com/items', **kwargs)
+    request.response = Response(status = status, byte_vals = body.encode(), header = header or {})
+    return request
+
+
+@pytest.mark.paginator
+def test_lookup():
+    body = {'a': {'b': [{'c': 1}]}}
+
+    assert lookup(body, 'a.b.0.c') == 1
+    assert lookup(body, 'a.x.c') is None
+    assert lookup(body, 'a.b.1') is None
+
+
+@pytest.mark.paginator
+def test_page_number():
+    paginator = PageNumber(total_pages = 'total_pages', fan_out = False)
+
+    next_page, = paginator.next_requests(completed('{"total_pages": 3}', param = {'page': 2, 'a': 1}))
+    assert next_page.param == {'page': 3, 'a': 1}
+    assert next_page.response.status is None
+    assert next_page.origin != next_page.fingerprint
+
+    assert paginator.next_requests(completed('{"total_pages": 3}', param = {'page': 3})) == []
+    assert paginator.next_requests(completed('{"total_pages": 3}', status = 500)) == []
+
+    #once the total is known the remaining pages are requested at once, and have no next pages of their own
+    paginator = PageNumber(total_pages = 'total_pages')
+    pages = paginator.next_requests(completed('{"total_pages": 4}'))
+    assert [p.param['page'] for p in pages] == [2, 3, 4]
+    assert {p.origin for p in pages} == {completed('{}').fingerprint}
+    assert paginator.next_requests(completed('{"total_pages": 4}', param = {'page': 2}, pagination = {'fanned': True})) == []
+    assert paginator.next_requests(completed('{"total_pages": 3}', status = 500)) == []
+
+    #without a total, pages are requested until one is empty
+    paginator = PageNumber(items = 'items')
+    assert paginator.next_requests(completed('{"items": [1]}'))[0].param == {'page': 2}
+    assert paginator.next_requests(completed('{"items": []}')) == []
+
+
+@pytest.mark.paginator
+def test_offset():
+    paginator = Offset(next_offset = 'next_start', more = 'more')
+
+    assert paginator.next_requests(completed('{"more": true, "next_start": 100}'))[0].param == {'start': 100}
+    assert paginator.next_requests(completed('{"more": false, "next_start": 100}')) == []
+
+    pages = Offset(next_offset = 'next_start', total = 'total').next_requests(completed('{"next_start": 2, "total": 7}'))
+    assert [p.param['start'] for p in pages] == [2, 4, 6]
+
+    paginator = Offset(items = 'data')
+    assert paginator.next_requests(completed('{"data": [1, 2]}', param = {'start': 2}))[0].param == {'start': 4}
+    assert paginator.next_requests(completed('{"data": []}')) == []
+
+
+@pytest.mark.paginator
+def test_cursor_and_link():
+    assert Cursor().next_requests(completed('{"next_cursor": "x"}'))[0].param == {'cursor': 'x'}
+    assert Cursor().next_requests(completed('{"next_cursor": null}')) == []
+
+    next_page, = Link(next = 'links.next').next_requests(
+        completed('{"links": {"next": "https://a.com/items?page=2"}}', param = {'page': 1, 'a': 1})
+    )
+    assert next_page.url == 'https://a.com/items?page=2'
+    #params in the next url are not sent twice
+    assert next_page.param == {'a': 1}
+
+    header = {'Link': '<https://a.com/items?page=9>; rel="last", <https://a.com/items?page=2>; rel="next"'}
+    assert Link().next_requests(completed('[]', header = header))[0].url == 'https://a.com/items?page=2'
+    assert Link().next_requests(completed('[]')) == []
@@ -0,0 +1,166 @@
+#standard
+import asyncio
+import threading
+
+#third party
+from aiohttp import web
+
+
+class LocalServer:
+    """httpbin-like server run on its own event loop and thread, so blocking calls such as
+    :meth:`~apollo.ApolloCB.execute` can be made against it from the tests."""
+
+    def __init__(self):
+        self.port = None
+        self.hits = 0
+        self.peers = set()
+        self.attempts = {}
+        self.active = 0
+        self.peak = 0
+        self._runner = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def url(self, path=''):
+        return f'http://127.0.0.1:{self.port}{path}'
+
+    def reset(self):
+        self.hits = 0
+        self.peers = set()
+        self.attempts = {}
+        self.peak = 0
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def build_app(self):
+        app = web.Application()
+        app.router.add_route('*', '/anything/{tail:.*}', self.anything)
+        app.router.add_get('/bytes/{size}', self.bytes)
+        app.router.add_get('/flaky/{failures}/{status}/{tail:.*}', self.flaky)
+        app.router.add_get('/etag/{tag}/{tail:.*}', self.etag)
+        app.router.add_get('/delay/{seconds}/{tail:.*}', self.delay)
+        app.router.add_route('*', '/slow/{seconds}/{tail:.*}', self.slow)
+        app.router.add_get('/pages/{total}', self.pages)
+        return app
+
+    def _record(self, request):
+        self.hits += 1
+        self.peers.add(request.transport.get_extra_info('peername'))
+
+    async def anything(self, request):
+        """Echoes the request."""
+
+        self._record(request)
+
+        return web.json_response({
+            'method': request.method,
+            'url': str(request.url),
+            'args': dict(request.query),
+            'headers': dict(request.headers),
+        })
+
+    async def bytes(self, request):
+        """Streams ``size`` bytes."""
+
+        self._record(request)
+
+        size = int(request.match_info['size'])
+        response = web.StreamResponse(headers = {'Content-Type': 'application/octet-stream'})
+        await response.prepare(request)
+        for start in range(0, size, 1000):
+            await response.write(bytes(n % 256 for n in range(start, min(start + 1000, size))))
+        await response.write_eof()
+        return response
+
+    async def flaky(self, request):
+        """Answers ``status`` with ``Retry-After: 0`` the first ``failures`` times a path is requested, then echoes."""
+
+        attempt = self.attempts[request.path] = self.attempts.get(request.path, 0) + 1
+
+        if attempt <= int(request.match_info['failures']):
+            self._record(request)
+            return web.Response(status = int(request.match_info['status']), headers = {'Retry-After': '0'})
+
+        return await self.anything(request)
+
+    async def etag(self, request):
+        """Echoes with ``ETag: tag``, or answers ``304 Not Modified`` if ``If-None-Match`` matches it."""
+
+        tag = f'"{request.match_info["tag"]}"'
+        if request.headers.get('If-None-Match') == tag:
+            self._record(request)
+            return web.Response(status = 304, headers = {'ETag': tag})
+
+        response = await self.anything(request)
+        response.headers['ETag'] = tag
+        return response
+
+    async def delay(self, request):
+        """Echoes after ``seconds``."""
+
+        await asyncio.sleep(float(request.match_info['seconds']))
+        return await self.anything(request)
+
+    async def slow(self, request):
+        """Echoes after ``seconds`` the first time a path is requested, then at once."""
+
+        attempt = self.attempts[request.path] = self.attempts.get(request.path, 0) + 1
+
+        if attempt == 1:
+            await asyncio.sleep(float(request.match_info['seconds']))
+
+        return await self.anything(request)
+
+    async def pages(self, request):
+        """Pages through ``total`` items by ``page``, ``start`` or ``cursor``, ``per_page`` at a time (default 2),
+        with the pagination fields of Harvest, Pipedrive, cursor and link APIs. Answers after ``delay`` seconds (default 0)
+        and records the most pages requested at one time in ``peak``."""
+
+        self._record(request)
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(float(request.query.get('delay', 0)))
+        finally:
+            self.active -= 1
+
+        total = int(request.match_info['total'])
+        per_page = int(request.query.get('per_page', 2))
+        page = int(request.query.get('page', 1))
+        if 'cursor' in request.query:
+            start = int(request.query['cursor'].lstrip('c'))
+        elif 'start' in request.query:
+            start = int(request.query['start'])
+        else:
+            start = (page - 1) * per_page
+        end = min(start + per_page, total)
+        more = end < total
+        next_url = str(request.url.update_query(page = page + 1)) if more else None
+
+        return web.json_response(
+            {
+                'items': list(range(start, end)),
+                'page': page,
+                'total_pages': -(-total // per_page),
+                'total_entries': total,
+                'links': {'next': next_url},
+                'next_cursor': f'c{end}' if more else None,
+                'additional_data': {'pagination': {'more_items_in_collection': more, 'next_start': end}},
+            },
+            headers = {'Link': f'<{next_url}>; rel="next"'} if more else {},
+        )
+
+    async def _start(self):
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
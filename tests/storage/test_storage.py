@@ -1 +1,39 @@
-#TODO
\ No newline at end of file
+#third party
+import pytest
+
+#local
+from apollo.storage import LocalStorage
+from apollo.storage.base import StorageBase
+
+
+@pytest.mark.storage
+def test_local_storage(tmp_path):
+
+    storage = LocalStorage(root = tmp_path)
+
+    storage.write(file_path = 'a/b.json', data = '{"a": 1}')
+    assert storage.read('a/b.json') == b'{"a": 1}'
+
+    with storage.stream_writer('c/d.bin') as writer:
+        writer.write(b'12')
+        writer.write(b'34')
+    assert storage.read('c/d.bin') == b'1234'
+
+
+@pytest.mark.storage
+def test_storage_base_stream_writer():
+
+    class MyStorage(StorageBase):
+        def __init__(self):
+            self.files = {}
+
+        def write(self, file_path, data):
+            self.files[file_path] = data
+
+    storage = MyStorage()
+
+    with storage.stream_writer('a') as writer:
+        writer.write(b'12')
+        writer.write(b'34')
+
+    assert storage.files == {'a': b'1234'}
@@ -0,0 +1,40 @@
+#third party
+import pytest
+
+#local
+from apollo.request import Response
+from apollo.utils import ResponseCache
+
+
+def response(body, **header):
+    return Response(status = 200, byte_vals = body, encoding = 'utf-8', content_type = 'application/json', header = header)
+
+
+@pytest.mark.cache
+def test_response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), max_size = 10)
+
+    #only responses with validators are stored
+    assert not cache.put('a', response(b'{}'))
+    assert cache.put('a', response(b'1234', ETag = '"a"'))
+    assert cache.put('b', response(b'1234', **{'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+
+    cached = cache.get('a')
+    assert cached.byte_vals == b'1234'
+    assert cached.header['etag'] == '"a"'
+    assert ResponseCache.validators(cached) == {'If-None-Match': '"a"'}
+    assert ResponseCache.validators(cache.get('b')) == {'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+    #the least recently used is evicted, bodies larger than the cache are not stored
+    cache.get('a')
+    assert cache.put('c', response(b'1234', ETag = '"c"'))
+    assert cache.get('b') is None
+    assert len(cache) == 2 and cache.size == 8
+    assert not cache.put('d', response(b'x' * 11, ETag = '"d"'))
+
+    #persisted on disk
+    cache.close()
+    assert ResponseCache(cache.path).get('c').byte_vals == b'1234'
+
+    with pytest.raises(ValueError):
+        ResponseCache(cache.path, max_size = 0)
@@ -1,7 +1,18 @@
+import asyncio
 import pytest
 from apollo.utils import FilePattern
 from apollo.utils import FilePath
 from apollo.utils import RateLimit
+from apollo.utils import ConnectionPool
+from apollo.utils import TokenBucket
+from apollo.utils import Retry
+from apollo.utils import AdaptiveConcurrency
+from apollo.utils import PartitionedRateLimit
+from apollo.utils import Hedge
+from apollo.builder.exceptions import WrongDataType
+from apollo.utils.helpers import zip_longest_ffill
+from apollo.utils.helpers import zip_product
+from apollo.utils.rate_limiter import AdaptiveLimiter
 from tests.data.utils_data import FILE_PATTERN_SCENARIOS
 
 @pytest.mark.parametrize('case',FILE_PATTERN_SCENARIOS)
@@ -17,9 +28,221 @@ def test_rate_limit():
 
     assert r.rate == 5
     assert r.limit == 5
+    assert r.burst == 5
+    assert r.concurrency == 5
+    assert r.bucket().interval == 1
 
     with pytest.raises(ValueError):
         f = RateLimit(
             rate = 0, 
             limit = 0
         )
+
+@pytest.mark.connection_pool
+def test_connection_pool():
+    pool = ConnectionPool(limit = 10, limit_per_host = 2)
+
+    assert pool.limit == 10
+    assert pool.limit_per_host == 2
+    assert pool.ttl_dns_cache == 10
+
+    with pytest.raises(ValueError):
+        ConnectionPool(limit = -1)
+
+@pytest.mark.rate_limit
+def test_token_bucket():
+    now = [0.0]
+    bucket = TokenBucket(rate = 2, per = 1, burst = 3, clock = lambda: now[0])
+
+    #burst
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    #then one token every half second
+    assert [bucket.reserve() for _ in range(2)] == [0.5, 1.0]
+
+    #tokens are refilled while idle, but never above the burst
+    now[0] = 10.0
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate = 0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate = 1, burst = 0)
+
+@pytest.mark.rate_limit
+def test_token_bucket_refunds_cancelled_waiters():
+    bucket = TokenBucket(rate = 10, per = 1, burst = 1)
+
+    async def run():
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        #the cancelled token is handed to the next caller
+        return bucket.reserve()
+
+    assert asyncio.run(run()) <= bucket.interval
+
+@pytest.mark.rate_limit
+def test_rate_limit_sub_second():
+    r = RateLimit(rate = 0.5, limit = 1)
+
+    assert r.bucket().interval == 0.5
+
+@pytest.mark.retry
+def test_retry():
+    r = Retry(backoff = 1, max_backoff = 3)
+
+    assert r.attempts == 3
+    assert 429 in r.statuses
+
+    for attempt in range(1, 6):
+        assert 0 <= r.delay(attempt) <= min(3, 2 ** (attempt - 1))
+
+    assert r.delay(1, retry_after = '7') == 7
+    assert r.delay(1, retry_after = 'Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert Retry.parse_retry_after('soon') is None
+    assert Retry(retry_after = False).delay(1, retry_after = '7') <= 0.5
+
+    with pytest.raises(ValueError):
+        Retry(attempts = 0)
+
+@pytest.mark.adaptive
+def test_adaptive_concurrency():
+    r = RateLimit(rate = 1, limit = 1000, concurrency = 4, adaptive = AdaptiveConcurrency(minimum = 2, maximum = 6))
+
+    assert r.max_concurrency == 6
+
+    async def run():
+        limiter = r.limiter()
+        assert isinstance(limiter, AdaptiveLimiter)
+        assert limiter.limit == 4
+
+        #additive increase after `limit` healthy calls, up to the maximum
+        for _ in range(4):
+            limiter.record(0.1, status = 200)
+        assert limiter.limit == 5
+        for _ in range(100):
+            limiter.record(0.1, status = 200)
+        assert limiter.limit == 6
+
+        #multiplicative decrease on throttling, errors and latency spikes, down to the minimum
+        limiter.record(0.1, status = 429)
+        assert limiter.limit == 3
+        limiter.record(0.1, error = True)
+        assert limiter.limit == 2
+        limiter.record(10, status = 200)
+        assert limiter.limit == 2
+
+        #calls beyond the limit wait for a slot
+        held = [await limiter.__aenter__() for _ in range(2)]
+        waiter = asyncio.ensure_future(limiter.__aenter__())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await limiter.__aexit__(None, None, None)
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(run())
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(minimum = 5, maximum = 2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(decrease = 1)
+
+
+@pytest.mark.rate_limit
+def test_shared_token_bucket():
+    r = RateLimit(rate = 1, limit = 10, burst = 1)
+    state = r.shared_state()
+
+    #buckets with the same state, e.g. in different processes, share one budget
+    a, b = r.bucket(state), r.bucket(state)
+
+    assert a.reserve() == 0
+    assert b.reserve() == pytest.approx(0.1, abs = 0.01)
+    b.refund()
+    assert a.reserve() == pytest.approx(0.1, abs = 0.01)
+
+
+@pytest.mark.rate_limit
+def test_rate_limit_shared_by_key(tmp_path):
+    r = RateLimit(rate = 1, limit = 10, burst = 1, key = 'test-api', directory = str(tmp_path))
+
+    #buckets created separately, e.g. by different ApolloCB processes on the host, share the file
+    a, b = r.bucket(), r.bucket()
+
+    assert r.path == str(tmp_path / 'apollo-rate-limit-test-api')
+    assert a.reserve() == 0
+    assert b.reserve() == pytest.approx(0.1, abs = 0.01)
+
+    other = RateLimit(rate = 1, limit = 10, burst = 1, key = 'other-api', directory = str(tmp_path))
+    assert other.bucket().reserve() == 0
+
+    with pytest.raises(ValueError):
+        RateLimit(key = '../etc')
+
+@pytest.mark.partition
+def test_partitioned_rate_limit_key_must_be_callable():
+
+    with pytest.raises(WrongDataType, match = 'str was given'):
+        PartitionedRateLimit(key = 'host')
+
+
+@pytest.mark.hedge
+def test_hedger_delay_and_budget():
+    hedger = Hedge(min_samples = 10).hedger()
+
+    #no duplicates until enough latencies are observed
+    assert hedger.delay is None
+    for n in range(1, 101):
+        hedger.latencies.observe(n / 1000)
+    assert hedger.delay == 0.096
+
+    async def call(seconds, error=None):
+        await asyncio.sleep(seconds)
+        if error:
+            raise error
+        return seconds
+
+    async def run(*calls):
+        calls = iter(calls)
+        return await hedger.fetch(lambda: next(calls))
+
+    hedger = Hedge(delay = 0.01, budget = 1).hedger()
+
+    #the duplicate answers first, and the original is cancelled
+    assert asyncio.run(run(call(5), call(0))) == 0
+    assert (hedger.calls, hedger.hedged, hedger.won) == (1, 1, 1)
+
+    #the original answers first
+    assert asyncio.run(run(call(0.05), call(5))) == 0.05
+    assert (hedger.calls, hedger.hedged, hedger.won) == (2, 2, 1)
+
+    #a failure waits for the other call, and both failing raises the first failure
+    assert asyncio.run(run(call(0.03, KeyError()), call(0.05))) == 0.05
+    with pytest.raises(ValueError):
+        asyncio.run(run(call(0.05, KeyError()), call(0.01, ValueError())))
+
+    #over budget, nothing is duplicated
+    hedger = Hedge(delay = 0.01, budget = 0.5).hedger()
+    assert asyncio.run(run(call(0.05), call(0))) == 0
+    assert asyncio.run(run(call(0.05))) == 0.05
+    assert (hedger.calls, hedger.hedged) == (2, 1)
+
+    with pytest.raises(ValueError):
+        Hedge(methods = ('POST',))
+
+
+def test_zip_longest_ffill():
+    assert list(zip_longest_ffill([1, 2], range(1, 4))) == [(1, 1), (2, 2), (2, 3)]
+    assert list(zip_longest_ffill([], [1, 2])) == [([], 1), ([], 2)]
+    assert list(zip_longest_ffill((i for i in range(2)), 'ab')) == [(0, 'a'), (1, 'b')]
+    assert list(zip_longest_ffill([], [])) == []
+
+
+def test_zip_product():
+    assert list(zip_product([1, 2], (c for c in 'ab'))) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+    assert list(zip_product([1, 2], [])) == []
+    assert list(zip_product(range(2))) == [(0,), (1,)]
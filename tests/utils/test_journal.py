@@ -0,0 +1,33 @@
+#third party
+import pytest
+
+#local
+from apollo.utils import Journal
+
+
+@pytest.mark.journal
+def test_journal(tmp_path):
+    journal = Journal(str(tmp_path / 'run.journal'))
+
+    assert journal.load() == set()
+
+    journal.open()
+    journal.record('a')
+    journal.record('b')
+    journal.close()
+
+    #a line cut short by a crash is ignored
+    with open(journal.path, 'a') as f:
+        f.write('c')
+
+    assert journal.load() == {'a', 'b'}
+
+    journal.open(resume = True)
+    journal.record('d')
+    journal.close()
+    assert 'd' in journal.load()
+
+    #not resuming empties the journal
+    journal.open()
+    journal.close()
+    assert journal.load() == set()
@@ -0,0 +1,85 @@
+#standard
+import asyncio
+import pickle
+import time
+from datetime import datetime
+from datetime import timezone
+
+#third party
+import pytest
+
+#local
+from apollo.auth import Harvest
+from apollo.builder.exceptions import QuotaExceeded
+from apollo.utils import Quota
+
+
+@pytest.mark.quota
+def test_quota(tmp_path):
+    quota = Quota(str(tmp_path / 'quota.sqlite'), daily = 3, monthly = 10, reserve = 1)
+
+    assert quota.remaining('a') == {'daily': 2, 'monthly': 9}
+
+    assert quota.charge('a') == 0
+    assert quota.charge('a') == 0
+    #the reserve is left unused, until the day ends
+    assert 0 < quota.charge('a') <= 24 * 60 * 60
+
+    assert quota.remaining('a') == {'daily': 0, 'monthly': 7}
+    assert quota.remaining('b') == {'daily': 2, 'monthly': 9}
+
+    with pytest.raises(QuotaExceeded):
+        asyncio.run(quota.acquire('a'))
+
+    #the ledger is shared through the file, also by other processes
+    other = pickle.loads(pickle.dumps(quota))
+    assert other.remaining('a') == {'daily': 0, 'monthly': 7}
+
+    with pytest.raises(ValueError):
+        Quota(str(tmp_path / 'quota.sqlite'))
+    with pytest.raises(ValueError):
+        Quota(str(tmp_path / 'quota.sqlite'), daily = 1, reserve = 1)
+
+
+@pytest.mark.quota
+def test_quota_windows_reset(tmp_path):
+    now = [datetime(2024, 12, 31, 23, 59, tzinfo = timezone.utc).timestamp()]
+    quota = Quota(str(tmp_path / 'quota.sqlite'), daily = 1, monthly = 2, clock = lambda: now[0])
+
+    assert quota.charge('a') == 0
+    assert quota.charge('a') == 60
+
+    #a new day and month
+    now[0] += 60
+    assert quota.remaining('a') == {'daily': 1, 'monthly': 2}
+    assert quota.charge('a') == 0
+
+    #the month is spent before the day
+    now[0] += 24 * 60 * 60
+    assert quota.charge('a') == 0
+    assert quota.charge('a') == 30 * 24 * 60 * 60
+
+
+@pytest.mark.quota
+def test_quota_pauses(tmp_path):
+    #a tenth of a second before midnight
+    midnight = -(-time.time() // 86400) * 86400
+    offset = midnight - time.time() - 0.1
+    quota = Quota(str(tmp_path / 'quota.sqlite'), daily = 1, pause = True, clock = lambda: time.time() + offset)
+
+    start = time.monotonic()
+    asyncio.run(quota.acquire('a'))
+    asyncio.run(quota.acquire('a'))
+
+    assert 0.05 < time.monotonic() - start < 1
+    assert quota.remaining('a') == {'daily': 0}
+
+
+@pytest.mark.quota
+@pytest.mark.auth
+def test_auth_identity():
+    harvest = Harvest(access_token = 'secret', account_id = '1')
+
+    assert harvest.identity == Harvest(access_token = 'secret', account_id = '1').identity
+    assert harvest.identity != Harvest(access_token = 'other', account_id = '1').identity
+    assert 'secret' not in harvest.identity